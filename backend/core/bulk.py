@@ -0,0 +1,235 @@
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from .models import Culture
+from .serializers import OWNED_CULTURES_ERROR, attach_date_estimates
+from .services.shared_content import sync_shared_entries
+
+# Rows per INSERT/UPDATE statement
+BULK_BATCH_SIZE = 500
+
+# Upper bound on items accepted by one bulk request
+BULK_MAX_ITEMS = 1000
+
+class BulkTrackingMixin:
+    """
+    Bulk endpoints for AbstractUserTrackingModel ViewSets at <prefix>/bulk/:
+
+        POST   [{...}, ...]             create rows
+        PATCH  [{"id": 1, ...}, ...]    partially update rows
+        DELETE {"ids": [1, 2, ...]}     delete rows
+
+    Row ownership and culture ownership are each checked in one query; rows
+    are written with bulk_create/bulk_update and culture links in batches,
+    all inside one transaction. A nested `date` (NestedDateEstimateMixin
+    serializers) is written with one bulk statement for all date rows. Bulk
+    through-table writes don't send m2m_changed, so the shared content index
+    is synced explicitly.
+    """
+
+    @action(detail=False, methods=["post", "patch", "delete"], url_path="bulk", permission_classes=[IsAuthenticated])
+    def bulk(self, request):
+        if request.method == "DELETE":
+            return self._bulk_delete(request)
+
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response({"error": "Expected a non-empty list."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > BULK_MAX_ITEMS:
+            return Response({"error": f"At most {BULK_MAX_ITEMS} items per request."}, status=status.HTTP_400_BAD_REQUEST)
+        if not all(isinstance(item, dict) for item in items):
+            return Response({"error": "Every item must be an object."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if request.method == "POST":
+            return self._bulk_create(request, items)
+        return self._bulk_update(request, items)
+
+    # -------------------------------------------------
+    # helpers
+    # -------------------------------------------------
+    def _bulk_model(self):
+        return self.get_serializer_class().Meta.model
+
+    def _split_cultures(self, request, items):
+        """
+        Pull culture_ids out of every item and check them all in one query.
+        Returns ({index: [culture ids]}, {index: errors}).
+        """
+        cultures, errors = {}, {}
+        for index, item in enumerate(items):
+            if "culture_ids" not in item:
+                continue
+            ids = item["culture_ids"]
+            if not isinstance(ids, list) or not all(isinstance(pk, int) for pk in ids):
+                errors[index] = {"culture_ids": ["Expected a list of culture ids."]}
+            else:
+                cultures[index] = list(dict.fromkeys(ids))
+
+        requested = {pk for ids in cultures.values() for pk in ids}
+        owned = set(Culture.objects.filter(user=request.user, id__in=requested).values_list("id", flat=True))
+        for index, ids in cultures.items():
+            if not owned.issuperset(ids):
+                errors[index] = {"culture_ids": [OWNED_CULTURES_ERROR]}
+        return cultures, errors
+
+    def _date_field(self):
+        return getattr(self.get_serializer_class(), "date_field", None)
+
+    def _validate(self, data, instance=None):
+        """Validate one item (without culture_ids); returns (validated_data, errors)."""
+        serializer = self.get_serializer(instance, data=data, partial=instance is not None)
+        nested = [
+            name for name, field in serializer.fields.items()
+            if name in data and isinstance(field, serializers.BaseSerializer) and not field.read_only
+            and name != self._date_field()
+        ]
+        if nested:
+            return None, {name: ["Not supported by bulk endpoints."] for name in nested}
+        if not serializer.is_valid():
+            return None, serializer.errors
+        return serializer.validated_data, None
+
+    def _set_cultures(self, model, pks, cultures_by_pk, replace):
+        through = model.cultures.through
+        source = f"{model._meta.model_name}_id"
+        if replace:
+            through.objects.filter(**{f"{source}__in": pks}).delete()
+        through.objects.bulk_create(
+            [through(**{source: pk, "culture_id": culture_id}) for pk, ids in cultures_by_pk.items() for culture_id in ids],
+            batch_size=BULK_BATCH_SIZE,
+        )
+        sync_shared_entries(model, pks)
+
+    def _fill_derived(self, objs):
+        """
+        Recompute columns a model derives in save() (`derived_fields`), which
+        bulk writes skip. Returns the names of the derived columns.
+        """
+        derived = getattr(self._bulk_model(), "derived_fields", ())
+        if derived:
+            for obj in objs:
+                obj.fill_derived_fields()
+        return derived
+
+    def _bulk_touched(self, pks):
+        """
+        Called inside the bulk transaction with the pks of created or updated
+        rows (updates call it before and after the write). ViewSets that keep
+        data derived from their rows override it, since bulk writes send no
+        save/m2m signals. Bulk deletes go through QuerySet.delete(), which does.
+        """
+
+    def _bulk_response(self, model, pks, status_code):
+        rendered = self.get_serializer_class().Meta.fields
+        related = [f.name for f in model._meta.concrete_fields if f.is_relation and f.name in rendered]
+        qs = model.objects.filter(pk__in=pks).select_related(*related).prefetch_related("cultures")
+        if hasattr(qs, "for_serializer"):
+            qs = qs.for_serializer(self.get_serializer_class())
+        by_pk = {obj.pk: obj for obj in qs}
+        serializer = self.get_serializer([by_pk[pk] for pk in pks if pk in by_pk], many=True)
+        return Response(serializer.data, status=status_code)
+
+    # -------------------------------------------------
+    # operations
+    # -------------------------------------------------
+    def _bulk_create(self, request, items):
+        model = self._bulk_model()
+        date_field = self._date_field()
+        cultures, errors = self._split_cultures(request, items)
+
+        objs, dates = [], []
+        for index, item in enumerate(items):
+            data = {k: v for k, v in item.items() if k not in ("id", "culture_ids")}
+            validated, item_errors = self._validate(data)
+            if item_errors:
+                errors.setdefault(index, {}).update(item_errors)
+            elif index not in errors:
+                dates.append(validated.pop(date_field, None) if date_field else None)
+                objs.append((index, model(user=request.user, **validated)))
+
+        if errors:
+            return Response({"errors": [errors.get(i, {}) for i in range(len(items))]}, status=status.HTTP_400_BAD_REQUEST)
+
+        self._fill_derived([obj for _, obj in objs])
+        with transaction.atomic():
+            if date_field:
+                # Date rows first, so owners are inserted with date_id already set
+                attach_date_estimates([obj for _, obj in objs], dates, date_field)
+            model.objects.bulk_create([obj for _, obj in objs], batch_size=BULK_BATCH_SIZE)
+            created = {obj.pk: cultures[index] for index, obj in objs if cultures.get(index)}
+            if created:
+                self._set_cultures(model, list(created), created, replace=False)
+            self._bulk_touched([obj.pk for _, obj in objs])
+
+        return self._bulk_response(model, [obj.pk for _, obj in objs], status.HTTP_201_CREATED)
+
+    def _bulk_update(self, request, items):
+        model = self._bulk_model()
+        pks = [item.get("id") for item in items]
+        if not all(isinstance(pk, int) for pk in pks):
+            return Response({"error": "Every item needs an integer 'id'."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(set(pks)) != len(pks):
+            return Response({"error": "Duplicate ids."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # _base_manager: load deferred heavy columns too, bulk_update writes them back
+        date_field = self._date_field()
+        rows = model._base_manager.filter(user=request.user, pk__in=pks)
+        if date_field:
+            rows = rows.select_related(date_field)
+        instances = rows.in_bulk()
+        missing = [pk for pk in pks if pk not in instances]
+        if missing:
+            return Response({"error": "Not found.", "ids": missing}, status=status.HTTP_404_NOT_FOUND)
+
+        cultures, errors = self._split_cultures(request, items)
+
+        fields, dates = set(), {}
+        for index, item in enumerate(items):
+            data = {k: v for k, v in item.items() if k not in ("id", "culture_ids")}
+            validated, item_errors = self._validate(data, instances[pks[index]])
+            if item_errors:
+                errors.setdefault(index, {}).update(item_errors)
+            elif index not in errors:
+                if date_field and date_field in validated:
+                    dates[pks[index]] = validated.pop(date_field)
+                for attr, value in validated.items():
+                    setattr(instances[pks[index]], attr, value)
+                    fields.add(attr)
+
+        if errors:
+            return Response({"errors": [errors.get(i, {}) for i in range(len(items))]}, status=status.HTTP_400_BAD_REQUEST)
+
+        now = timezone.now()
+        for obj in instances.values():
+            # bulk_update skips auto_now
+            obj.updated_at = now
+        fields.update(self._fill_derived(instances.values()))
+
+        with transaction.atomic():
+            # Once with the old cultures, once with the new ones
+            self._bulk_touched(pks)
+            if dates:
+                # Existing date rows are updated in place; owners without one get a new row
+                owners = [instances[pk] for pk in dates]
+                if attach_date_estimates(owners, list(dates.values()), date_field):
+                    fields.add(date_field)
+            model.objects.bulk_update(list(instances.values()), [*fields, "updated_at"], batch_size=BULK_BATCH_SIZE)
+            changed = {pks[index]: ids for index, ids in cultures.items()}
+            if changed:
+                self._set_cultures(model, list(changed), changed, replace=True)
+            self._bulk_touched(pks)
+
+        return self._bulk_response(model, pks, status.HTTP_200_OK)
+
+    def _bulk_delete(self, request):
+        pks = request.data.get("ids") if isinstance(request.data, dict) else None
+        if not isinstance(pks, list) or not pks or not all(isinstance(pk, int) for pk in pks):
+            return Response({"error": "Expected {\"ids\": [...]}."}, status=status.HTTP_400_BAD_REQUEST)
+
+        model = self._bulk_model()
+        with transaction.atomic():
+            _, per_model = model.objects.filter(user=request.user, pk__in=pks).delete()
+        return Response({"deleted": per_model.get(model._meta.label, 0)}, status=status.HTTP_200_OK)
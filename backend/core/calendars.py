@@ -0,0 +1,136 @@
+import datetime
+from functools import lru_cache
+
+# Julian Day Number of 0001-01-01 minus its proleptic Gregorian ordinal
+_ORDINAL_TO_JDN = 1721425
+
+# 1 Thoth, year 1 of the Era of Nabonassar (26 February 747 BC, Julian)
+EGYPTIAN_EPOCH = 1448638
+
+# 1 Muharram AH 1 of the tabular (civil) Islamic calendar
+ISLAMIC_EPOCH = 1948440
+
+
+def to_jdn(value: datetime.date) -> int:
+    return value.toordinal() + _ORDINAL_TO_JDN
+
+
+def from_jdn(jdn: int) -> datetime.date:
+    return datetime.date.fromordinal(jdn - _ORDINAL_TO_JDN)
+
+
+def month_day_key(value: datetime.date) -> int:
+    """Day-of-year key MMDD (e.g. 1231), comparable across years."""
+    return value.month * 100 + value.day
+
+
+def year_jdns(year: int) -> tuple[int, int]:
+    """First and last JDN of a Gregorian year."""
+    return to_jdn(datetime.date(year, 1, 1)), to_jdn(datetime.date(year, 12, 31))
+
+
+# -------------------------------------------------
+# EGYPTIAN CIVIL CALENDAR (12 x 30 days + 5 epagomenal days, no leap years)
+# -------------------------------------------------
+def egyptian_from_jdn(jdn: int) -> tuple[int, int, int]:
+    """(year, month, day); month 13 holds the five epagomenal days."""
+    days = jdn - EGYPTIAN_EPOCH
+    year, day_of_year = divmod(days, 365)
+    return year + 1, day_of_year // 30 + 1, day_of_year % 30 + 1
+
+
+def egyptian_occurrences(month: int, day: int, year: int) -> list[int]:
+    """JDNs of Egyptian month/day in Gregorian `year` (one, or two when a 365-day
+    Egyptian year starts and ends inside it)."""
+    first, last = year_jdns(year)
+    jdn = first + (EGYPTIAN_EPOCH + (month - 1) * 30 + day - 1 - first) % 365
+    found = []
+    while jdn <= last:
+        found.append(jdn)
+        jdn += 365
+    return found
+
+
+# -------------------------------------------------
+# TABULAR ISLAMIC CALENDAR (30-year cycle, leap years 2, 5, 7, 10, 13, 16, 18, 21, 24, 26, 29)
+# -------------------------------------------------
+def _islamic_new_year(year: int) -> int:
+    return ISLAMIC_EPOCH + (year - 1) * 354 + (3 + 11 * year) // 30
+
+
+def _islamic_month_start(year: int, month: int) -> int:
+    return _islamic_new_year(year) + (59 * (month - 1) + 1) // 2
+
+
+def _islamic_month_length(year: int, month: int) -> int:
+    if month == 12:
+        return 30 if (14 + 11 * year) % 30 < 11 else 29
+    return 30 if month % 2 else 29
+
+
+def islamic_from_jdn(jdn: int) -> tuple[int, int, int]:
+    year = (30 * (jdn - ISLAMIC_EPOCH) + 10646) // 10631
+    month = 12
+    while month > 1 and _islamic_month_start(year, month) > jdn:
+        month -= 1
+    return year, month, jdn - _islamic_month_start(year, month) + 1
+
+
+@lru_cache(maxsize=512)
+def islamic_months(year: int) -> tuple[tuple[int, int, int, int], ...]:
+    """
+    Conversion table of one Gregorian year: (first JDN, length, Islamic year,
+    month) of every Islamic month that overlaps it.
+    """
+    first, last = year_jdns(year)
+    islamic_year, month, _ = islamic_from_jdn(first)
+    months = []
+    while True:
+        start = _islamic_month_start(islamic_year, month)
+        if start > last:
+            break
+        months.append((start, _islamic_month_length(islamic_year, month), islamic_year, month))
+        islamic_year, month = (islamic_year + 1, 1) if month == 12 else (islamic_year, month + 1)
+    return tuple(months)
+
+
+def islamic_occurrences(month: int, day: int, year: int) -> list[int]:
+    """JDNs of Islamic month/day in Gregorian `year`; day 30 falls on day 29 of
+    short months. The Islamic year is 11 days shorter, so a date can occur twice."""
+    first, last = year_jdns(year)
+    return [
+        jdn
+        for start, length, _, islamic_month in islamic_months(year)
+        if islamic_month == month and first <= (jdn := start + min(day, length) - 1) <= last
+    ]
+
+
+# -------------------------------------------------
+# RECURRENCE
+# -------------------------------------------------
+def annual_dates(anchor: datetime.date, reference_system: str, year: int) -> list[datetime.date]:
+    """
+    Gregorian dates in `year` on which an annual date recurs. `anchor` is one
+    known (Gregorian) occurrence; it recurs on the same day of its own
+    calendar. 29 February falls on 28 February in common years.
+    """
+    if reference_system == "islamic":
+        _, month, day = islamic_from_jdn(to_jdn(anchor))
+        return [from_jdn(jdn) for jdn in islamic_occurrences(month, day, year)]
+    if reference_system == "egyptian":
+        _, month, day = egyptian_from_jdn(to_jdn(anchor))
+        return [from_jdn(jdn) for jdn in egyptian_occurrences(month, day, year)]
+    try:
+        return [anchor.replace(year=year)]
+    except ValueError:
+        return [datetime.date(year, 2, 28)]
+
+
+def occurrence_dates(calendar_date: datetime.date | None, is_annual: bool, reference_system: str,
+                     year: int) -> list[datetime.date]:
+    """Dates in Gregorian `year` on which a CalendarDate falls."""
+    if calendar_date is None:
+        return []
+    if not is_annual:
+        return [calendar_date] if calendar_date.year == year else []
+    return annual_dates(calendar_date, reference_system, year)
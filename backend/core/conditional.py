@@ -0,0 +1,74 @@
+import hashlib
+from django.db.models import Count, Max
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def make_etag(*parts) -> str:
+    """Build a weak ETag from any reprable validator parts."""
+    return 'W/"%s"' % hashlib.md5(repr(parts).encode()).hexdigest()
+
+
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(request, etag: str) -> bool:
+    """Weak comparison of `etag` against the request's If-None-Match."""
+    header = request.headers.get("If-None-Match")
+    if not header or not etag:
+        return False
+    candidates = parse_etags(header)
+    return "*" in candidates or _opaque(etag) in {_opaque(c) for c in candidates}
+
+
+def validator_headers(etag: str) -> dict:
+    # Payloads depend on the authenticated user, so keep them out of shared caches
+    return {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Authorization"}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag))
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET support for ModelViewSets over TimestampedModel rows.
+
+    list() derives its validator from MAX(updated_at) and COUNT(*) of the
+    filtered queryset, retrieve() from the object's own updated_at. Both
+    answer 304 before any serialization happens when If-None-Match matches.
+    """
+
+    def get_list_etag(self, request, queryset):
+        if not hasattr(queryset.model, "updated_at"):
+            return None
+        stats = queryset.aggregate(latest=Max("updated_at"), count=Count("pk"))
+        return make_etag(request.user.pk, request.get_full_path(), stats["latest"], stats["count"])
+
+    def get_object_etag(self, request, instance):
+        updated_at = getattr(instance, "updated_at", None)
+        if updated_at is None:
+            return None
+        return make_etag(request.user.pk, request.get_full_path(), type(instance).__name__, instance.pk, updated_at)
+
+    def list(self, request, *args, **kwargs):
+        etag = self.get_list_etag(request, self.filter_queryset(self.get_queryset()))
+        if etag and etag_matches(request, etag):
+            return not_modified(etag)
+
+        response = super().list(request, *args, **kwargs)
+        if etag and response.status_code == status.HTTP_200_OK:
+            for header, value in validator_headers(etag).items():
+                response[header] = value
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag = self.get_object_etag(request, instance)
+        if etag and etag_matches(request, etag):
+            return not_modified(etag)
+
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data, headers=validator_headers(etag) if etag else None)
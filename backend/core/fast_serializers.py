@@ -0,0 +1,85 @@
+from rest_framework.response import Response
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+def _nested_id(value):
+    return {"id": value} if value is not None else None
+
+
+class FastSerializer:
+    """
+    Read-only projection that renders rows fetched with .values_list()
+    straight into dicts, bypassing DRF field machinery. Output matches the
+    simple serializer it mirrors key for key.
+
+    `fields` is a sequence of (output key, model column, converter or None).
+    """
+
+    def __init__(self, fields):
+        self.keys = tuple(key for key, _, _ in fields)
+        self.columns = tuple(column for _, column, _ in fields)
+        self.converters = tuple((key, convert) for key, _, convert in fields if convert)
+
+    def render(self, values: tuple) -> dict:
+        row = dict(zip(self.keys, values))
+        for key, convert in self.converters:
+            row[key] = convert(row[key])
+        return row
+
+    def rows(self, qs) -> list[dict]:
+        """Fetch only the needed columns of `qs` and render every row."""
+        render = self.render
+        return [render(values) for values in qs.values_list(*self.columns)]
+
+
+# Mirrors FilmSimpleSerializer
+FILM_SIMPLE = FastSerializer([
+    ("id", "id", None),
+    ("universal_item", "universal_item_id", _nested_id),
+    ("title", "title", None),
+    ("creator_string", "creator_string", None),
+    ("release_date", "release_date", _isoformat),
+    ("poster", "poster", None),
+])
+
+# Mirrors BookSimpleSerializer
+BOOK_SIMPLE = FastSerializer([
+    ("id", "id", None),
+    ("universal_item", "universal_item_id", _nested_id),
+    ("title", "title", None),
+    ("creator_string", "creator_string", None),
+    ("date", "date_id", None),
+    ("cover", "cover", None),
+])
+
+
+# Per-user tracking columns merged into simple film/book rows
+USERFILM_OVERLAY = ("poster", "background_pic", "seen", "favourite", "watchlist", "id", "date_watched")
+USERBOOK_OVERLAY = ("cover", "read", "favourite", "readlist", "id", "date_finished")
+
+
+def universal_item_id(row: dict):
+    return row["universal_item"]["id"] if row["universal_item"] else None
+
+
+def overlays(qs, fields) -> list[tuple[int, dict]]:
+    """(universal_item_id, {field: value}) for every UserFilm/UserBook row in `qs`."""
+    return [(values[0], dict(zip(fields, values[1:]))) for values in qs.values_list("universal_item_id", *fields)]
+
+
+def attach_overlays(rows: list[dict], key: str, overlay_by_item: dict) -> list[dict]:
+    """Set rows[i][key] to the overlay of the row's universal item (or None)."""
+    for row in rows:
+        row[key] = overlay_by_item.get(universal_item_id(row))
+    return rows
+
+
+class FastListMixin:
+    """Render list() through `fast_serializer` instead of serializer_class."""
+    fast_serializer: FastSerializer
+
+    def list(self, request, *args, **kwargs):
+        return Response(self.fast_serializer.rows(self.filter_queryset(self.get_queryset())))
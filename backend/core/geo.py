@@ -0,0 +1,158 @@
+import math
+from django.db.models import Q
+
+# Characters stored per MapPin.geohash (~5 m cells)
+GEOHASH_PRECISION = 9
+
+# Most geohash prefixes a bounding box query is split into
+MAX_COVER_CELLS = 32
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode_geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Standard base32 geohash of a point."""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        span = lng_range if even else lat_range
+        mid = (span[0] + span[1]) / 2
+        point = lng if even else lat
+        value <<= 1
+        if point >= mid:
+            value |= 1
+            span[0] = mid
+        else:
+            span[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits, value = 0, 0
+    return "".join(chars)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """(lat, lng) size in degrees of a geohash cell."""
+    lng_bits = math.ceil(5 * precision / 2)
+    lat_bits = 5 * precision - lng_bits
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+
+def coordinates(loc) -> tuple[float, float] | None:
+    """(lat, lng) from a MapPin.loc value ({"lat": .., "lng": ..}), or None."""
+    if not isinstance(loc, dict):
+        return None
+    try:
+        lat, lng = float(loc["lat"]), float(loc.get("lng", loc.get("lon")))
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        return None
+    return lat, lng
+
+
+def parse_bbox(value: str) -> tuple[float, float, float, float]:
+    """
+    Parse "west,south,east,north" (degrees). west > east means the box
+    crosses the antimeridian. Raises ValueError on malformed input.
+    """
+    parts = value.split(",")
+    if len(parts) != 4:
+        raise ValueError("bbox must be 'west,south,east,north'")
+    west, south, east, north = (float(part) for part in parts)
+    if not (-180 <= west <= 180 and -180 <= east <= 180 and -90 <= south <= north <= 90):
+        raise ValueError("bbox is out of range")
+    return west, south, east, north
+
+
+def zoom_precision(zoom: int) -> int:
+    """Geohash precision whose cells are about one web map tile wide at `zoom`."""
+    return max(1, min(GEOHASH_PRECISION, (2 * zoom) // 5 + 1))
+
+
+def _cover(west, south, east, north, precision):
+    dlat, dlng = cell_size(precision)
+    cells = set()
+    lat = (math.floor((south + 90) / dlat) + 0.5) * dlat - 90
+    while lat - dlat / 2 <= north and lat < 90:
+        lng = (math.floor((west + 180) / dlng) + 0.5) * dlng - 180
+        while lng - dlng / 2 <= east and lng < 180:
+            cells.add(encode_geohash(lat, lng, precision))
+            if len(cells) > MAX_COVER_CELLS:
+                return None
+            lng += dlng
+        lat += dlat
+    return cells
+
+
+def _boxes(west, south, east, north):
+    if west <= east:
+        return [(west, south, east, north)]
+    return [(west, south, 180.0, north), (-180.0, south, east, north)]
+
+
+def bbox_cover(bbox, precision: int) -> set[str]:
+    """
+    Geohash prefixes covering `bbox`, at `precision` or coarser: precision is
+    lowered until the box fits in MAX_COVER_CELLS cells.
+    """
+    for p in range(precision, 0, -1):
+        cells = set()
+        for box in _boxes(*bbox):
+            found = _cover(*box, p)
+            if found is None:
+                break
+            cells |= found
+        else:
+            if len(cells) <= MAX_COVER_CELLS:
+                return cells
+    return set(_BASE32)
+
+
+def bbox_filter(bbox, zoom: int | None = None) -> Q:
+    """
+    Q selecting rows with lat/lng/geohash columns inside `bbox`. The geohash
+    prefixes are index range scans; the lat/lng test trims the cell edges.
+    """
+    west, south, east, north = bbox
+    within = Q(lat__gte=south, lat__lte=north)
+    if west <= east:
+        within &= Q(lng__gte=west, lng__lte=east)
+    else:
+        within &= Q(lng__gte=west) | Q(lng__lte=east)
+
+    prefixes = Q()
+    for prefix in sorted(bbox_cover(bbox, zoom_precision(zoom) if zoom is not None else GEOHASH_PRECISION)):
+        prefixes |= Q(geohash__startswith=prefix)
+    return prefixes & within
+
+
+# -------------------------------------------------
+# WEB MAP TILES (z/x/y, spherical mercator)
+# -------------------------------------------------
+MAX_TILE_ZOOM = 18
+
+_MAX_MERCATOR_LAT = 85.0511287798
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """(west, south, east, north) of tile z/x/y."""
+    n = 2 ** z
+
+    def lat(row):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    # Edge rows reach the poles so points beyond the mercator limit are kept
+    south = -90.0 if y == n - 1 else lat(y + 1)
+    north = 90.0 if y == 0 else lat(y)
+    return x / n * 360 - 180, south, (x + 1) / n * 360 - 180, north
+
+
+def point_tile(lat: float, lng: float, z: int) -> tuple[int, int]:
+    """(x, y) of the tile containing a point at zoom `z`."""
+    n = 2 ** z
+    lat = max(-_MAX_MERCATOR_LAT, min(_MAX_MERCATOR_LAT, lat))
+    x = int((lng + 180) / 360 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n)
+    return min(x, n - 1), min(y, n - 1)
@@ -0,0 +1,72 @@
+import time
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand
+from ...fast_serializers import BOOK_SIMPLE, FILM_SIMPLE
+from ...models import Book, Film, UniversalItem
+from ...serializers import BookSimpleSerializer, FilmSimpleSerializer
+
+SHAPES = {
+    "film": (Film, FilmSimpleSerializer, FILM_SIMPLE),
+    "book": (Book, BookSimpleSerializer, BOOK_SIMPLE),
+}
+
+
+class Command(BaseCommand):
+    help = 'Compare per-row DRF, many=True and fast-path serialization of simple film/book rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Number of rows to serialize')
+        parser.add_argument('--shape', choices=sorted(SHAPES), default='film')
+        parser.add_argument('--repeat', type=int, default=3, help='Best of N runs')
+        parser.add_argument('--from-db', action='store_true',
+                            help='Serialize the first --rows database rows (includes query time) instead of in-memory rows')
+
+    def handle(self, *args, **options):
+        model, serializer_class, fast = SHAPES[options['shape']]
+        rows = options['rows']
+
+        if options['from_db']:
+            qs = model.objects.order_by('id')[:rows]
+            instances = lambda: list(qs.select_related('universal_item'))
+            values = lambda: qs
+        else:
+            # Unsaved instances and matching value tuples: measures serialization only
+            objects = [self._make(model, i) for i in range(rows)]
+            tuples = [tuple(getattr(obj, column) for column in fast.columns) for obj in objects]
+            instances = lambda: objects
+            values = lambda: _Prefetched(tuples)
+
+        cases = {
+            'drf per-row': lambda: [serializer_class(obj).data for obj in instances()],
+            'drf many=True': lambda: serializer_class(instances(), many=True).data,
+            'fast path': lambda: fast.rows(values()),
+        }
+
+        self.stdout.write(f"{options['shape']}: {rows} rows, best of {options['repeat']}")
+        baseline = None
+        for name, run in cases.items():
+            best = min(self._time(run) for _ in range(options['repeat']))
+            baseline = baseline or best
+            self.stdout.write(f"  {name:<14} {best * 1000:9.1f} ms  {baseline / best:6.1f}x")
+
+    def _time(self, run):
+        start = time.perf_counter()
+        run()
+        return time.perf_counter() - start
+
+    def _make(self, model, i):
+        if model is Film:
+            return Film(id=i + 1, universal_item=UniversalItem(id=i + 1), title=f"Film {i}", creator_string="Director",
+                        release_date=date(1950, 1, 1) + timedelta(days=i), poster="https://example.com/p.jpg")
+        return Book(id=i + 1, universal_item=UniversalItem(id=i + 1), title=f"Book {i}", creator_string="Author",
+                    date_id=None, cover="https://example.com/c.jpg")
+
+
+class _Prefetched:
+    """Stands in for a queryset whose values_list() rows are already in memory."""
+
+    def __init__(self, tuples):
+        self.tuples = tuples
+
+    def values_list(self, *columns):
+        return self.tuples
@@ -0,0 +1,50 @@
+import sys
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from ...services.library_export import EXPORT_TYPES, gzip_stream, iter_csv, iter_ndjson
+
+
+class Command(BaseCommand):
+    help = "Export a user's library (films, books, music, recipes, calendar dates, map pins) as NDJSON or CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument('username', type=str, help='User whose library is exported')
+        parser.add_argument('--output', choices=['ndjson', 'csv'], default='ndjson')
+        parser.add_argument('--types', type=str, default='',
+                            help=f"Comma-separated subset of: {', '.join(EXPORT_TYPES)} (CSV takes exactly one)")
+        parser.add_argument('--file', type=str, default=None, help='Write to this path instead of stdout')
+        parser.add_argument('--gzip', action='store_true', help='Gzip-compress the output')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['username']}' does not exist")
+
+        types = [t for t in options['types'].split(',') if t] or list(EXPORT_TYPES)
+        unknown = [t for t in types if t not in EXPORT_TYPES]
+        if unknown:
+            raise CommandError(f"Unknown export types: {', '.join(unknown)}")
+
+        if options['output'] == 'csv':
+            if len(types) != 1:
+                raise CommandError("CSV exports take exactly one type")
+            chunks = iter_csv(user, types[0])
+        else:
+            chunks = iter_ndjson(user, types)
+
+        if options['gzip']:
+            chunks = gzip_stream(chunks)
+
+        written = 0
+        target = open(options['file'], 'wb') if options['file'] else sys.stdout.buffer
+        try:
+            for chunk in chunks:
+                target.write(chunk)
+                written += len(chunk)
+        finally:
+            if options['file']:
+                target.close()
+
+        if options['file']:
+            self.stdout.write(self.style.SUCCESS(f"Exported {written} bytes to {options['file']}"))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+from ...services.entity_resolution import CREATOR_MODELS, RESOLUTION_BATCH_SIZE, link_creators
+
+
+class Command(BaseCommand):
+    help = "Link books and films to Person records by their creator_string, creating missing people"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--types', type=str, default='',
+                            help=f"Comma-separated subset of: {', '.join(CREATOR_MODELS)}")
+        parser.add_argument('--no-create', action='store_true', help='Only link to existing people')
+        parser.add_argument('--batch-size', type=int, default=RESOLUTION_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        types = [t for t in options['types'].split(',') if t] or list(CREATOR_MODELS)
+        unknown = [t for t in types if t not in CREATOR_MODELS]
+        if unknown:
+            raise CommandError(f"Unknown types: {', '.join(unknown)}")
+
+        for name in types:
+            stats = link_creators(CREATOR_MODELS[name], create=not options['no_create'], batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f"{name}: linked {stats['linked']}, created {stats['created']} people, "
+                f"left {stats['ambiguous']} ambiguous"
+            ))
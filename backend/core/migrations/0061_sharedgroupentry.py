@@ -0,0 +1,62 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+SHARED_MODELS = [
+    'recipe', 'langlesson', 'calendardate', 'mappin', 'userbook', 'userfilm', 'usermusicpiece',
+    'usermusicartist', 'userhistoryevent', 'usermusiccomposer', 'list',
+]
+
+
+def backfill_shared_entries(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    SharedGroupEntry = apps.get_model('core', 'SharedGroupEntry')
+
+    for model_name in SHARED_MODELS:
+        model = apps.get_model('core', model_name)
+        content_type, _ = ContentType.objects.get_or_create(app_label='core', model=model_name)
+        field = model._meta.get_field('cultures')
+        item_name = field.m2m_field_name()
+        rows = field.remote_field.through.objects.values_list(
+            f'{item_name}_id', 'culture_id', 'culture__shared_group_key', f'{item_name}__user_id'
+        )
+        SharedGroupEntry.objects.bulk_create([
+            SharedGroupEntry(
+                content_type=content_type,
+                object_id=object_id,
+                culture_id=culture_id,
+                shared_group_key=group_key,
+                user_id=user_id,
+            ) for object_id, culture_id, group_key, user_id in rows.iterator(chunk_size=2000)
+        ], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('core', '0060_alter_film_runtime'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SharedGroupEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('shared_group_key', models.SlugField()),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('culture', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shared_entries', to='core.culture')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shared_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Shared Group Entries',
+                'indexes': [models.Index(fields=['content_type', 'shared_group_key', 'object_id'], name='shared_group_lookup_idx')],
+                'unique_together': {('content_type', 'object_id', 'culture')},
+            },
+        ),
+        migrations.RunPython(backfill_shared_entries, migrations.RunPython.noop),
+    ]
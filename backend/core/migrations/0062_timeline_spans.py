@@ -0,0 +1,69 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:30
+
+from django.db import migrations, models
+from django.db.models import Q
+from django.db.models.functions import Coalesce, ExtractYear, Greatest, Least
+
+# (index name, table, start column, end column): GiST expression indexes used by
+# core.services.timeline.SpanOverlaps on PostgreSQL
+GIST_INDEXES = [
+    ('date_estimate_span_gist', 'core_dateestimate', 'start_year', 'end_year'),
+    ('period_span_gist', 'core_period', 'start_year', 'end_year'),
+]
+
+
+def backfill_spans(apps, schema_editor):
+    DateEstimate = apps.get_model('core', 'DateEstimate')
+    exact = Q(date_known=True, date__isnull=False)
+    DateEstimate.objects.filter(exact).update(start_year=ExtractYear('date'), end_year=ExtractYear('date'))
+    start = Coalesce('date_estimate_start', 'date_estimate_end')
+    end = Coalesce('date_estimate_end', 'date_estimate_start')
+    DateEstimate.objects.exclude(exact).update(start_year=Least(start, end), end_year=Greatest(start, end))
+
+
+def create_gist_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, start, end in GIST_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gist '
+            f"(int4range(LEAST({start}, {end}), GREATEST({start}, {end}), '[]')) "
+            f'WHERE {start} IS NOT NULL'
+        )
+
+
+def drop_gist_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _, _, _ in GIST_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0061_sharedgroupentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dateestimate',
+            name='end_year',
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='dateestimate',
+            name='start_year',
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='dateestimate',
+            index=models.Index(fields=['start_year', 'end_year'], name='date_estimate_span_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='period',
+            index=models.Index(fields=['culture', 'start_year', 'end_year'], name='period_span_idx'),
+        ),
+        migrations.RunPython(backfill_spans, migrations.RunPython.noop),
+        migrations.RunPython(create_gist_indexes, drop_gist_indexes),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:33
+
+from django.conf import settings
+from django.db import migrations, models
+from core.geo import coordinates, encode_geohash
+
+
+def backfill_coordinates(apps, schema_editor):
+    MapPin = apps.get_model('core', 'MapPin')
+    batch = []
+    for pin in MapPin.objects.only('id', 'loc').iterator(chunk_size=2000):
+        point = coordinates(pin.loc)
+        if point is None:
+            continue
+        pin.lat, pin.lng = point
+        pin.geohash = encode_geohash(*point)
+        batch.append(pin)
+        if len(batch) >= 2000:
+            MapPin.objects.bulk_update(batch, ['lat', 'lng', 'geohash'])
+            batch = []
+    if batch:
+        MapPin.objects.bulk_update(batch, ['lat', 'lng', 'geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0062_timeline_spans'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mappin',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=12),
+        ),
+        migrations.AddField(
+            model_name='mappin',
+            name='lat',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mappin',
+            name='lng',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='mappin',
+            index=models.Index(fields=['lat', 'lng'], name='map_pin_lat_lng_idx'),
+        ),
+        migrations.RunPython(backfill_coordinates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copy of services/pin_clusters.py as of this migration
+CLUSTER_PRECISIONS = range(1, 8)
+
+
+def aggregate(entries, precision):
+    cells = {}
+    for culture_id, visibility, cell, count, lat, lng, pin in entries:
+        current = cells.setdefault((culture_id, visibility, cell[:precision]), [0, 0.0, 0.0, []])
+        current[0] += count
+        current[1] += lat * count
+        current[2] += lng * count
+        current[3].append(pin)
+    merged = []
+    for (culture_id, visibility, cell), (count, lat_sum, lng_sum, pins) in cells.items():
+        lat, lng = lat_sum / count, lng_sum / count
+        nearest = min(pins, key=lambda pin: (pin[1] - lat) ** 2 + (pin[2] - lng) ** 2)
+        merged.append((culture_id, visibility, cell, count, lat, lng, nearest))
+    return merged
+
+
+def build_clusters(apps, schema_editor):
+    MapPin = apps.get_model('core', 'MapPin')
+    MapPinCluster = apps.get_model('core', 'MapPinCluster')
+    rows = (
+        MapPin.objects.filter(cultures__isnull=False, lat__isnull=False)
+        .exclude(geohash='')
+        .values_list('cultures', 'id', 'visibility', 'geohash', 'lat', 'lng')
+        .order_by()
+    )
+    level = [(culture_id, visibility, geohash, 1, lat, lng, (pk, lat, lng)) for culture_id, pk, visibility, geohash, lat, lng in rows]
+    clusters = []
+    for precision in reversed(CLUSTER_PRECISIONS):
+        level = aggregate(level, precision)
+        clusters.extend(
+            MapPinCluster(
+                culture_id=culture_id, precision=precision, visibility=visibility, cell=cell,
+                count=count, lat=lat, lng=lng, pin_id=pin[0],
+            )
+            for culture_id, visibility, cell, count, lat, lng, pin in level
+        )
+    MapPinCluster.objects.bulk_create(clusters, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0063_map_pin_coordinates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MapPinCluster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('precision', models.PositiveSmallIntegerField()),
+                ('cell', models.CharField(max_length=12)),
+                ('visibility', models.CharField(choices=[('public', 'Public'), ('private', 'Private')], max_length=20)),
+                ('count', models.PositiveIntegerField()),
+                ('lat', models.FloatField()),
+                ('lng', models.FloatField()),
+                ('culture', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pin_clusters', to='core.culture')),
+                ('pin', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.mappin')),
+            ],
+            options={
+                'verbose_name_plural': 'Map Pin Clusters',
+                'indexes': [models.Index(fields=['culture', 'precision', 'lat', 'lng'], name='pin_cluster_lookup_idx')],
+                'unique_together': {('culture', 'precision', 'visibility', 'cell')},
+            },
+        ),
+        migrations.RunPython(build_clusters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0065_history_event_location'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarOccurrence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('date', models.DateField()),
+                ('calendar_date', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occurrences', to='core.calendardate')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='calendar_occurrences', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Calendar Occurrences',
+                'indexes': [models.Index(fields=['user', 'date'], name='calendar_occurrence_date_idx')],
+                'unique_together': {('calendar_date', 'date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CalendarOccurrenceYear',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='calendar_occurrence_years', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Calendar Occurrence Years',
+                'unique_together': {('user', 'year')},
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:42
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import ExtractDay, ExtractMonth
+
+
+def backfill_month_days(apps, schema_editor):
+    DateEstimate = apps.get_model('core', 'DateEstimate')
+    CalendarDate = apps.get_model('core', 'CalendarDate')
+    (
+        DateEstimate.objects
+        # Only exact dates; other precisions' day and month are placeholders
+        .filter(date_known=True, date__isnull=False, date_precision='exact')
+        .update(month_day=ExtractMonth('date') * 100 + ExtractDay('date'))
+    )
+    CalendarDate.objects.filter(calendar_date__isnull=False).update(
+        month_day=ExtractMonth('calendar_date') * 100 + ExtractDay('calendar_date')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0066_calendar_occurrences'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendardate',
+            name='month_day',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='dateestimate',
+            name='month_day',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='calendardate',
+            index=models.Index(fields=['user', 'month_day'], name='calendar_date_month_day_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dateestimate',
+            index=models.Index(fields=['month_day'], name='date_estimate_month_day_idx'),
+        ),
+        migrations.RunPython(backfill_month_days, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:43
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copies of core/names.py and services/person_search.py as of this migration
+FOLDED_LETTERS = str.maketrans({
+    'ß': 'ss', 'æ': 'ae', 'œ': 'oe', 'ø': 'o', 'đ': 'd', 'ð': 'd', 'þ': 'th', 'ł': 'l', 'ı': 'i',
+})
+SEPARATORS = re.compile(r'[\W_]+')
+MAX_TOKEN_LENGTH = 100
+
+
+def normalize_name(text):
+    text = unicodedata.normalize('NFKD', (text or '').casefold().translate(FOLDED_LETTERS))
+    text = ''.join(char for char in text if not unicodedata.combining(char)).translate(FOLDED_LETTERS)
+    text = text.replace("'", '').replace('’', '')
+    return SEPARATORS.sub(' ', text).strip()
+
+
+def build_search_index(apps, schema_editor):
+    Person = apps.get_model('core', 'Person')
+    PersonSearchToken = apps.get_model('core', 'PersonSearchToken')
+    people = list(Person.objects.only('given_name', 'middle_name', 'family_name'))
+    tokens = []
+    for person in people:
+        person.search_name = normalize_name(' '.join(filter(None, (person.given_name, person.middle_name, person.family_name))))
+        for token in dict.fromkeys(token[:MAX_TOKEN_LENGTH] for token in person.search_name.split()):
+            tokens.append(PersonSearchToken(person_id=person.pk, token=token))
+    Person.objects.bulk_update(people, ['search_name'], batch_size=2000)
+    PersonSearchToken.objects.bulk_create(tokens, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0067_month_day_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='person',
+            name='search_name',
+            field=models.CharField(blank=True, editable=False, max_length=400),
+        ),
+        migrations.CreateModel(
+            name='PersonSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=100)),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='core.person')),
+            ],
+            options={
+                'verbose_name_plural': 'Person Search Tokens',
+                'indexes': [models.Index(fields=['token'], name='person_search_token_idx', opclasses=['varchar_pattern_ops'])],
+                'unique_together': {('person', 'token')},
+            },
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:45
+
+from django.db import migrations, models
+
+
+def blank_to_null(apps, schema_editor):
+    Person = apps.get_model('core', 'Person')
+    Person.objects.filter(wikidata_id='').update(wikidata_id=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0068_person_search'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='person',
+            name='wikidata_id',
+            field=models.CharField(blank=True, max_length=20, null=True, unique=True),
+        ),
+        migrations.RunPython(blank_to_null, migrations.RunPython.noop),
+    ]
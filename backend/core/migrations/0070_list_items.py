@@ -0,0 +1,77 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:47
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def number_positions(apps, schema_editor):
+    ListItem = apps.get_model('core', 'ListItem')
+    entries, position, current = [], 0, None
+    for entry in ListItem.objects.order_by('list_id', 'id').only('id', 'list_id').iterator(chunk_size=2000):
+        position = position + 1 if entry.list_id == current else 0
+        current = entry.list_id
+        entry.position = position
+        entries.append(entry)
+    ListItem.objects.bulk_update(entries, ['position'], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0069_person_wikidata_nullable'),
+    ]
+
+    operations = [
+        # The auto-created List.items table becomes the ListItem through model in place
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    'ALTER TABLE core_list_items RENAME TO core_listitem',
+                    'ALTER TABLE core_listitem RENAME TO core_list_items',
+                ),
+                migrations.RunSQL(
+                    'ALTER TABLE core_listitem RENAME COLUMN universalitem_id TO item_id',
+                    'ALTER TABLE core_listitem RENAME COLUMN item_id TO universalitem_id',
+                ),
+            ],
+            state_operations=[
+                migrations.CreateModel(
+                    name='ListItem',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('list', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='core.list')),
+                        ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='list_entries', to='core.universalitem')),
+                    ],
+                    options={
+                        'verbose_name_plural': 'List Items',
+                        'unique_together': {('list', 'item')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='list',
+                    name='items',
+                    field=models.ManyToManyField(blank=True, related_name='in_lists', through='core.ListItem', to='core.universalitem'),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='listitem',
+            name='position',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='listitem',
+            name='added_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddIndex(
+            model_name='listitem',
+            index=models.Index(fields=['list', 'position'], name='list_item_position_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='listitem',
+            index=models.Index(fields=['item', 'list'], name='list_item_membership_idx'),
+        ),
+        migrations.RunPython(number_positions, migrations.RunPython.noop),
+    ]
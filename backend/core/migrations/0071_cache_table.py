@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-19 05:30
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_table(apps, schema_editor):
+    # Table of the shared DatabaseCache in settings.CACHES (no-op for other backends or if it exists)
+    call_command('createcachetable', database=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0070_list_items'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_table, migrations.RunPython.noop),
+    ]
@@ -4,8 +4,12 @@ from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelatio
 from django.contrib.contenttypes.models import ContentType
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 from colorfield.fields import ColorField
 from taggit.managers import TaggableManager
+from .calendars import month_day_key
+from .geo import coordinates, encode_geohash
+from .names import normalize_name
 from datetime import timedelta
 import uuid
 
@@ -24,7 +28,28 @@ class Visibility(models.TextChoices):
     PUBLIC = 'public', 'Public'
     PRIVATE = 'private', 'Private'
 
-class DateEstimate(models.Model):
+class DerivedFieldsModel(models.Model):
+    """
+    A model with columns computed from its other fields: `derived_fields`,
+    set by fill_derived_fields(). save() refreshes them and adds them to
+    update_fields; bulk writes call fill_derived_fields() themselves.
+    """
+    derived_fields = ()
+
+    def fill_derived_fields(self):
+        pass
+
+    def save(self, *args, **kwargs):
+        self.fill_derived_fields()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *self.derived_fields}
+        super().save(*args, **kwargs)
+
+    class Meta:
+        abstract = True
+
+class DateEstimate(DerivedFieldsModel):
     date_known = models.BooleanField(default=True)
     date = models.DateField(null=True, blank=True)
     date_estimate_start = models.IntegerField(null=True, blank=True)
@@ -34,6 +59,24 @@ class DateEstimate(models.Model):
         choices=DatePrecision.choices,
         default=DatePrecision.UNKNOWN
     )
+    # Year span derived from the fields above (see fill_derived_fields), for interval queries
+    start_year = models.IntegerField(null=True, blank=True, editable=False)
+    end_year = models.IntegerField(null=True, blank=True, editable=False)
+    # MMDD of exact-precision dates, for "on this day" lookups across years
+    month_day = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+
+    derived_fields = ("start_year", "end_year", "month_day")
+
+    def fill_derived_fields(self):
+        """Derive start_year/end_year from the exact date or the estimate bounds, and month_day."""
+        if self.date_known and self.date:
+            self.start_year = self.end_year = self.date.year
+            self.month_day = month_day_key(self.date) if self.date_precision == DatePrecision.EXACT else None
+            return
+        self.month_day = None
+        bounds = [year for year in (self.date_estimate_start, self.date_estimate_end) if year is not None]
+        self.start_year = min(bounds) if bounds else None
+        self.end_year = max(bounds) if bounds else None
 
     def __str__(self):
         if self.date_known and self.date:
@@ -42,7 +85,42 @@ class DateEstimate(models.Model):
 
     class Meta:
         verbose_name_plural = "Date Estimates"
-        indexes = [models.Index(fields=['date_precision'])]
+        indexes = [
+            models.Index(fields=['date_precision']),
+            models.Index(fields=['start_year', 'end_year'], name='date_estimate_span_idx'),
+            models.Index(fields=['month_day'], name='date_estimate_month_day_idx'),
+        ]
+
+# -------------------------------------------------
+# HEAVY FIELD DEFERRAL
+# -------------------------------------------------
+class HeavyFieldQuerySet(models.QuerySet):
+    """
+    QuerySet for models that list their large JSON columns in `heavy_fields`.
+    HeavyFieldManager defers those columns; code that renders them opts back
+    in with with_heavy() or for_serializer().
+    """
+
+    def with_heavy(self, *fields):
+        """Load the named heavy columns (all of them when none are given)."""
+        wanted = set(fields or self.model.heavy_fields)
+        names, defer = self.query.deferred_loading
+        if not defer:
+            # After .only(): `names` are the columns loaded immediately
+            return self.only(*names, *wanted)
+        remaining = set(names) - wanted
+        clone = self.defer(None)
+        return clone.defer(*remaining) if remaining else clone
+
+    def for_serializer(self, serializer_class):
+        """Load the heavy columns `serializer_class` renders."""
+        rendered = set(self.model.heavy_fields).intersection(serializer_class.Meta.fields)
+        return self.with_heavy(*rendered) if rendered else self
+
+
+class HeavyFieldManager(models.Manager.from_queryset(HeavyFieldQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().defer(*self.model.heavy_fields)
 
 # -------------------------------------------------
 # ABSTRACT BASE MODELS
@@ -72,9 +150,29 @@ class AbstractUserTrackingModel(TimestampedModel):
         # Guard against unsaved instance
         if self.pk is None:
             return
-        for culture in self.cultures.all():
-            if culture.user != self.user:
-                raise ValidationError(f"Culture {culture.name} does not belong to user {self.user.username}")
+        foreign = self.cultures.exclude(user_id=self.user_id).values_list("name", flat=True).first()
+        if foreign is not None:
+            raise ValidationError(f"Culture {foreign} does not belong to user {self.user.username}")
+
+    class Meta:
+        abstract = True
+
+class AbstractLocatedModel(DerivedFieldsModel):
+    """
+    A point in `loc` ({"lat": .., "lng": ..}) with indexed lat/lng/geohash
+    copies (its derived fields) for bounding box and map tile queries.
+    """
+    loc = models.JSONField(null=True, blank=True)
+    lat = models.FloatField(null=True, blank=True, editable=False)
+    lng = models.FloatField(null=True, blank=True, editable=False)
+    geohash = models.CharField(max_length=12, blank=True, db_index=True, editable=False)
+
+    derived_fields = ("lat", "lng", "geohash")
+
+    def fill_derived_fields(self):
+        point = coordinates(self.loc)
+        self.lat, self.lng = point if point else (None, None)
+        self.geohash = encode_geohash(*point) if point else ""
 
     class Meta:
         abstract = True
@@ -172,7 +270,10 @@ class Period(TimestampedModel):
 
     class Meta:
         verbose_name_plural = "Periods"
-        indexes = [models.Index(fields=["culture", "category"])]
+        indexes = [
+            models.Index(fields=["culture", "category"]),
+            models.Index(fields=["culture", "start_year", "end_year"], name="period_span_idx"),
+        ]
 
 class PageContent(TimestampedModel):
     culture = models.ForeignKey(Culture, on_delete=models.CASCADE, related_name="pages")
@@ -182,6 +283,9 @@ class PageContent(TimestampedModel):
     extra_text = models.TextField(blank=True, null=True)
     lists = models.JSONField(default=list, blank=True, null=True)
 
+    heavy_fields = ("lists",)
+    objects = HeavyFieldManager()
+
     def __str__(self):
         return f"{self.category.display_name} Page ({self.culture.name})"
 
@@ -199,6 +303,9 @@ class Recipe(AbstractUserTrackingModel):
     serving_size = models.CharField(max_length=50, blank=True)
     photo = models.URLField(blank=True, null=True)
 
+    heavy_fields = ("ingredients", "instructions")
+    objects = HeavyFieldManager()
+
     def __str__(self):
         culture_names = ", ".join(culture.name for culture in self.cultures.all())
         return f"{self.name} ({culture_names})"
@@ -224,7 +331,7 @@ class LangLesson(AbstractUserTrackingModel):
         verbose_name_plural = "Language Lessons"
         indexes = [models.Index(fields=['user'])]
 
-class CalendarDate(AbstractUserTrackingModel):
+class CalendarDate(AbstractUserTrackingModel, DerivedFieldsModel):
     holiday_name = models.CharField(max_length=200)
     date_text = models.CharField(max_length=100, blank=True)
     calendar_date = models.DateField(null=True, blank=True)
@@ -243,6 +350,13 @@ class CalendarDate(AbstractUserTrackingModel):
         default="gregorian",
     )
     person = models.ForeignKey("Person", null=True, blank=True, on_delete=models.SET_NULL, related_name="holidays")
+    # MMDD of calendar_date, for upcoming-holiday lookups across years
+    month_day = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+
+    derived_fields = ("month_day",)
+
+    def fill_derived_fields(self):
+        self.month_day = month_day_key(self.calendar_date) if self.calendar_date else None
 
     def __str__(self):
         culture_names = ", ".join(culture.name for culture in self.cultures.all())
@@ -250,10 +364,13 @@ class CalendarDate(AbstractUserTrackingModel):
 
     class Meta:
         verbose_name_plural = "Calendar Dates"
-        indexes = [models.Index(fields=['user'])]
+        indexes = [
+            models.Index(fields=['user']),
+            models.Index(fields=['user', 'month_day'], name='calendar_date_month_day_idx'),
+        ]
         unique_together = [("holiday_name", "calendar_date", "user")]
              
-class UserHistoryEvent(AbstractUserTrackingModel):
+class UserHistoryEvent(AbstractUserTrackingModel, AbstractLocatedModel):
     title = models.CharField(max_length=200)
     alt_title = models.CharField(max_length=200, null=True, blank=True)
     type = models.CharField(max_length=100)
@@ -272,12 +389,15 @@ class UserHistoryEvent(AbstractUserTrackingModel):
 
     class Meta:
         verbose_name_plural = "User History Events"
-        indexes = [models.Index(fields=['user'], name='user_event_idx')]
+        indexes = [
+            models.Index(fields=['user'], name='user_event_idx'),
+            models.Index(fields=['lat', 'lng'], name='user_event_lat_lng_idx'),
+        ]
 
 # -------------------------------------------------
 # GLOBAL MODELS
 # -------------------------------------------------
-class Person(TimestampedModel):
+class Person(TimestampedModel, DerivedFieldsModel):
     given_name = models.CharField(max_length=100)
     family_name = models.CharField(max_length=100)
     middle_name = models.CharField(max_length=100, blank=True)
@@ -293,11 +413,24 @@ class Person(TimestampedModel):
     epithets = models.CharField(max_length=255, blank=True)
     resting_place = models.CharField(max_length=255, blank=True)
     notable_works = models.JSONField(default=list, blank=True)
-    wikidata_id = models.CharField(max_length=20, blank=True, unique=True)
+    # NULL when unknown, so people without one don't collide on the unique index
+    wikidata_id = models.CharField(max_length=20, null=True, blank=True, unique=True)
+    # Accent-folded full name (see names.normalize_name); PersonSearchToken rows index its words
+    search_name = models.CharField(max_length=400, blank=True, editable=False)
+
+    name_fields = ("given_name", "middle_name", "family_name")
+    derived_fields = ("search_name",)
 
     def full_name(self):
         return f"{self.given_name} {self.middle_name} {self.family_name}".strip()
 
+    def fill_derived_fields(self):
+        self.search_name = normalize_name(" ".join(getattr(self, field) for field in self.name_fields))
+
+    def clean(self):
+        # Blank ids are stored as NULL so they don't collide on the unique index
+        self.wikidata_id = self.wikidata_id or None
+
     def __str__(self):
         return self.full_name()
 
@@ -305,6 +438,20 @@ class Person(TimestampedModel):
         verbose_name_plural = "People"
         indexes = [models.Index(fields=['family_name', 'given_name'], name='person_name_idx'), models.Index(fields=['wikidata_id'], name='person_wikidata_idx')]
 
+class PersonSearchToken(models.Model):
+    """One word of a Person's search_name, for indexed prefix matching (see services/person_search.py)."""
+    person = models.ForeignKey(Person, on_delete=models.CASCADE, related_name="search_tokens")
+    token = models.CharField(max_length=100)
+
+    def __str__(self):
+        return f"{self.token} -> {self.person_id}"
+
+    class Meta:
+        verbose_name_plural = "Person Search Tokens"
+        unique_together = [("person", "token")]
+        # varchar_pattern_ops lets PostgreSQL answer LIKE 'prefix%' from the index whatever the collation
+        indexes = [models.Index(fields=["token"], name="person_search_token_idx", opclasses=["varchar_pattern_ops"])]
+
 class UserMapPreferences(TimestampedModel):
     culture = models.ForeignKey(Culture, on_delete=models.CASCADE, related_name="map_preferences")
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="map_preferences")
@@ -317,7 +464,7 @@ class UserMapPreferences(TimestampedModel):
     class Meta:
         verbose_name_plural = "Map Preferences"
 
-class MapPin(AbstractUserTrackingModel):
+class MapPin(AbstractUserTrackingModel, AbstractLocatedModel):
     period = models.ForeignKey(Period, on_delete=models.CASCADE, related_name="map_pins", null=True, blank=True)
     type = models.CharField(max_length=50, null=True, blank=True)
     filter = models.CharField(max_length=50, choices=[
@@ -347,12 +494,16 @@ class MapPin(AbstractUserTrackingModel):
 
     class Meta:
         verbose_name_plural = "Map Pins"
+        indexes = [models.Index(fields=["lat", "lng"], name="map_pin_lat_lng_idx")]
 
 class LanguageTable(TimestampedModel):
     culture = models.ForeignKey(Culture, on_delete=models.CASCADE, related_name="language_tables")
     title = models.CharField(max_length=200)
     table_data = models.JSONField(default=dict)
 
+    heavy_fields = ("table_data",)
+    objects = HeavyFieldManager()
+
     def __str__(self):
         return f"{self.title} ({self.culture.name})"
 
@@ -390,6 +541,9 @@ class Book(AbstractMedia):
     genre = models.JSONField(default=list, blank=True, null=True)
     languages = models.JSONField(default=list, blank=True, null=True)
     ol_id = models.CharField(max_length=20, blank=True, null=True, unique=True)
+
+    heavy_fields = ("genre",)
+    objects = HeavyFieldManager()
     
 
     class Meta:
@@ -478,6 +632,9 @@ class Film(AbstractMedia):
     release_date = models.DateField(null=True, blank=True)
     industry_rating = models.DecimalField(max_digits=12, decimal_places=1, blank=True, null=True)
 
+    heavy_fields = ("cast", "crew")
+    objects = HeavyFieldManager()
+
     class Meta:
         verbose_name_plural = "Films"
         indexes = [models.Index(fields=['tmdb_id'], name='film_tmdb_idx')]
@@ -646,7 +803,7 @@ class List(TimestampedModel):
     name = models.CharField(max_length=200)
     description = models.TextField(blank=True, null=True)
     cultures = models.ManyToManyField(Culture, related_name="lists", blank=True)
-    items = models.ManyToManyField(UniversalItem, related_name="in_lists", blank=True)
+    items = models.ManyToManyField(UniversalItem, through="ListItem", related_name="in_lists", blank=True)
     visibility = models.CharField(
         max_length=20,
         choices=Visibility.choices,
@@ -670,4 +827,98 @@ class List(TimestampedModel):
     class Meta:
         verbose_name_plural = "Lists"
         indexes = [models.Index(fields=["user", "name"], name="list_user_name_idx")]
-        unique_together = ("user", "name")
\ No newline at end of file
+        unique_together = ("user", "name")
+
+class ListItem(models.Model):
+    """An item of a List, at `position` in the list's order."""
+    list = models.ForeignKey(List, on_delete=models.CASCADE, related_name="entries")
+    item = models.ForeignKey(UniversalItem, on_delete=models.CASCADE, related_name="list_entries")
+    position = models.PositiveIntegerField(default=0)
+    added_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.item_id} at {self.position} in {self.list_id}"
+
+    class Meta:
+        verbose_name_plural = "List Items"
+        unique_together = [("list", "item")]
+        indexes = [
+            models.Index(fields=["list", "position"], name="list_item_position_idx"),
+            # "Which lists contain these items" lookups
+            models.Index(fields=["item", "list"], name="list_item_membership_idx"),
+        ]
+# ---- SHARED CONTENT INDEX ----
+class SharedGroupEntry(models.Model):
+    """
+    Denormalized item -> shared_group_key mirror of each `cultures` through table,
+    used to answer shared-content queries as an indexed semi-join.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    culture = models.ForeignKey(Culture, on_delete=models.CASCADE, related_name="shared_entries")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="shared_entries")
+    shared_group_key = models.SlugField(max_length=50)
+
+    def __str__(self):
+        return f"{self.content_type.model} #{self.object_id} in {self.shared_group_key}"
+
+    class Meta:
+        verbose_name_plural = "Shared Group Entries"
+        unique_together = [("content_type", "object_id", "culture")]
+        indexes = [models.Index(fields=["content_type", "shared_group_key", "object_id"], name="shared_group_lookup_idx")]
+
+# ---- MAP PIN CLUSTERS ----
+class MapPinCluster(models.Model):
+    """
+    Precomputed pin count and centroid of one geohash cell of a culture, per
+    precision level and pin visibility (see services/pin_clusters.py).
+    """
+    culture = models.ForeignKey(Culture, on_delete=models.CASCADE, related_name="pin_clusters")
+    precision = models.PositiveSmallIntegerField()
+    cell = models.CharField(max_length=12)
+    visibility = models.CharField(max_length=20, choices=Visibility.choices)
+    count = models.PositiveIntegerField()
+    lat = models.FloatField()
+    lng = models.FloatField()
+    # Pin nearest to the centroid
+    pin = models.ForeignKey(MapPin, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+
+    def __str__(self):
+        return f"{self.cell} ({self.count} pins, {self.culture_id})"
+
+    class Meta:
+        verbose_name_plural = "Map Pin Clusters"
+        unique_together = [("culture", "precision", "visibility", "cell")]
+        indexes = [models.Index(fields=["culture", "precision", "lat", "lng"], name="pin_cluster_lookup_idx")]
+
+# ---- CALENDAR OCCURRENCES ----
+class CalendarOccurrence(models.Model):
+    """
+    Concrete Gregorian date on which a CalendarDate falls, expanded from
+    annual and non-Gregorian dates (see services/calendar_occurrences.py).
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="calendar_occurrences")
+    calendar_date = models.ForeignKey(CalendarDate, on_delete=models.CASCADE, related_name="occurrences")
+    year = models.PositiveSmallIntegerField()
+    date = models.DateField()
+
+    def __str__(self):
+        return f"{self.calendar_date_id} on {self.date}"
+
+    class Meta:
+        verbose_name_plural = "Calendar Occurrences"
+        unique_together = [("calendar_date", "date")]
+        indexes = [models.Index(fields=["user", "date"], name="calendar_occurrence_date_idx")]
+
+
+class CalendarOccurrenceYear(models.Model):
+    """Marks the (user, year) pairs whose CalendarOccurrence rows are complete."""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="calendar_occurrence_years")
+    year = models.PositiveSmallIntegerField()
+
+    def __str__(self):
+        return f"{self.user_id}: {self.year}"
+
+    class Meta:
+        verbose_name_plural = "Calendar Occurrence Years"
+        unique_together = [("user", "year")]
@@ -0,0 +1,35 @@
+import re
+import unicodedata
+
+# Letters NFKD does not decompose into a base letter plus accents
+_FOLDED_LETTERS = str.maketrans({
+    "ß": "ss", "æ": "ae", "œ": "oe", "ø": "o", "đ": "d", "ð": "d", "þ": "th", "ł": "l", "ı": "i",
+})
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+# Characters kept per token (PersonSearchToken.token)
+MAX_TOKEN_LENGTH = 100
+
+
+def normalize_name(text: str) -> str:
+    """
+    Lowercase, accent-folded, space-separated form of a name:
+    "Antonín Dvořák" -> "antonin dvorak", "Saint-Saëns" -> "saint saens".
+    """
+    text = unicodedata.normalize("NFKD", (text or "").casefold().translate(_FOLDED_LETTERS))
+    text = "".join(char for char in text if not unicodedata.combining(char)).translate(_FOLDED_LETTERS)
+    # Apostrophes join rather than split ("O'Brien" -> "obrien")
+    text = text.replace("'", "").replace("’", "")
+    return _SEPARATORS.sub(" ", text).strip()
+
+
+def name_tokens(*parts: str) -> list[str]:
+    """Distinct normalized tokens of the given name parts, in order."""
+    tokens = []
+    for part in parts:
+        for token in normalize_name(part).split():
+            token = token[:MAX_TOKEN_LENGTH]
+            if token not in tokens:
+                tokens.append(token)
+    return tokens
@@ -0,0 +1,247 @@
+import logging
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter, deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+from time import perf_counter
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework.serializers import BaseSerializer
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets per metric (anything above lands in ">last")
+HISTOGRAM_BUCKETS = {
+    "queries": (1, 2, 5, 10, 20, 50, 100),
+    "duplicate_queries": (0, 1, 5, 20, 100),
+    "sql_ms": (1, 5, 10, 25, 50, 100, 250, 1000),
+    "serializer_ms": (1, 5, 10, 25, 50, 100, 250, 1000),
+    "duration_ms": (5, 10, 25, 50, 100, 250, 500, 1000, 2500),
+    "response_bytes": (1024, 10240, 102400, 1048576),
+}
+
+# Repeated query fingerprints reported per request and per route
+TOP_DUPLICATES = 5
+
+# Characters of SQL kept as the example of a fingerprint
+SQL_SAMPLE_LENGTH = 300
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LISTS = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_current = ContextVar("request_profile", default=None)
+_samples: dict[str, deque] = {}
+_lock = threading.Lock()
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def fingerprint(sql: str) -> str:
+    """
+    SQL with literals and placeholder lists collapsed, so the same query run
+    for different rows ("WHERE id = 1", "WHERE id IN (%s, %s)") matches.
+    """
+    sql = _LITERALS.sub("?", sql)
+    sql = _PLACEHOLDER_LISTS.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class RequestProfile:
+    """What one request did: its queries (as a connection execute wrapper) and serializer time."""
+
+    def __init__(self):
+        self.query_count = 0
+        self.sql_time = 0.0
+        self.fingerprints = Counter()
+        self.examples = {}
+        self.serializer_time = 0.0
+        self.serializing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += perf_counter() - start
+            self.query_count += 1
+            key = fingerprint(sql)
+            self.fingerprints[key] += 1
+            self.examples.setdefault(key, sql[:SQL_SAMPLE_LENGTH])
+
+    def sample(self, duration: float, response) -> dict:
+        repeated = [(key, count) for key, count in self.fingerprints.most_common(TOP_DUPLICATES) if count > 1]
+        return {
+            "queries": self.query_count,
+            "duplicate_queries": self.query_count - len(self.fingerprints),
+            "sql_ms": round(self.sql_time * 1000, 2),
+            "serializer_ms": round(self.serializer_time * 1000, 2),
+            "duration_ms": round(duration * 1000, 2),
+            # Streamed bodies are produced after the middleware returns
+            "response_bytes": None if response.streaming else len(response.content),
+            "repeated": {key: (count, self.examples[key]) for key, count in repeated},
+        }
+
+
+def _timed(data):
+    def timed_data(serializer):
+        profile = _current.get()
+        # Nested serializers (SerializerMethodFields calling .data) count once
+        if profile is None or profile.serializing:
+            return data(serializer)
+        profile.serializing = True
+        start = perf_counter()
+        try:
+            return data(serializer)
+        finally:
+            profile.serializer_time += perf_counter() - start
+            profile.serializing = False
+
+    timed_data.profiled = True
+    return timed_data
+
+
+def _install_serializer_timing():
+    # Serializer.data and ListSerializer.data both go through BaseSerializer.data
+    if not getattr(BaseSerializer.data.fget, "profiled", False):
+        BaseSerializer.data = property(_timed(BaseSerializer.data.fget))
+
+
+def route_key(request) -> str:
+    match = request.resolver_match
+    return f"{request.method} {match.view_name if match else 'unresolved'}"
+
+
+def route_budget(request) -> dict:
+    """REQUEST_PROFILING_BUDGETS entries for "*", the view name and "METHOD view name", merged in that order."""
+    budgets = getattr(settings, "REQUEST_PROFILING_BUDGETS", {})
+    match = request.resolver_match
+    budget = dict(budgets.get("*", {}))
+    if match:
+        budget.update(budgets.get(match.view_name, {}))
+    budget.update(budgets.get(route_key(request), {}))
+    return budget
+
+
+def over_budget(budget: dict, sample: dict) -> list[str]:
+    return [
+        f"{metric} {sample[metric]} > {limit}"
+        for metric, limit in budget.items()
+        if sample.get(metric) is not None and sample[metric] > limit
+    ]
+
+
+def _record(route: str, sample: dict):
+    window = getattr(settings, "REQUEST_PROFILING_WINDOW", 500)
+    with _lock:
+        samples = _samples.get(route)
+        if samples is None or samples.maxlen != window:
+            samples = _samples[route] = deque(samples or (), maxlen=window)
+        samples.append(sample)
+
+
+def _histogram(values: list, bounds: tuple) -> dict:
+    counts = [0] * (len(bounds) + 1)
+    for value in values:
+        counts[bisect_left(bounds, value)] += 1
+    labels = [f"<={bound}" for bound in bounds] + [f">{bounds[-1]}"]
+    return dict(zip(labels, counts))
+
+
+def _distribution(values: list, bounds: tuple) -> dict | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+
+    def percentile(q):
+        return ordered[round(q * (len(ordered) - 1))]
+
+    return {
+        "p50": percentile(0.5),
+        "p95": percentile(0.95),
+        "max": ordered[-1],
+        "histogram": _histogram(ordered, bounds),
+    }
+
+
+def _route_summary(samples: list) -> dict:
+    summary = {"requests": len(samples), "over_budget": sum(1 for sample in samples if sample["over_budget"])}
+    for metric, bounds in HISTOGRAM_BUCKETS.items():
+        summary[metric] = _distribution([sample[metric] for sample in samples if sample[metric] is not None], bounds)
+
+    repeated = {}
+    for sample in samples:
+        for key, (count, sql) in sample["repeated"].items():
+            entry = repeated.setdefault(key, {"sql": sql, "requests": 0, "max_repeats": 0})
+            entry["requests"] += 1
+            entry["max_repeats"] = max(entry["max_repeats"], count)
+    summary["repeated_queries"] = sorted(repeated.values(), key=lambda entry: (-entry["requests"], -entry["max_repeats"]))[:TOP_DUPLICATES]
+    return summary
+
+
+def profiling_summary(route: str | None = None) -> dict:
+    """Rolling per-route summaries of this process's last REQUEST_PROFILING_WINDOW requests."""
+    with _lock:
+        windows = {key: list(samples) for key, samples in _samples.items() if route is None or key == route}
+    return {
+        "enabled": getattr(settings, "REQUEST_PROFILING", False),
+        "window": getattr(settings, "REQUEST_PROFILING_WINDOW", 500),
+        "routes": {key: _route_summary(samples) for key, samples in sorted(windows.items())},
+    }
+
+
+def reset_profiling():
+    with _lock:
+        _samples.clear()
+
+
+class QueryProfilingMiddleware:
+    """
+    Opt-in (REQUEST_PROFILING) per-request instrumentation: query count, SQL
+    time, repeated query fingerprints, DRF serializer time, total time and
+    response size. Samples go into rolling per-route windows (read through
+    /api/profiling/), are reported in a Server-Timing header, and are checked
+    against REQUEST_PROFILING_BUDGETS: an exceeded budget is logged, or
+    raised when REQUEST_PROFILING_BUDGET_ACTION is "raise" so the test that
+    made the request fails.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_PROFILING", False):
+            raise MiddlewareNotUsed
+        _install_serializer_timing()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        token = _current.set(profile)
+        start = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(profile))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        sample = profile.sample(perf_counter() - start, response)
+        route = route_key(request)
+        exceeded = over_budget(route_budget(request), sample)
+        sample["over_budget"] = bool(exceeded)
+        _record(route, sample)
+        response["Server-Timing"] = (
+            f'db;dur={sample["sql_ms"]};desc="{sample["queries"]} queries", '
+            f'serializer;dur={sample["serializer_ms"]}, total;dur={sample["duration_ms"]}'
+        )
+
+        if exceeded:
+            message = f"{route} ({request.get_full_path()}) over budget: {', '.join(exceeded)}"
+            if getattr(settings, "REQUEST_PROFILING_BUDGET_ACTION", "log") == "raise":
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
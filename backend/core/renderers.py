@@ -0,0 +1,75 @@
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional dependency, fall back to DRF's stdlib renderer
+    orjson = None
+
+# Rows serialized per yielded chunk when streaming
+STREAM_CHUNK_SIZE = 500
+
+_drf_default = JSONEncoder().default
+
+
+def dumps(data, indent: bool = False) -> bytes:
+    """
+    Encode `data` as UTF-8 JSON. Decimal, timedelta, lazy strings and
+    datetimes are handed to DRF's encoder so output matches the stdlib path.
+    """
+    if orjson is None:
+        return JSONRenderer().render(data, renderer_context={"indent": 2 if indent else None})
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=_drf_default, option=option)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson when it is installed."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        return dumps(data, indent=bool(indent))
+
+
+def stream_json_array(items, chunk_size: int = STREAM_CHUNK_SIZE):
+    """Yield a JSON array of `items` in chunks of `chunk_size` encoded rows."""
+    yield b"["
+    separator = b""
+    chunk = []
+    for item in items:
+        chunk.append(dumps(item))
+        if len(chunk) >= chunk_size:
+            yield separator + b",".join(chunk)
+            separator = b","
+            chunk = []
+    if chunk:
+        yield separator + b",".join(chunk)
+    yield b"]"
+
+
+class StreamingListMixin:
+    """
+    With ?stream=true, list() streams a JSON array from queryset.iterator(),
+    building and serializing rows a chunk at a time instead of the whole
+    response in memory. The output is the same as the regular list.
+    """
+    stream_chunk_size = STREAM_CHUNK_SIZE
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("stream") != "true":
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        rows = (serializer.to_representation(obj) for obj in queryset.iterator(chunk_size=self.stream_chunk_size))
+        return StreamingHttpResponse(
+            stream_json_array(rows, self.stream_chunk_size),
+            content_type="application/json",
+        )
@@ -0,0 +1,145 @@
+import hashlib
+import uuid
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Q
+from django.core.cache import cache, caches
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+from .conditional import etag_matches, make_etag, not_modified, validator_headers
+
+# Catalog model name -> {catalog model whose payload nests it: its foreign keys to it}
+# (Film/Book serialize their DateEstimate, Person its birth/death dates)
+NESTED_IN = {
+    "dateestimate": {"film": ("date",), "book": ("date",), "person": ("birth_date", "death_date")},
+}
+
+CATALOG_MODELS = ("film", "book", "person", "universalitem")
+
+
+def _timeout() -> int:
+    return getattr(settings, "CATALOG_CACHE_TIMEOUT", 600)
+
+
+def _versions(*keys) -> list[str]:
+    """
+    Read version tokens, minting a fresh one for any that are missing (never
+    set, or evicted) so entries stored under an older token can't resurface.
+    """
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, uuid.uuid4().hex, None)
+            found[key] = cache.get(key)
+    return [found[key] for key in keys]
+
+
+def _bump(*keys):
+    def replace():
+        cache.set_many({key: uuid.uuid4().hex for key in keys}, None)
+
+    replace()
+    # Again once the write is visible, in case a concurrent miss re-cached
+    # the old rows in between
+    transaction.on_commit(replace)
+
+
+def _record(model_name: str, outcome: str):
+    # Counted per worker, so hits don't write to the shared cache
+    stats = caches["local"]
+    key = f"catalog:stats:{model_name}:{outcome}"
+    if not stats.add(key, 1, None):
+        try:
+            stats.incr(key)
+        except ValueError:
+            stats.set(key, 1, None)
+
+
+def invalidate_catalog_object(model_name: str, pk):
+    """Drop cached detail responses of one row and every cached list of its model."""
+    _bump(f"catalog:{model_name}:obj:{pk}", f"catalog:{model_name}:lists")
+
+
+def invalidate_catalog_model(model_name: str):
+    """Drop every cached response of a catalog model."""
+    _bump(f"catalog:{model_name}:lists", f"catalog:{model_name}:deps")
+
+
+def invalidate_nested(instance):
+    """
+    Drop cached responses of the catalog rows that nest `instance`. Rows
+    owned by anything else (map pins, history events) invalidate nothing.
+    """
+    for catalog_model, fields in NESTED_IN.get(instance._meta.model_name, {}).items():
+        references = Q()
+        for field in fields:
+            references |= Q(**{field: instance.pk})
+        owners = apps.get_model("core", catalog_model).objects.filter(references).values_list("pk", flat=True)
+        for pk in owners:
+            invalidate_catalog_object(catalog_model, pk)
+
+
+def catalog_cache_stats() -> dict:
+    """Hit/miss counters of this worker."""
+    counts = caches["local"].get_many(
+        [f"catalog:stats:{name}:{outcome}" for name in CATALOG_MODELS for outcome in ("hits", "misses")]
+    )
+    stats = {}
+    for name in CATALOG_MODELS:
+        hits = counts.get(f"catalog:stats:{name}:hits", 0)
+        misses = counts.get(f"catalog:stats:{name}:misses", 0)
+        total = hits + misses
+        stats[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else None,
+        }
+    return stats
+
+
+class CatalogCacheMixin:
+    """
+    Serve list/retrieve of a global catalog ViewSet from Django's cache.
+
+    Entries are keyed by the request path and by version tokens that the
+    post_save/post_delete handlers in signals.py replace. Only the tokens
+    live in the shared cache; response bodies stay in the worker's "local"
+    cache, so a hit (and a 304 revalidation) reads one small get_many and
+    a worker still never serves a body whose tokens were replaced elsewhere.
+    """
+
+    def _cache_key(self, request, *versions) -> str:
+        path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        return ":".join(["catalog", self.basename, *versions, path])
+
+    def _cached(self, request, model_name, key, render):
+        entries = caches["local"]
+        entry = entries.get(key)
+        if entry is None:
+            _record(model_name, "misses")
+            response = render()
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            entry = (make_etag(key), response.data)
+            entries.set(key, entry, _timeout())
+        else:
+            _record(model_name, "hits")
+
+        etag, data = entry
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        return Response(data, headers=validator_headers(etag))
+
+    def list(self, request, *args, **kwargs):
+        model_name = self.get_serializer_class().Meta.model._meta.model_name
+        versions = _versions(f"catalog:{model_name}:lists", f"catalog:{model_name}:deps")
+        key = self._cache_key(request, "list", *versions)
+        return self._cached(request, model_name, key, lambda: super(CatalogCacheMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        model_name = self.get_serializer_class().Meta.model._meta.model_name
+        pk = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        versions = _versions(f"catalog:{model_name}:obj:{pk}", f"catalog:{model_name}:deps")
+        key = self._cache_key(request, "obj", str(pk), *versions)
+        return self._cached(request, model_name, key, lambda: super(CatalogCacheMixin, self).retrieve(request, *args, **kwargs))
@@ -9,6 +9,9 @@ from .models import (
     Book, Film, UserBook, UserFilm, UserMusicComposer, UserComposerSearch,
     UserMusicPiece, UserMusicArtist, UserHistoryEvent, DateEstimate, Visibility, List
 )
+from .geo import coordinates
+from .services.culture_provisioning import CULTURE_TEMPLATES, provision_culture, register_user
+from .services.list_items import set_list_items
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -18,7 +21,69 @@ class UserSerializer(serializers.ModelSerializer):
 class DateEstimateSerializer(serializers.ModelSerializer):
     class Meta:
         model = DateEstimate
-        fields = ['id', 'date_known', 'date', 'date_estimate_start', 'date_estimate_end', 'date_precision']
+        fields = ['id', 'date_known', 'date', 'date_estimate_start', 'date_estimate_end', 'date_precision', 'start_year', 'end_year']
+
+# Date rows inserted per statement by attach_date_estimates()
+DATE_BATCH_SIZE = 500
+
+def attach_date_estimates(owners, date_data, field='date'):
+    """
+    Write nested DateEstimate data for many owners at once. `date_data` runs
+    parallel to `owners` (None = leave the date alone). Existing date rows are
+    changed in place with one bulk_update; missing ones are inserted with one
+    bulk_create and assigned to their owner, which the caller then saves.
+    Returns True when any owner got a new date row.
+    """
+    created, changed, columns = [], [], set()
+    for owner, data in zip(owners, date_data):
+        if not data:
+            continue
+        current = getattr(owner, field)
+        if current is None:
+            current = DateEstimate(**data)
+            setattr(owner, field, current)
+            created.append(current)
+        else:
+            for attr, value in data.items():
+                setattr(current, attr, value)
+            changed.append(current)
+            columns.update(data)
+        # bulk writes skip DateEstimate.save()
+        current.fill_derived_fields()
+    if created:
+        DateEstimate.objects.bulk_create(created, batch_size=DATE_BATCH_SIZE)
+    if changed:
+        DateEstimate.objects.bulk_update(changed, [*sorted(columns), *DateEstimate.derived_fields], batch_size=DATE_BATCH_SIZE)
+    return bool(created)
+
+class NestedDateEstimateMixin:
+    """
+    create()/update() for serializers with a writable nested `date`. The date
+    row is inserted before its owner so the owner is written once with date_id
+    set, and updates change the existing date row instead of adding a new one.
+    Bulk endpoints use attach_date_estimates() the same way for many rows.
+    """
+    date_field = 'date'
+
+    def create(self, validated_data):
+        cultures = validated_data.pop('cultures', [])
+        date_data = validated_data.pop(self.date_field, None)
+        instance = self.Meta.model(**validated_data)
+        attach_date_estimates([instance], [date_data], self.date_field)
+        instance.save()
+        instance.cultures.set(cultures)
+        return instance
+
+    def update(self, instance, validated_data):
+        cultures = validated_data.pop('cultures', None)
+        date_data = validated_data.pop(self.date_field, None)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        attach_date_estimates([instance], [date_data], self.date_field)
+        instance.save()
+        if cultures is not None:
+            instance.cultures.set(cultures)
+        return instance
 
 class PersonSerializer(serializers.ModelSerializer):
     birth_date = DateEstimateSerializer(read_only=True)
@@ -32,6 +97,10 @@ class PersonSerializer(serializers.ModelSerializer):
                   'external_links', 'profession', 'nationality', 'birthplace',
                   'birth_date', 'birth_date_id', 'death_date', 'death_date_id', 'titles', 'epithets', 'resting_place',
                   'notable_works', 'wikidata_id']
+
+    def validate_wikidata_id(self, value):
+        # Blank ids are stored as NULL so they don't collide on the unique index
+        return value or None
         
 class PersonSimpleSerializer(serializers.ModelSerializer):
     class Meta:
@@ -40,60 +109,59 @@ class PersonSimpleSerializer(serializers.ModelSerializer):
 
 class CultureSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
+    template = serializers.ChoiceField(choices=list(CULTURE_TEMPLATES), write_only=True, required=False)
 
     class Meta:
         model = Culture
-        fields = ['id', 'user', 'name', 'code', 'colour', 'picture', 'created_at', 'updated_at', 'shared_group_key', 'visibility']
+        fields = ['id', 'user', 'name', 'code', 'colour', 'picture', 'created_at', 'updated_at', 'shared_group_key', 'visibility', 'template']
         
     def create(self, validated_data):
-        request = self.context['request']
-        validated_data['user'] = request.user
-        
-        culture = super().create(validated_data)
-        
-        default_category = ["Literature", "Film", "Music", "Cuisine", "History", "Calendar"]
-        
-        Category.objects.bulk_create([
-            Category(
-                culture=culture,
-                key=cat.lower(),
-                display_name=cat
-            ) for cat in default_category
-        ])
-        
-        PageContent.objects.bulk_create([
-            PageContent(
-                culture=culture,
-                category=Category.objects.get(culture=culture, key=cat.lower())
-            ) for cat in default_category
-        ])
-        
-        UserComposerSearch.objects.bulk_create([
-            UserComposerSearch(
-                user=request.user,
-                culture=culture
-            )
-        ])
-        
-        UserMapPreferences.objects.bulk_create([
-            UserMapPreferences(
-                user=request.user,
-                culture=culture,
-                center={'lat': 0.0, 'lng': 0.0},
-            )
-        ])
-        
-        return culture
+        template = validated_data.pop('template', 'default')
+        validated_data['user'] = self.context['request'].user
+        return provision_culture(template=template, **validated_data)
+
+    def update(self, instance, validated_data):
+        # Templates only apply when a culture is created
+        validated_data.pop('template', None)
+        return super().update(instance, validated_data)
     
 class CultureSimpleSerializer(serializers.ModelSerializer):
     class Meta:
         model = Culture
         fields = ['id', 'name', 'code', 'shared_group_key']
 
+OWNED_CULTURES_ERROR = "All cultures must belong to the authenticated user."
+
+
+class OwnedCulturesField(serializers.ListField):
+    """
+    Write-only list of culture ids that must all belong to the requesting
+    user, resolved to Culture instances with a single query.
+    """
+    child = serializers.IntegerField()
+    default_error_messages = {"not_owned": OWNED_CULTURES_ERROR}
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("write_only", True)
+        kwargs.setdefault("required", False)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        ids = list(dict.fromkeys(super().to_internal_value(data)))
+        if not ids:
+            return []
+
+        user = self.context["request"].user
+        owned = Culture.objects.filter(id__in=ids, user=user).in_bulk()
+        cultures = [owned[pk] for pk in ids if pk in owned]
+        if len(cultures) != len(ids):
+            self.fail("not_owned")
+        return cultures
+
 class ProfileSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
     preferred_cultures = CultureSimpleSerializer(many=True, read_only=True)
-    preferred_culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), source='preferred_cultures', many=True, write_only=True, required=False)
+    preferred_culture_ids = OwnedCulturesField(source='preferred_cultures')
 
     class Meta:
         model = Profile
@@ -145,7 +213,7 @@ class PageContentSerializer(serializers.ModelSerializer):
 
 class RecipeSerializer(serializers.ModelSerializer):
     cultures = CultureSimpleSerializer(many=True, read_only=True)
-    culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), many=True, source='cultures', write_only=True, required=False)
+    culture_ids = OwnedCulturesField(source='cultures')
 
     class Meta:
         model = Recipe
@@ -153,13 +221,6 @@ class RecipeSerializer(serializers.ModelSerializer):
                   'instructions', 'types', 'course', 'rating', 'notes', 'visibility',
                   'serving_size', 'photo', 'created_at', 'updated_at']
 
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
-        return value
-    
     def create(self, validated_data):
         cultures = validated_data.pop('cultures', [])
         instance = Recipe.objects.create(**validated_data)
@@ -177,20 +238,13 @@ class RecipeSerializer(serializers.ModelSerializer):
 
 class LangLessonSerializer(serializers.ModelSerializer):
     cultures = CultureSimpleSerializer(many=True, read_only=True)
-    culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), many=True, source='cultures', write_only=True, required=False)
+    culture_ids = OwnedCulturesField(source='cultures')
 
     class Meta:
         model = LangLesson
         fields = ['id', 'cultures', 'culture_ids', 'topic', 'lesson', 'examples', 'level',
                   'rating', 'notes', 'visibility', 'created_at', 'updated_at']
 
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
-        return value
-    
     def create(self, validated_data):
         cultures = validated_data.pop('cultures', [])
         instance = LangLesson.objects.create(**validated_data)
@@ -209,22 +263,15 @@ class LangLessonSerializer(serializers.ModelSerializer):
 class CalendarDateSerializer(serializers.ModelSerializer):
     cultures = CultureSimpleSerializer(many=True, read_only=True)
     person = PersonSimpleSerializer(read_only=True)
-    culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), many=True, source='cultures', write_only=True, required=False)
+    culture_ids = OwnedCulturesField(source='cultures')
     person_id = serializers.PrimaryKeyRelatedField(queryset=Person.objects.all(), source='person', write_only=True, required=False)
 
     class Meta:
         model = CalendarDate
         fields = ['id', 'cultures', 'culture_ids', 'holiday_name', 'date_text', 'calendar_date',
                   'traditions', 'meaning', 'photo', 'person', 'person_id', 'rating', 'notes',
-                  'visibility', 'created_at', 'updated_at', 'isAnnual', 'type']
+                  'visibility', 'created_at', 'updated_at', 'isAnnual', 'reference_system', 'type']
 
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
-        return value
-    
     def create(self, validated_data):
         cultures = validated_data.pop('cultures', [])
         instance = CalendarDate.objects.create(**validated_data)
@@ -248,9 +295,11 @@ class UserMapPreferencesSerializer(serializers.ModelSerializer):
         model = UserMapPreferences
         fields = ['id', 'user', 'culture', 'center', 'zoom', 'created_at', 'updated_at']
 
-class MapPinSerializer(serializers.ModelSerializer):
+LOC_ERROR = 'Expected {"lat": <-90..90>, "lng": <-180..180>}.'
+
+class MapPinSerializer(NestedDateEstimateMixin, serializers.ModelSerializer):
     date = DateEstimateSerializer(required=False)
-    culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), many=True, source='cultures', write_only=True, required=False)
+    culture_ids = OwnedCulturesField(source='cultures')
     period_id = serializers.PrimaryKeyRelatedField(queryset=Period.objects.all(), source='period', write_only=True, required=False)
     cultures = CultureSimpleSerializer(read_only=True, many=True)
     period = PeriodSimpleSerializer(read_only=True)
@@ -258,45 +307,11 @@ class MapPinSerializer(serializers.ModelSerializer):
     class Meta:
         model = MapPin
         fields = ['id', 'cultures', 'culture_ids', 'period', 'period_id', 'date', 'type', 'filter','loc', 'external_link', 'created_at', 'updated_at', 'title', 'photo', 'location', 'happened', 'significance']
-    
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
-        return value
-    
-    def create(self, validated_data):
-        cultures = validated_data.pop('cultures', [])
-        date_data = validated_data.pop('date', None)
-        instance = MapPin.objects.create(**validated_data)
-        instance.cultures.set(cultures)
-
-        if date_data:
-            date_instance = DateEstimate.objects.create(**date_data)
-            instance.date = date_instance
-            instance.save()
 
-        return instance
-
-    def update(self, instance, validated_data):
-        cultures = validated_data.pop('cultures', None)
-        date_data = validated_data.pop('date', None)
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        
-        if cultures is not None:
-            instance.cultures.set(cultures)
-            instance.save()
-        if date_data:
-            if instance.date:
-                for attr, value in date_data.items():
-                    setattr(instance.date, attr, value)
-                instance.date.save()
-            else:
-                instance.date = DateEstimate.objects.create(**date_data)
-                instance.save()
-        return instance
+    def validate_loc(self, value):
+        if coordinates(value) is None:
+            raise serializers.ValidationError(LOC_ERROR)
+        return value
 
 class LanguageTableSerializer(serializers.ModelSerializer):
     culture_id = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), source='culture', write_only=True, required=False)
@@ -305,6 +320,47 @@ class LanguageTableSerializer(serializers.ModelSerializer):
         model = LanguageTable
         fields = ['id', 'culture_id', 'title', 'table_data', 'created_at', 'updated_at']
 
+class SparseFieldsetMixin:
+    """
+    Let GET requests trim the output with ?fields=a,b or ?omit=a,b
+    (comma-separated). project() applies the same selection to a queryset,
+    deferring the model columns that won't be rendered.
+    """
+
+    @classmethod
+    def selected_fields(cls, request) -> set[str] | None:
+        if request is None or request.method not in ("GET", "HEAD"):
+            return None
+        fields = request.query_params.get("fields")
+        omit = request.query_params.get("omit")
+        if not fields and not omit:
+            return None
+
+        selected = set(cls.Meta.fields)
+        if fields:
+            selected &= {name.strip() for name in fields.split(",")}
+        if omit:
+            selected -= {name.strip() for name in omit.split(",")}
+        return selected
+
+    @classmethod
+    def project(cls, qs, request):
+        selected = cls.selected_fields(request)
+        if selected is None:
+            return qs
+        deferred = [
+            field.name for field in qs.model._meta.concrete_fields
+            if not field.is_relation and not field.primary_key and field.name not in selected
+        ]
+        return qs.defer(*deferred) if deferred else qs
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = self.selected_fields(self.context.get("request"))
+        if selected is not None:
+            for name in set(self.fields) - selected:
+                self.fields.pop(name)
+
 class UniversalItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = UniversalItem
@@ -315,7 +371,7 @@ class UniversalItemSimpleSerializer(serializers.ModelSerializer):
         model = UniversalItem
         fields = ['id']
 
-class BookSerializer(serializers.ModelSerializer):
+class BookSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     universal_item = UniversalItemSimpleSerializer(read_only=True)
     creator_id = serializers.PrimaryKeyRelatedField(queryset=Person.objects.all(), source='creator', write_only=True, required=False)
     date = DateEstimateSerializer(read_only=True)
@@ -341,7 +397,7 @@ class BookSimpleSerializer(serializers.ModelSerializer):
         model = Book
         fields = ['id', 'universal_item', 'title', 'creator_string', 'date', 'cover']
 
-class FilmSerializer(serializers.ModelSerializer):
+class FilmSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     universal_item = UniversalItemSimpleSerializer(read_only=True)
     creator_id = serializers.PrimaryKeyRelatedField(queryset=Person.objects.all(), source='creator', write_only=True, required=False)
     date = DateEstimateSerializer(read_only=True)
@@ -384,7 +440,7 @@ class FilmSimpleSerializer(serializers.ModelSerializer):
 class UserBookSerializer(serializers.ModelSerializer):
     universal_item_id = serializers.PrimaryKeyRelatedField(queryset=UniversalItem.objects.all(), source='universal_item', write_only=True, required=False)
     cultures = CultureSimpleSerializer(many=True, read_only=True)
-    culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), many=True, source='cultures', write_only=True, required=False)
+    culture_ids = OwnedCulturesField(source='cultures')
     period_id = serializers.PrimaryKeyRelatedField(queryset=Period.objects.all(), source='period', write_only=True, required=False)
 
     class Meta:
@@ -394,13 +450,6 @@ class UserBookSerializer(serializers.ModelSerializer):
                   'date_started', 'date_finished', 'read_language',
                   'owned', 'read', 'readlist', 'favourite', 'created_at', 'updated_at', 'period_id']
 
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
-        return value
-    
     def create(self, validated_data):
         cultures = validated_data.pop('cultures', [])
         instance = UserBook.objects.create(**validated_data)
@@ -420,7 +469,7 @@ class UserFilmSerializer(serializers.ModelSerializer):
     universal_item = UniversalItemSimpleSerializer(read_only=True)
     universal_item_id = serializers.PrimaryKeyRelatedField(queryset=UniversalItem.objects.all(), source='universal_item', write_only=True, required=False)
     cultures = CultureSimpleSerializer(many=True, read_only=True)
-    culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), many=True, source='cultures', write_only=True, required=False)
+    culture_ids = OwnedCulturesField(source='cultures')
     period = PeriodSimpleSerializer(read_only=True)
     period_id = serializers.PrimaryKeyRelatedField(queryset=Period.objects.all(), source='period', write_only=True, required=False)
 
@@ -430,13 +479,6 @@ class UserFilmSerializer(serializers.ModelSerializer):
                   'rewatch_count', 'watch_location', 'date_watched', 'poster', 'background_pic',
                   'seen', 'owned', 'watchlist', 'favourite', 'created_at', 'updated_at', 'period', 'period_id']
 
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
-        return value
-    
     def create(self, validated_data):
         cultures = validated_data.pop('cultures', [])
         instance = UserFilm.objects.create(**validated_data)
@@ -454,20 +496,13 @@ class UserFilmSerializer(serializers.ModelSerializer):
 
 class UserMusicPieceSerializer(serializers.ModelSerializer):
     cultures = CultureSimpleSerializer(many=True, read_only=True)
-    culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), many=True, source='cultures', write_only=True, required=False)
+    culture_ids = OwnedCulturesField(source='cultures')
 
     class Meta:
         model = UserMusicPiece
         fields = ['id', 'title', 'artist', 'instrument', 'recording', 'sheet_music', 'cultures', 'culture_ids', 'rating', 'notes', 'visibility',
                   'learned', 'release_year', 'created_at', 'updated_at']
 
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
-        return value
-    
     def create(self, validated_data):
         cultures = validated_data.pop('cultures', [])
         instance = UserMusicPiece.objects.create(**validated_data)
@@ -485,7 +520,7 @@ class UserMusicPieceSerializer(serializers.ModelSerializer):
     
 class UserMusicArtistSerializer(serializers.ModelSerializer):
     cultures = CultureSimpleSerializer(many=True, read_only=True)
-    culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), many=True, source='cultures', write_only=True, required=False)
+    culture_ids = OwnedCulturesField(source='cultures')
     
     class Meta:
         model = UserMusicArtist
@@ -493,13 +528,6 @@ class UserMusicArtistSerializer(serializers.ModelSerializer):
                   'favourite', 'name', 'bio', 'photo', 'external_links', 'year_active_start', 'year_active_end', 
                   'notable_works', 'ranking_tier', 'best_albums', 'best_songs', 'created_at', 'updated_at']
         
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
-        return value
-    
     def create(self, validated_data):
         cultures = validated_data.pop('cultures', [])
         instance = UserMusicArtist.objects.create(**validated_data)
@@ -515,11 +543,11 @@ class UserMusicArtistSerializer(serializers.ModelSerializer):
         instance.save()
         return instance
 
-class UserHistoryEventSerializer(serializers.ModelSerializer):
+class UserHistoryEventSerializer(NestedDateEstimateMixin, serializers.ModelSerializer):
     universal_item_id = serializers.PrimaryKeyRelatedField(queryset=UniversalItem.objects.all(), source='universal_item', write_only=True, required=False)
     cultures = CultureSimpleSerializer(many=True, read_only=True)
     period = PeriodSimpleSerializer(read_only=True)
-    culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), many=True, source='cultures', write_only=True, required=False)
+    culture_ids = OwnedCulturesField(source='cultures')
     period_id = serializers.PrimaryKeyRelatedField(queryset=Period.objects.all(), source='period', write_only=True, required=False)
     date = DateEstimateSerializer(required=False)
 
@@ -527,51 +555,17 @@ class UserHistoryEventSerializer(serializers.ModelSerializer):
         model = UserHistoryEvent
         fields = ['id', 'universal_item_id', 'cultures', 'culture_ids', 'rating', 'notes', 'visibility',
                   'importance_rank', 'created_at', 'sources', 'significance_level', 'period', 'period_id', 'created_at', 'updated_at',
-                  'title', 'alt_title', 'type', 'date', 'location', 'photo', 'summary']
+                  'title', 'alt_title', 'type', 'date', 'location', 'loc', 'photo', 'summary']
 
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
+    def validate_loc(self, value):
+        if value is not None and coordinates(value) is None:
+            raise serializers.ValidationError(LOC_ERROR)
         return value
     
-    def create(self, validated_data):
-        cultures = validated_data.pop('cultures', [])
-        date_data = validated_data.pop('date', None)
-        instance = UserHistoryEvent.objects.create(**validated_data)
-        instance.cultures.set(cultures)
-
-        if date_data:
-            date_instance = DateEstimate.objects.create(**date_data)
-            instance.date = date_instance
-            instance.save()
-
-        return instance
-
-    def update(self, instance, validated_data):
-        cultures = validated_data.pop('cultures', None)
-        date_data = validated_data.pop('date', None)
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        
-        if cultures is not None:
-            instance.cultures.set(cultures)
-            instance.save()
-        if date_data:
-            if instance.date:
-                for attr, value in date_data.items():
-                    setattr(instance.date, attr, value)
-                instance.date.save()
-            else:
-                instance.date = DateEstimate.objects.create(**date_data)
-                instance.save()
-        return instance
-    
 class UserMusicComposerSerializer(serializers.ModelSerializer):
     cultures = CultureSimpleSerializer(many=True, read_only=True)
     period = PeriodSimpleSerializer(read_only=True)
-    culture_ids = serializers.PrimaryKeyRelatedField(queryset=Culture.objects.all(), many=True, source='cultures', write_only=True, required=False)
+    culture_ids = OwnedCulturesField(source='cultures')
     period_id = serializers.PrimaryKeyRelatedField(queryset=Period.objects.all(), source='period', write_only=True, required=False)
 
     class Meta:
@@ -580,13 +574,6 @@ class UserMusicComposerSerializer(serializers.ModelSerializer):
                   'period', 'period_id', 'name', 'alt_name', 'occupations', 'birth_year', 'death_year',
                   'photo', 'summary', 'famous', 'themes', 'instruments']
 
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
-        return value
-    
     def create(self, validated_data):
         cultures = validated_data.pop('cultures', [])
         instance = UserMusicComposer.objects.create(**validated_data)
@@ -619,28 +606,19 @@ class RegisterSerializer(serializers.ModelSerializer):
         fields = ('username', 'email', 'password')
 
     def create(self, validated_data):
-        user = User.objects.create_user(
+        return register_user(
             username=validated_data['username'],
             email=validated_data['email'],
             password=validated_data['password']
         )
-        
-        Profile.objects.create(user=user)
-        
-        return user
     
 class ListSerializer(serializers.ModelSerializer):
-    culture_ids = serializers.PrimaryKeyRelatedField(
-        queryset=Culture.objects.all(),
-        many=True,
-        source='cultures',
-        write_only=True,
-        required=False
-    )
-    items = UniversalItemSerializer(many=True, read_only=True)
-    item_ids = serializers.PrimaryKeyRelatedField(
-        queryset=UniversalItem.objects.all(),
-        many=True,
+    culture_ids = OwnedCulturesField(source='cultures')
+    # In list order; querysets prefetch entries with list_entries_prefetch()
+    items = serializers.SerializerMethodField()
+    # Checked with one query in validate_item_ids
+    item_ids = serializers.ListField(
+        child=serializers.IntegerField(),
         source='items',
         write_only=True,
         required=False
@@ -651,13 +629,20 @@ class ListSerializer(serializers.ModelSerializer):
         fields = ['id', 'culture_ids', 'items', 'item_ids', 'name', 'description', 'visibility', 'created_at', 'updated_at', 'type']
         read_only_fields = ['created_at', 'updated_at']  # Ensure these are not writable
 
-    def validate_culture_ids(self, value):
-        user = self.context['request'].user
-        for culture in value:
-            if culture.user != user:
-                raise serializers.ValidationError("All cultures must belong to the authenticated user.")
+    def validate_item_ids(self, value):
+        found = set(UniversalItem.objects.filter(pk__in=value).values_list('pk', flat=True))
+        missing = [pk for pk in value if pk not in found]
+        if missing:
+            raise serializers.ValidationError(f'Invalid pk "{missing[0]}" - object does not exist.')
         return value
-    
+
+    def get_items(self, obj):
+        entries = obj.entries.all()
+        # Create/update responses: DRF drops the prefetch after saving
+        if "entries" not in getattr(obj, "_prefetched_objects_cache", {}):
+            entries = entries.select_related("item").order_by("position", "id")
+        return UniversalItemSerializer([entry.item for entry in entries], many=True).data
+
     def create(self, validated_data):
         cultures = validated_data.pop('cultures', [])
         items = validated_data.pop('items', [])
@@ -666,7 +651,7 @@ class ListSerializer(serializers.ModelSerializer):
         
         list_instance = List.objects.create(user=user, **validated_data)
         list_instance.cultures.set(cultures)
-        list_instance.items.set(items)
+        set_list_items(list_instance, items)
         return list_instance
     
     def update(self, instance, validated_data):
@@ -680,7 +665,7 @@ class ListSerializer(serializers.ModelSerializer):
         if cultures is not None:
             instance.cultures.set(cultures)
         if items is not None:
-            instance.items.set(items)
+            set_list_items(instance, items)
         
         instance.save()
         return instance
\ No newline at end of file
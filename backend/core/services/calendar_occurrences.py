@@ -0,0 +1,112 @@
+import datetime
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from ..calendars import occurrence_dates
+from ..models import CalendarDate, CalendarOccurrence, CalendarOccurrenceYear
+
+# Widest window (in calendar years) one occurrences request may span
+MAX_OCCURRENCE_YEARS = 5
+
+_DATE_FIELDS = ("id", "user_id", "calendar_date", "isAnnual", "reference_system")
+
+
+def _expand(rows, years_by_user):
+    occurrences = []
+    for pk, user_id, value, is_annual, reference_system in rows:
+        for year in years_by_user.get(user_id, ()):
+            for date in occurrence_dates(value, is_annual, reference_system, year):
+                occurrences.append(CalendarOccurrence(user_id=user_id, calendar_date_id=pk, year=year, date=date))
+    return occurrences
+
+
+def _lock_owners(user_ids):
+    """
+    Lock the owners' User rows until the transaction ends. Expanding a year
+    and refreshing an edited date of the same user then run one after the
+    other, so a date saved mid-expansion is either read by the expansion or
+    re-expanded by its refresh once the year marker is visible.
+    """
+    list(User.objects.select_for_update().filter(pk__in=user_ids).order_by("pk").values_list("pk", flat=True))
+
+
+def _missing_years(user_ids, years) -> set:
+    done = set(
+        CalendarOccurrenceYear.objects
+        .filter(user_id__in=user_ids, year__in=years)
+        .values_list("user_id", "year")
+    )
+    return {(user_id, year) for user_id in user_ids for year in years} - done
+
+
+def ensure_occurrences(user_ids, years):
+    """
+    Expand the calendar dates of every (user, year) pair not expanded yet:
+    one read of the year markers, one read of the users' dates and two bulk
+    inserts, however many users and years are missing.
+    """
+    user_ids, years = set(user_ids), set(years)
+    if not _missing_years(user_ids, years):
+        return
+
+    with transaction.atomic():
+        _lock_owners(user_ids)
+        # Again under the lock: another request may have expanded them meanwhile
+        missing = _missing_years(user_ids, years)
+        if not missing:
+            return
+        CalendarOccurrenceYear.objects.bulk_create(
+            [CalendarOccurrenceYear(user_id=user_id, year=year) for user_id, year in missing],
+            ignore_conflicts=True,
+        )
+
+        years_by_user = {}
+        for user_id, year in missing:
+            years_by_user.setdefault(user_id, []).append(year)
+        rows = (
+            CalendarDate.objects
+            .filter(user_id__in=years_by_user, calendar_date__isnull=False)
+            .filter(Q(isAnnual=True) | Q(calendar_date__year__in={year for _, year in missing}))
+            .values_list(*_DATE_FIELDS)
+            .order_by()
+        )
+        CalendarOccurrence.objects.bulk_create(
+            _expand(rows.iterator(chunk_size=2000), years_by_user), batch_size=2000, ignore_conflicts=True,
+        )
+
+
+def refresh_occurrences(calendar_date_ids):
+    """
+    Re-expand these calendar dates for every year already expanded for their
+    owners, so edits never leave the occurrence table stale.
+    """
+    calendar_date_ids = list(calendar_date_ids)
+    if not calendar_date_ids:
+        return
+    with transaction.atomic():
+        rows = list(CalendarDate.objects.filter(pk__in=calendar_date_ids).values_list(*_DATE_FIELDS))
+        owner_ids = {row[1] for row in rows}
+        _lock_owners(owner_ids)
+        years_by_user = {}
+        for user_id, year in CalendarOccurrenceYear.objects.filter(user_id__in=owner_ids).values_list("user_id", "year"):
+            years_by_user.setdefault(user_id, []).append(year)
+        CalendarOccurrence.objects.filter(calendar_date_id__in=calendar_date_ids).delete()
+        CalendarOccurrence.objects.bulk_create(_expand(rows, years_by_user), batch_size=2000, ignore_conflicts=True)
+
+
+def calendar_occurrences(calendar_dates, start: datetime.date, end: datetime.date):
+    """
+    Occurrences between `start` and `end` (inclusive) of the CalendarDate rows
+    in the `calendar_dates` queryset, ordered by date. Years not expanded yet
+    are expanded first; the rest is a (user, date) index range scan.
+    """
+    owner_ids = set(calendar_dates.order_by().values_list("user_id", flat=True).distinct())
+    if not owner_ids:
+        return CalendarOccurrence.objects.none()
+    ensure_occurrences(owner_ids, range(start.year, end.year + 1))
+    return (
+        CalendarOccurrence.objects
+        .filter(user_id__in=owner_ids, date__gte=start, date__lte=end)
+        .filter(calendar_date__in=calendar_dates.order_by().values("pk"))
+        .order_by("date", "calendar_date_id")
+    )
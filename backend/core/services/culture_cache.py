@@ -0,0 +1,68 @@
+import time
+from threading import Lock
+from typing import NamedTuple
+from ..models import Culture
+
+# Seconds before a worker re-reads a user's cultures even without a local
+# invalidation (saves made in other worker processes are picked up this way)
+CULTURE_CACHE_TTL = 300
+
+
+class ResolvedCulture(NamedTuple):
+    id: int
+    shared_group_key: str
+
+
+_cache: dict[int, tuple[float, dict[str, ResolvedCulture]]] = {}
+_lock = Lock()
+
+
+def _load(user_id: int) -> dict[str, ResolvedCulture]:
+    culture_map = {}
+    rows = Culture.objects.filter(user_id=user_id).values_list("code", "id", "shared_group_key").order_by("id")
+    for code, culture_id, group_key in rows:
+        culture_map.setdefault(code.lower(), ResolvedCulture(culture_id, group_key))
+    with _lock:
+        _cache[user_id] = (time.monotonic() + CULTURE_CACHE_TTL, culture_map)
+    return culture_map
+
+
+def get_culture_map(user) -> dict[str, ResolvedCulture]:
+    """Return the user's lower-cased code -> ResolvedCulture map."""
+    if not user or not user.is_authenticated:
+        return {}
+    entry = _cache.get(user.pk)
+    if entry is None or entry[0] < time.monotonic():
+        return _load(user.pk)
+    return entry[1]
+
+
+def resolve_culture(user, code: str | None) -> ResolvedCulture | None:
+    """
+    Resolve one of the user's culture codes (case-insensitively) to its id and
+    shared_group_key without touching the database on a warm cache.
+    """
+    if not code:
+        return None
+    key = code.lower()
+    resolved = get_culture_map(user).get(key)
+    if resolved is None and user.is_authenticated:
+        # The culture may have been created by another worker since we loaded
+        resolved = _load(user.pk).get(key)
+    return resolved
+
+
+def invalidate_user(user_id: int):
+    with _lock:
+        _cache.pop(user_id, None)
+
+
+def filter_by_culture(qs, user, code: str, field: str = "cultures"):
+    """
+    Filter `qs` to rows attached to the user's culture `code` through `field`
+    (an M2M or FK to Culture), comparing ids instead of joining on the code.
+    """
+    resolved = resolve_culture(user, code)
+    if resolved is None:
+        return qs.none()
+    return qs.filter(**{field: resolved.id})
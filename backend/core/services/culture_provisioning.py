@@ -0,0 +1,53 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from ..models import Culture, Category, PageContent, Profile, UserComposerSearch, UserMapPreferences
+
+# Template name -> display names of the categories a new culture starts with
+CULTURE_TEMPLATES = {
+    "default": ("Literature", "Film", "Music", "Cuisine", "History", "Calendar"),
+    "history": ("History", "Calendar"),
+    "arts": ("Literature", "Film", "Music"),
+    "empty": (),
+}
+
+DEFAULT_MAP_CENTER = {"lat": 0.0, "lng": 0.0}
+
+
+def template_categories(template) -> tuple[str, ...]:
+    """Category display names for a template name or an explicit sequence of names."""
+    if isinstance(template, str):
+        if template not in CULTURE_TEMPLATES:
+            raise ValueError(f"Unknown culture template '{template}'")
+        return CULTURE_TEMPLATES[template]
+    return tuple(dict.fromkeys(template))
+
+
+def provision_culture(user, template="default", **fields) -> Culture:
+    """
+    Create a culture together with its categories, one page per category,
+    the composer search and the map preferences.
+
+    Every table is written with a single INSERT, and the category PKs come
+    back from bulk_create, so the statement count stays the same however
+    many categories the template has.
+    """
+    names = template_categories(template)
+    with transaction.atomic():
+        culture = Culture.objects.create(user=user, **fields)
+        categories = Category.objects.bulk_create([
+            Category(culture=culture, key=name.lower(), display_name=name) for name in names
+        ])
+        PageContent.objects.bulk_create([
+            PageContent(culture=culture, category=category) for category in categories
+        ])
+        UserComposerSearch.objects.create(user=user, culture=culture)
+        UserMapPreferences.objects.create(user=user, culture=culture, center=dict(DEFAULT_MAP_CENTER))
+    return culture
+
+
+def register_user(username: str, email: str, password: str) -> User:
+    """Create a user and their profile in one transaction."""
+    with transaction.atomic():
+        user = User.objects.create_user(username=username, email=email, password=password)
+        Profile.objects.create(user=user)
+    return user
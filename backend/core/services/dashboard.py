@@ -0,0 +1,111 @@
+from django.db.models import F, Func, DateTimeField, IntegerField, OuterRef, Subquery
+from ..conditional import make_etag
+from .frontpage import build_book_frontpage, build_film_frontpage
+from .list_items import list_entries_prefetch
+from ..models import Book, Culture, Category, Period, PageContent, Film, List, UniversalItem, UserBook, UserFilm
+from ..serializers import CultureSerializer, PeriodSerializer, PageContentSerializer, ListSerializer
+
+# Category key -> List.type shown on that category's page
+LIST_TYPES = {
+    "film": "films",
+    "literature": "books",
+    "music": "music",
+    "history": "events",
+}
+
+# Category key -> (shelf builder, user tracking model feeding it,
+# catalog model whose rows the shelves embed, tracking model's related name)
+FRONTPAGES = {
+    "film": (build_film_frontpage, UserFilm, Film, "user_films"),
+    "literature": (build_book_frontpage, UserBook, Book, "user_books"),
+}
+
+
+def _latest(qs):
+    return Subquery(qs.order_by().values(v=Func(F("updated_at"), function="MAX", output_field=DateTimeField())))
+
+
+def _count(qs):
+    return Subquery(qs.order_by().values(v=Func(F("id"), function="COUNT", output_field=IntegerField())))
+
+
+def _sources(user, key: str) -> dict:
+    """
+    Querysets (correlated on the outer culture) that make up a dashboard,
+    including the catalog rows embedded in its lists and shelves, so a
+    title or poster edit changes the validator too.
+    """
+    culture = OuterRef("pk")
+    sources = {
+        "categories": Category.objects.filter(culture=culture),
+        "periods": Period.objects.filter(culture=culture, category__key=key),
+        "pages": PageContent.objects.filter(culture=culture, category__key=key),
+    }
+    if key in LIST_TYPES:
+        sources["lists"] = List.objects.filter(user=user, cultures=culture, type=LIST_TYPES[key])
+        sources["list_items"] = UniversalItem.objects.filter(
+            list_entries__list__user=user, list_entries__list__cultures=culture, list_entries__list__type=LIST_TYPES[key],
+        )
+    if key in FRONTPAGES:
+        _, tracking_model, catalog_model, related_name = FRONTPAGES[key]
+        sources["tracked"] = tracking_model.objects.filter(user=user, cultures=culture)
+        sources["shelved"] = catalog_model.objects.filter(
+            **{f"universal_item__{related_name}__user": user, f"universal_item__{related_name}__cultures": culture},
+        )
+    return sources
+
+
+def dashboard_etag(user, culture_id: int, key: str) -> str:
+    """
+    Compute the dashboard validator in a single query from the latest
+    updated_at and the row count of every section.
+    """
+    annotations = {"culture_updated": F("updated_at")}
+    for name, qs in _sources(user, key).items():
+        annotations[f"{name}_updated"] = _latest(qs)
+        annotations[f"{name}_count"] = _count(qs)
+
+    row = Culture.objects.filter(pk=culture_id).values(**annotations).first()
+    return make_etag(user.pk, culture_id, key, row)
+
+
+def build_culture_dashboard(request, culture_id: int, key: str) -> dict:
+    """
+    Everything a culture's category page needs in one payload: the culture,
+    its categories, the category's periods and page content, the matching
+    lists and, for film/literature, the frontpage shelves.
+    """
+    user = request.user
+    culture = Culture.objects.select_related("user").get(pk=culture_id)
+
+    periods = Period.objects.filter(culture_id=culture_id, category__key=key).order_by("start_year")
+    page_content = (
+        PageContent.objects.for_serializer(PageContentSerializer)
+        .filter(culture_id=culture_id, category__key=key)
+        .first()
+    )
+
+    data = {
+        "culture": CultureSerializer(culture).data,
+        "categories": list(
+            Category.objects.filter(culture_id=culture_id).values("id", "key", "display_name")
+        ),
+        "periods": PeriodSerializer(periods, many=True).data,
+        "page_content": PageContentSerializer(page_content).data if page_content else None,
+        "lists": [],
+        "frontpage": None,
+    }
+
+    if key in LIST_TYPES:
+        lists = (
+            List.objects
+            .filter(user=user, cultures=culture_id, type=LIST_TYPES[key])
+            .prefetch_related(list_entries_prefetch())
+            .order_by("-updated_at")
+        )
+        data["lists"] = ListSerializer(lists, many=True, context={"request": request}).data
+
+    if key in FRONTPAGES:
+        data["frontpage"] = FRONTPAGES[key][0](user, culture_id)
+
+    return data
@@ -0,0 +1,159 @@
+from django.db import transaction
+from ..names import normalize_name
+from ..models import Book, Film, Person, PersonSearchToken
+from ..response_cache import invalidate_catalog_model
+from .person_search import index_people
+
+# Models whose creator_string is resolved to the `creator` Person FK
+CREATOR_MODELS = {"book": Book, "film": Film}
+
+# Rows read per resolution batch
+RESOLUTION_BATCH_SIZE = 500
+
+# Normalized creator strings importers use when the creator is not known
+PLACEHOLDER_NAMES = {"unknown", "anonymous", "anon", "various", "various artists", "n a", "none"}
+
+
+def _match_score(name_tokens: set, person_tokens: set) -> int:
+    """2 for the same words in any order, 1 when one multi-word name contains the other, else 0."""
+    if name_tokens == person_tokens:
+        return 2
+    if min(len(name_tokens), len(person_tokens)) >= 2 and (name_tokens < person_tokens or person_tokens < name_tokens):
+        return 1
+    return 0
+
+
+def _field_fits(field: str, value) -> bool:
+    return value is None or len(value) <= Person._meta.get_field(field).max_length
+
+
+def _new_person(display_name: str, wikidata_id: str | None) -> Person | None:
+    """
+    An unsaved Person for a creator name, or None when the name can't become
+    one: single words (too ambiguous to create a record from) and names too
+    long for the name columns.
+    """
+    words = display_name.split()
+    if len(words) < 2:
+        return None
+    person = Person(given_name=" ".join(words[:-1]), family_name=words[-1], wikidata_id=wikidata_id or None)
+    if not all(_field_fits(field, getattr(person, field)) for field in ("given_name", "family_name")):
+        return None
+    if not _field_fits("wikidata_id", wikidata_id):
+        person.wikidata_id = None
+    # bulk_create skips save()
+    person.fill_derived_fields()
+    return person
+
+
+def resolve_people(names: dict, create: bool = True) -> tuple[dict, set, int]:
+    """
+    Resolve creator names ({raw name: wikidata id or None}) to Person ids.
+
+    A wikidata id match wins. Other names are blocked on their last word: one
+    query fetches every Person with that word in their search_name, and the
+    candidates are compared word by word with the accent-folded name.
+    Names with several equally good candidates are left unresolved; names
+    with none get a new Person when `create` is set, unless they are a
+    single word or too long for the name columns. Empty and placeholder
+    names ("Unknown") are never resolved.
+
+    Returns ({raw name: person id}, {ambiguous raw names}, number of people created).
+    """
+    keys = {}
+    for raw, wikidata_id in names.items():
+        normalized = normalize_name(raw)
+        if normalized and normalized not in PLACEHOLDER_NAMES:
+            key = keys.setdefault(normalized, {"raws": [], "display": raw.strip(), "wikidata_id": None})
+            key["raws"].append(raw)
+            key["wikidata_id"] = key["wikidata_id"] or wikidata_id
+
+    resolved = {}
+    wikidata_ids = {key["wikidata_id"] for key in keys.values() if key["wikidata_id"]}
+    by_wikidata = dict(Person.objects.filter(wikidata_id__in=wikidata_ids).values_list("wikidata_id", "pk")) if wikidata_ids else {}
+
+    blocks = {}
+    candidates = (
+        PersonSearchToken.objects
+        .filter(token__in={normalized.split()[-1] for normalized in keys})
+        .values_list("token", "person_id", "person__search_name")
+    )
+    for token, person_id, search_name in candidates:
+        blocks.setdefault(token, []).append((person_id, set(search_name.split())))
+
+    ambiguous, missing = set(), []
+    for normalized, key in keys.items():
+        person_id = by_wikidata.get(key["wikidata_id"])
+        if person_id is None:
+            tokens = set(normalized.split())
+            scored = [(_match_score(tokens, person_tokens), pk) for pk, person_tokens in blocks.get(normalized.split()[-1], [])]
+            best = max((score for score, _ in scored), default=0)
+            matches = {pk for score, pk in scored if score == best and best}
+            if len(matches) > 1:
+                ambiguous.update(key["raws"])
+                continue
+            person_id = matches.pop() if matches else None
+        if person_id is None:
+            missing.append(key)
+            continue
+        resolved.update(dict.fromkeys(key["raws"], person_id))
+
+    new = [(key, _new_person(key["display"], key["wikidata_id"])) for key in missing] if create else []
+    new = [(key, person) for key, person in new if person is not None]
+    if not new:
+        return resolved, ambiguous, 0
+    with transaction.atomic():
+        people = Person.objects.bulk_create([person for _, person in new])
+        index_people([person.pk for person in people])
+        # bulk_create sends no post_save, so cached Person responses are dropped here
+        invalidate_catalog_model("person")
+    for (key, _), person in zip(new, people):
+        resolved.update(dict.fromkeys(key["raws"], person.pk))
+    return resolved, ambiguous, len(people)
+
+
+def _link_rows(model, rows, wikidata_ids: dict, create: bool) -> tuple[dict, set, int]:
+    """Resolve (pk, creator_string) rows and write their creator ids with one bulk_update."""
+    resolved, ambiguous, created = resolve_people({name: wikidata_ids.get(name) for _, name in rows}, create=create)
+    linked = [model(pk=pk, creator_id=resolved[name]) for pk, name in rows if name in resolved]
+    model.objects.bulk_update(linked, ["creator"], batch_size=RESOLUTION_BATCH_SIZE)
+    if linked:
+        invalidate_catalog_model(model._meta.model_name)
+    return resolved, ambiguous, created
+
+
+def link_records(records, wikidata_ids: dict | None = None):
+    """Link freshly imported Book/Film instances (of one model) to their creators."""
+    records = [record for record in records if record.creator_id is None and record.creator_string]
+    if not records:
+        return
+    rows = [(record.pk, record.creator_string) for record in records]
+    resolved, _, _ = _link_rows(type(records[0]), rows, wikidata_ids or {}, create=True)
+    for record in records:
+        record.creator_id = resolved.get(record.creator_string)
+
+
+def link_creators(model, create: bool = True, batch_size: int = RESOLUTION_BATCH_SIZE) -> dict:
+    """
+    Set `creator` on every `model` row that only has a creator_string, in
+    batches of `batch_size` rows: one read, one resolve_people() and one
+    bulk_update per batch. Returns linked/created/ambiguous counts.
+    """
+    stats = {"linked": 0, "created": 0, "ambiguous": 0}
+    unlinked = (
+        model.objects
+        .filter(creator__isnull=True, creator_string__isnull=False)
+        .exclude(creator_string="")
+        .order_by("pk")
+        .values_list("pk", "creator_string")
+    )
+    last_pk = 0
+    while True:
+        rows = list(unlinked.filter(pk__gt=last_pk)[:batch_size])
+        if not rows:
+            return stats
+        last_pk = rows[-1][0]
+        resolved, ambiguous, created = _link_rows(model, rows, {}, create)
+        stats["linked"] += sum(1 for _, name in rows if name in resolved)
+        stats["ambiguous"] += sum(1 for _, name in rows if name in ambiguous)
+        stats["created"] += created
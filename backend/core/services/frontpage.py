@@ -0,0 +1,102 @@
+import random
+from ..fast_serializers import (
+    BOOK_SIMPLE, FILM_SIMPLE, USERBOOK_OVERLAY, USERFILM_OVERLAY,
+    attach_overlays, overlays, universal_item_id,
+)
+from ..models import Book, Film, UserBook, UserFilm
+
+
+def build_film_frontpage(user, culture_id: int) -> dict:
+    """
+    Build the watchlist / favourites / recent shelves (or a random fallback)
+    shown on a culture's film page, with the user's overlay for each film.
+    """
+    # All userfilms for that user/culture
+    userfilms = UserFilm.objects.filter(user=user, cultures=culture_id)
+
+    # Build the sets
+    watchlist_ids = list(userfilms.filter(watchlist=True)
+                         .values_list("universal_item_id", flat=True))
+    favourite_ids = list(userfilms.filter(favourite=True)
+                         .values_list("universal_item_id", flat=True))
+    recent_ids = list(userfilms.filter(seen=True, date_watched__isnull=False)
+                      .order_by("-date_watched")
+                      .values_list("universal_item_id", flat=True)[:10])
+
+    # Map universal_item IDs to film IDs
+    film_ids_map = dict(
+        Film.objects.filter(universal_item_id__in=(watchlist_ids + favourite_ids + recent_ids))
+        .values_list("universal_item_id", "id")
+    )
+
+    # Convert universal_item IDs to film IDs
+    watchlist_film_ids = [film_ids_map[uid] for uid in watchlist_ids if uid in film_ids_map]
+    favourite_film_ids = [film_ids_map[uid] for uid in favourite_ids if uid in film_ids_map]
+    recent_film_ids = [film_ids_map[uid] for uid in recent_ids if uid in film_ids_map]
+
+    # Random samples
+    result = {
+        "watchlist": FILM_SIMPLE.rows(Film.objects.filter(id__in=random.sample(watchlist_film_ids, min(5, len(watchlist_film_ids))))) if watchlist_film_ids else [],
+        "favourites": FILM_SIMPLE.rows(Film.objects.filter(id__in=favourite_film_ids[:5])) if favourite_film_ids else [],
+        "recent": FILM_SIMPLE.rows(Film.objects.filter(id__in=recent_film_ids)) if recent_film_ids else [],
+    }
+
+    # If empty, provide fallback
+    if not any(result.values()):
+        result["fallback"] = FILM_SIMPLE.rows(Film.objects.order_by("?")[:5])
+
+    # Overlay the user's tracking data on every film we're returning
+    item_ids = {universal_item_id(row) for rows in result.values() for row in rows}
+    userfilm_map = dict(overlays(userfilms.filter(universal_item_id__in=item_ids), USERFILM_OVERLAY))
+    for rows in result.values():
+        attach_overlays(rows, "userfilm", userfilm_map)
+
+    return result
+
+
+def build_book_frontpage(user, culture_id: int) -> dict:
+    """
+    Build the readlist / favourites / recent shelves (or a random fallback)
+    shown on a culture's literature page, with the user's overlay for each book.
+    """
+    # All userbooks for that user/culture
+    userbooks = UserBook.objects.filter(user=user, cultures=culture_id)
+
+    # Build the sets
+    readlist_ids = list(userbooks.filter(readlist=True)
+                        .values_list("universal_item_id", flat=True))
+    favourite_ids = list(userbooks.filter(favourite=True)
+                         .values_list("universal_item_id", flat=True))
+    recent_ids = list(userbooks.filter(read=True, date_finished__isnull=False)
+                      .order_by("-date_finished")
+                      .values_list("universal_item_id", flat=True)[:10])
+
+    # Map universal_item IDs to book IDs
+    book_ids_map = dict(
+        Book.objects.filter(universal_item_id__in=(readlist_ids + favourite_ids + recent_ids))
+        .values_list("universal_item_id", "id")
+    )
+
+    # Convert universal_item IDs to book IDs
+    readlist_book_ids = [book_ids_map[uid] for uid in readlist_ids if uid in book_ids_map]
+    favourite_book_ids = [book_ids_map[uid] for uid in favourite_ids if uid in book_ids_map]
+    recent_book_ids = [book_ids_map[uid] for uid in recent_ids if uid in book_ids_map]
+
+    # Random samples
+    result = {
+        "readlist": BOOK_SIMPLE.rows(Book.objects.filter(id__in=random.sample(readlist_book_ids, min(5, len(readlist_book_ids))))) if readlist_book_ids else [],
+        "favourites": BOOK_SIMPLE.rows(Book.objects.filter(id__in=favourite_book_ids[:5])) if favourite_book_ids else [],
+        "recent": BOOK_SIMPLE.rows(Book.objects.filter(id__in=recent_book_ids)) if recent_book_ids else [],
+    }
+
+    # If empty, provide fallback
+    if not any(result.values()):
+        result["fallback"] = BOOK_SIMPLE.rows(Book.objects.order_by("?")[:5])
+
+    # Overlay the user's tracking data on every book we're returning
+    item_ids = {universal_item_id(row) for rows in result.values() for row in rows}
+    userbook_map = dict(overlays(userbooks.filter(universal_item_id__in=item_ids), USERBOOK_OVERLAY))
+    for rows in result.values():
+        attach_overlays(rows, "userbook", userbook_map)
+
+    return result
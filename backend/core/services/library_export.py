@@ -0,0 +1,110 @@
+import csv
+import zlib
+from ..models import UserFilm, UserBook, UserMusicPiece, Recipe, CalendarDate, MapPin
+from ..renderers import dumps
+from ..serializers import (
+    UserFilmSerializer, UserBookSerializer, UserMusicPieceSerializer,
+    RecipeSerializer, CalendarDateSerializer, MapPinSerializer,
+)
+
+# Rows fetched per keyset-paginated query (and per prefetch batch)
+EXPORT_CHUNK_SIZE = 2000
+
+# Bytes of output gathered before a chunk is yielded
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+# Export type -> (model, serializer, select_related, prefetch_related)
+EXPORT_TYPES = {
+    "user_films": (UserFilm, UserFilmSerializer, ("universal_item", "period"), ("cultures",)),
+    "user_books": (UserBook, UserBookSerializer, (), ("cultures",)),
+    "music_pieces": (UserMusicPiece, UserMusicPieceSerializer, (), ("cultures",)),
+    "recipes": (Recipe, RecipeSerializer, (), ("cultures",)),
+    "calendar_dates": (CalendarDate, CalendarDateSerializer, ("person",), ("cultures",)),
+    "map_pins": (MapPin, MapPinSerializer, ("period", "date"), ("cultures",)),
+}
+
+
+def _rows(user, export_type: str):
+    """
+    Serialized rows of one export type, read in pk-ordered batches of
+    EXPORT_CHUNK_SIZE (keyset pagination, so no cursor is held open across
+    the pooled connection between batches).
+    """
+    model, serializer_class, select, prefetch = EXPORT_TYPES[export_type]
+    qs = model.objects.filter(user=user).select_related(*select).prefetch_related(*prefetch).order_by("pk")
+    if hasattr(qs, "for_serializer"):
+        qs = qs.for_serializer(serializer_class)
+
+    serializer = serializer_class()
+    last_pk = None
+    while True:
+        batch = list((qs if last_pk is None else qs.filter(pk__gt=last_pk))[:EXPORT_CHUNK_SIZE])
+        for obj in batch:
+            yield serializer.to_representation(obj)
+        if len(batch) < EXPORT_CHUNK_SIZE:
+            return
+        last_pk = batch[-1].pk
+
+
+def _buffered(pieces):
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= EXPORT_BUFFER_SIZE:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def iter_ndjson(user, export_types):
+    """
+    One JSON object per line: {"type": export type, "data": serialized row}.
+    The row is nested because some rows have a "type" field of their own.
+    """
+    def lines():
+        for export_type in export_types:
+            for row in _rows(user, export_type):
+                yield dumps({"type": export_type, "data": row}) + b"\n"
+    return _buffered(lines())
+
+
+class _Echo:
+    """File-like object whose write() hands the CSV line straight back."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return dumps(value).decode()
+    return value
+
+
+def iter_csv(user, export_type: str):
+    """One CSV table for a single export type; nested values are JSON-encoded."""
+    _, serializer_class, _, _ = EXPORT_TYPES[export_type]
+    columns = [name for name, field in serializer_class().fields.items() if not field.write_only]
+    writer = csv.writer(_Echo())
+
+    def lines():
+        yield writer.writerow(columns).encode()
+        for row in _rows(user, export_type):
+            yield writer.writerow([_csv_value(row.get(column)) for column in columns]).encode()
+    return _buffered(lines())
+
+
+def gzip_stream(chunks):
+    """Gzip-compress a byte stream incrementally."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
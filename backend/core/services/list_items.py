@@ -0,0 +1,136 @@
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
+from ..fast_serializers import BOOK_SIMPLE, FILM_SIMPLE, USERBOOK_OVERLAY, USERFILM_OVERLAY, overlays, universal_item_id
+from ..models import Book, Film, ListItem, UserBook, UserFilm
+
+# Items per /lists/{id}/items/ page by default, and at most
+LIST_PAGE_SIZE = 50
+LIST_MAX_PAGE_SIZE = 200
+
+# Item ids one membership lookup may ask about
+MEMBERSHIP_MAX_ITEMS = 500
+
+# Cover URLs per list in the ?summary=true index
+LIST_SUMMARY_COVERS = 4
+
+# UniversalItem.type values counted per list in the summary
+LIST_SUMMARY_TYPES = ("film", "book")
+
+LIST_SUMMARY_FIELDS = ("id", "name", "description", "visibility", "type", "created_at", "updated_at")
+
+
+def list_entries_prefetch():
+    """Prefetch of List.entries with their items, in list order."""
+    return Prefetch("entries", queryset=ListItem.objects.select_related("item").order_by("position", "id"))
+
+
+def set_list_items(list_obj, item_ids):
+    """
+    Make the list hold exactly `item_ids`, in that order. Items already in
+    the list keep their added_at; only changed positions are written.
+    """
+    item_ids = list(dict.fromkeys(item_ids))
+    existing = {entry.item_id: entry for entry in ListItem.objects.filter(list=list_obj).only("id", "item_id", "position")}
+    moved, added = [], []
+    for position, item_id in enumerate(item_ids):
+        entry = existing.pop(item_id, None)
+        if entry is None:
+            added.append(ListItem(list=list_obj, item_id=item_id, position=position))
+        elif entry.position != position:
+            entry.position = position
+            moved.append(entry)
+    with transaction.atomic():
+        if existing:
+            ListItem.objects.filter(pk__in=[entry.pk for entry in existing.values()]).delete()
+        ListItem.objects.bulk_update(moved, ["position"], batch_size=500)
+        ListItem.objects.bulk_create(added, batch_size=500)
+
+
+def _search_filter(q: str) -> Q:
+    match = Q(item__title__icontains=q)
+    for kind in ("film", "book"):
+        for field in ("title", "alt_title", "creator_string", "alt_creator_name"):
+            match |= Q(**{f"item__{kind}__{field}__icontains": q})
+    return match
+
+
+def list_item_page(list_obj, user, offset: int, limit: int, q: str | None = None) -> dict:
+    """
+    One page of a list in list order, optionally only the entries whose item
+    title or film/book title or creator matches `q`. Each entry carries its
+    film or book row (FilmSimple/BookSimple shape) and the user's
+    UserFilm/UserBook overlay, read with one query per kind for the whole page.
+    """
+    entries = ListItem.objects.filter(list=list_obj)
+    if q:
+        entries = entries.filter(_search_filter(q)).distinct()
+    page = list(
+        entries.order_by("position", "id")
+        .values_list("item_id", "position", "added_at", "item__title", "item__type")[offset:offset + limit]
+    )
+    item_ids = [item_id for item_id, *_ in page]
+
+    films = {universal_item_id(row): row for row in FILM_SIMPLE.rows(Film.objects.filter(universal_item_id__in=item_ids))}
+    books = {universal_item_id(row): row for row in BOOK_SIMPLE.rows(Book.objects.filter(universal_item_id__in=item_ids))}
+    userfilms, userbooks = {}, {}
+    if user.is_authenticated and films:
+        userfilms = dict(overlays(UserFilm.objects.filter(user=user, universal_item_id__in=films), USERFILM_OVERLAY + ("rating",)))
+    if user.is_authenticated and books:
+        userbooks = dict(overlays(UserBook.objects.filter(user=user, universal_item_id__in=books), USERBOOK_OVERLAY))
+
+    results = []
+    for item_id, position, added_at, title, item_type in page:
+        entry = {"id": item_id, "title": title, "type": item_type, "position": position, "added_at": added_at}
+        if item_id in films:
+            entry.update(film=films[item_id], userfilm=userfilms.get(item_id))
+        if item_id in books:
+            entry.update(book=books[item_id], userbook=userbooks.get(item_id))
+        results.append(entry)
+    return {"results": results, "total": entries.count(), "offset": offset, "limit": limit}
+
+
+def list_memberships(user, item_ids) -> dict:
+    """{item id: [ids of the user's lists containing it]} in one indexed query."""
+    memberships = {}
+    rows = ListItem.objects.filter(list__user=user, item_id__in=item_ids).order_by("item_id", "list_id").values_list("item_id", "list_id")
+    for item_id, list_id in rows:
+        memberships.setdefault(item_id, []).append(list_id)
+    return memberships
+
+
+def _entry_count(entries):
+    counted = entries.order_by().values("list").annotate(n=Count("pk")).values("n")
+    return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
+
+
+def list_summaries(qs) -> list[dict]:
+    """
+    Index rows for a List queryset, read in one query: the list's own fields,
+    its item count, per-type counts and the first LIST_SUMMARY_COVERS cover
+    URLs in list order. Every aggregate is a correlated subquery on the
+    (list, position) index and no entries are sent back. The cover lookups
+    stop at their LIMIT, but item_count and type_counts are COUNTs over all
+    of a list's entries, so their cost still grows with list size.
+    """
+    entries = ListItem.objects.filter(list=OuterRef("pk"))
+    with_cover = (
+        entries.annotate(cover=Coalesce("item__film__poster", "item__book__cover"))
+        .filter(cover__isnull=False)
+        .exclude(cover="")
+        .order_by("position", "id")
+        .values("cover")
+    )
+    annotations = {"item_count": _entry_count(entries)}
+    annotations.update({f"_type_{item_type}": _entry_count(entries.filter(item__type=item_type)) for item_type in LIST_SUMMARY_TYPES})
+    annotations.update({f"_cover_{i}": Subquery(with_cover[i:i + 1]) for i in range(LIST_SUMMARY_COVERS)})
+
+    columns = LIST_SUMMARY_FIELDS + ("item_count",)
+    types_end = len(columns) + len(LIST_SUMMARY_TYPES)
+    summaries = []
+    for values in qs.annotate(**annotations).values_list(*LIST_SUMMARY_FIELDS, *annotations):
+        row = dict(zip(columns, values))
+        row["type_counts"] = dict(zip(LIST_SUMMARY_TYPES, values[len(columns):types_end]))
+        row["covers"] = [cover for cover in values[types_end:] if cover]
+        summaries.append(row)
+    return summaries
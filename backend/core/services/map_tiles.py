@@ -0,0 +1,110 @@
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import CharField, F, Value
+from .culture_cache import filter_by_culture
+from .shared_content import shared_queryset
+from ..geo import MAX_TILE_ZOOM, bbox_filter, point_tile, tile_bounds
+from ..models import MapPin, UserHistoryEvent
+
+# Most features served in one tile
+TILE_FEATURE_LIMIT = 1000
+
+# Coordinate decimals kept in tile payloads (~0.1 m)
+TILE_COORD_DECIMALS = 6
+
+# kind -> (model, field shown as the feature's category)
+TILE_SOURCES = {
+    "pin": (MapPin, "filter"),
+    "event": (UserHistoryEvent, "type"),
+}
+
+
+def _version_key(z: int, x: int, y: int) -> str:
+    return f"tiles:v:{z}:{x}:{y}"
+
+
+def tile_version(z: int, x: int, y: int) -> str:
+    """Version token of one tile; replaced whenever a point inside it changes."""
+    key = _version_key(z, x, y)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_points(points):
+    """
+    Bump the tiles (at every zoom) containing any of the (lat, lng) points.
+    Only those tiles change version, so cached neighbours stay valid.
+    """
+    keys = {
+        _version_key(z, *point_tile(lat, lng, z))
+        for lat, lng in points if lat is not None and lng is not None
+        for z in range(MAX_TILE_ZOOM + 1)
+    }
+    if not keys:
+        return
+
+    def replace():
+        cache.set_many({key: uuid.uuid4().hex for key in keys}, None)
+
+    replace()
+    # Again once the write is visible, in case a concurrent request re-cached
+    # the old tile in between
+    transaction.on_commit(replace)
+
+
+def row_points(model, pks) -> list[tuple[float, float]]:
+    return list(model.objects.filter(pk__in=pks, lat__isnull=False).values_list("lat", "lng"))
+
+
+def _source(kind: str, user, code: str | None, shared: bool, bbox, z: int):
+    model, category = TILE_SOURCES[kind]
+    qs = model.objects.all()
+    if shared:
+        qs = shared_queryset(qs, user, code)
+    else:
+        qs = qs.filter(user=user)
+        if code:
+            qs = filter_by_culture(qs, user, code)
+    return (
+        qs.filter(bbox_filter(bbox, z))
+        .order_by()
+        .annotate(kind=Value(kind, output_field=CharField()), category=F(category))
+        .values_list("pk", "kind", "title", "category", "lat", "lng")
+    )
+
+
+def build_tile(user, z: int, x: int, y: int, code: str | None = None, shared: bool = False) -> dict:
+    """
+    GeoJSON FeatureCollection of the user's (or, with `shared`, other users'
+    public) map pins and located history events inside tile z/x/y, read with
+    one UNION ALL query.
+    """
+    bbox = tile_bounds(z, x, y)
+    pins, events = (_source(kind, user, code, shared, bbox, z) for kind in TILE_SOURCES)
+    rows = pins.union(events, all=True)[:TILE_FEATURE_LIMIT]
+    features = [
+        {
+            "type": "Feature",
+            "id": f"{kind}:{pk}",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [round(lng, TILE_COORD_DECIMALS), round(lat, TILE_COORD_DECIMALS)],
+            },
+            "properties": {"kind": kind, "id": pk, "title": title, "category": category},
+        }
+        for pk, kind, title, category, lat, lng in rows
+    ]
+    return {"type": "FeatureCollection", "features": features}
+
+
+def cached_tile(cache_key: str, build):
+    data = cache.get(cache_key)
+    if data is None:
+        data = build()
+        cache.set(cache_key, data, settings.MAP_TILE_CACHE_TIMEOUT)
+    return data
@@ -2,6 +2,7 @@ import requests
 import time
 from rest_framework.exceptions import ValidationError
 from ..models import Book, UserBook
+from .entity_resolution import link_records
 
 OL_BASE_URL = "https://openlibrary.org"
 OL_SEARCH_URL = f"{OL_BASE_URL}/search.json"
@@ -54,6 +55,7 @@ def fetch_info_from_olid(ol_id: str, date: str = None):
     # Fetch author
     author_name = ""
     alt_creator_name = ""
+    author_wikidata_id = None
     if work.get("authors"):
         first_author_key = work["authors"][0]["author"]["key"]
         author_url = f"{OL_BASE_URL}{first_author_key}.json"
@@ -63,6 +65,7 @@ def fetch_info_from_olid(ol_id: str, date: str = None):
             author = author_response.json()
             author_name = author.get("name", "")
             alt_creator_name = author.get("personal_name") if author.get("personal_name") != author_name else ""
+            author_wikidata_id = (author.get("remote_ids") or {}).get("wikidata")
 
     # Description handling (can be str or dict)
     desc = work.get("description", "")
@@ -88,6 +91,7 @@ def fetch_info_from_olid(ol_id: str, date: str = None):
         "alt_title": work.get("subtitle", ""),
         "creator_string": author_name,
         "alt_creator_name": alt_creator_name,
+        "creator_wikidata_id": author_wikidata_id,
         "genre": [s for s in work.get("subjects", []) if isinstance(s, str) and len(s) < 50 and "book" not in s.lower()],
         "synopsis": desc,
         "cover": cover,
@@ -101,6 +105,7 @@ def create_book_from_openlibrary(ol_id: str, date: str = None):
     """
     data = fetch_info_from_olid(ol_id, date)
     book, created = Book.create_with_universal_item(data)
+    link_records([book], {data["creator_string"]: data.get("creator_wikidata_id")})
     return book
 
 def fetch_book_by_isbn(isbn: str) -> dict:
@@ -0,0 +1,56 @@
+from functools import reduce
+from operator import add, or_
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Max, Q, Value, When
+from ..names import MAX_TOKEN_LENGTH, name_tokens
+from ..models import Person, PersonSearchToken
+
+# Query words beyond this are ignored
+MAX_QUERY_TOKENS = 6
+
+
+def search_tokens(search_name: str) -> list[str]:
+    return list(dict.fromkeys(token[:MAX_TOKEN_LENGTH] for token in search_name.split()))
+
+
+def index_people(person_ids):
+    """
+    Rebuild the search tokens of these people from their search_name: one
+    read, one delete and one bulk insert.
+    """
+    person_ids = list(person_ids)
+    if not person_ids:
+        return
+    rows = Person.objects.filter(pk__in=person_ids).values_list("pk", "search_name")
+    tokens = [PersonSearchToken(person_id=pk, token=token) for pk, search_name in rows for token in search_tokens(search_name)]
+    with transaction.atomic():
+        PersonSearchToken.objects.filter(person_id__in=person_ids).delete()
+        PersonSearchToken.objects.bulk_create(tokens, batch_size=2000)
+
+
+def search_people(qs, query: str):
+    """
+    Narrow a Person queryset to people matching every word of `query`, in any
+    order, ignoring case and accents ("dvorak" finds Dvořák, "saens camille"
+    finds Saint-Saëns). A query word matches a name word it is a prefix of;
+    whole-word and whole-name matches rank higher. Ordered by `search_rank`.
+    """
+    tokens = name_tokens(query)[:MAX_QUERY_TOKENS]
+    if not tokens:
+        return qs.none()
+
+    # One join on the token table, restricted to words any query word prefixes
+    qs = qs.filter(reduce(or_, [Q(search_tokens__token__startswith=token) for token in tokens]))
+    matches = {
+        f"_match_{i}": Max(Case(
+            When(search_tokens__token=token, then=Value(2)),
+            When(search_tokens__token__startswith=token, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        ))
+        for i, token in enumerate(tokens)
+    }
+    qs = qs.annotate(**matches).filter(**{f"{name}__gt": 0 for name in matches})
+    exact_name = Case(When(search_name=" ".join(tokens), then=Value(2 * len(tokens))), default=Value(0), output_field=IntegerField())
+    rank = reduce(add, [F(name) for name in matches]) + exact_name
+    return qs.annotate(search_rank=rank).order_by("-search_rank", "family_name", "given_name")
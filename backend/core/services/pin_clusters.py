@@ -0,0 +1,232 @@
+import threading
+from functools import reduce
+from operator import or_
+from django.db import transaction
+from django.db.models import F, FloatField, Q, Sum
+from ..geo import zoom_precision
+from ..models import MapPin, MapPinCluster, Visibility
+
+# Geohash precisions clusters are kept for (~5000 km down to ~150 m cells).
+# Beyond the finest level the map asks for raw pins with ?bbox= instead.
+CLUSTER_PRECISIONS = range(1, 8)
+
+# Most cluster rows returned by one request
+CLUSTER_LIMIT = 2000
+
+_pending = threading.local()
+
+
+def cluster_precision(zoom: int) -> int:
+    return min(zoom_precision(zoom), CLUSTER_PRECISIONS[-1])
+
+
+def _aggregate(entries, precision: int) -> list[tuple]:
+    """
+    Merge (culture_id, visibility, cell, count, lat, lng, pin) entries into
+    the cells of `precision` containing them, where `pin` is a (pk, lat, lng)
+    representative. A merged cell's centroid is the count-weighted mean and
+    its representative the entry pin nearest to it.
+    """
+    cells = {}
+    for culture_id, visibility, cell, count, lat, lng, pin in entries:
+        key = (culture_id, visibility, cell[:precision])
+        current = cells.get(key)
+        if current is None:
+            current = cells[key] = [0, 0.0, 0.0, []]
+        current[0] += count
+        current[1] += lat * count
+        current[2] += lng * count
+        current[3].append(pin)
+
+    merged = []
+    for (culture_id, visibility, cell), (count, lat_sum, lng_sum, pins) in cells.items():
+        lat, lng = lat_sum / count, lng_sum / count
+        nearest = min(pins, key=lambda pin: (pin[1] - lat) ** 2 + (pin[2] - lng) ** 2)
+        merged.append((culture_id, visibility, cell, count, lat, lng, nearest))
+    return merged
+
+
+def _pin_entries(rows):
+    for culture_id, pk, visibility, geohash, lat, lng in rows:
+        yield culture_id, visibility, geohash, 1, lat, lng, (pk, lat, lng)
+
+
+def _cluster_entries(rows):
+    for culture_id, visibility, cell, count, lat, lng, pin_id, pin_lat, pin_lng in rows:
+        # A cluster whose pin was deleted stands in with its own centroid
+        pin = (pin_id, pin_lat, pin_lng) if pin_lat is not None else (pin_id, lat, lng)
+        yield culture_id, visibility, cell, count, lat, lng, pin
+
+
+def _cluster(cluster_model, precision: int, entry):
+    culture_id, visibility, cell, count, lat, lng, pin = entry
+    return cluster_model(
+        culture_id=culture_id, precision=precision, visibility=visibility, cell=cell,
+        count=count, lat=lat, lng=lng, pin_id=pin[0],
+    )
+
+
+def rebuild_clusters(culture_ids):
+    """
+    Recompute every cluster of the given cultures: the finest level from
+    their pins, each coarser level from the level below. One read, one
+    delete and one bulk insert however many pins and levels there are.
+    """
+    culture_ids = list(culture_ids)
+    if not culture_ids:
+        return
+    rows = (
+        MapPin.objects.filter(cultures__in=culture_ids, lat__isnull=False)
+        .exclude(geohash="")
+        .values_list("cultures", "id", "visibility", "geohash", "lat", "lng")
+        .order_by()
+    )
+    clusters = []
+    level = _pin_entries(rows.iterator(chunk_size=2000))
+    for precision in reversed(CLUSTER_PRECISIONS):
+        level = _aggregate(level, precision)
+        clusters.extend(_cluster(MapPinCluster, precision, entry) for entry in level)
+    with transaction.atomic():
+        MapPinCluster.objects.filter(culture_id__in=culture_ids).delete()
+        MapPinCluster.objects.bulk_create(clusters, batch_size=2000)
+
+
+def _cells_filter(cells, culture="culture_id", cell="cell", lookup="in") -> Q:
+    """Q matching the given (culture_id, visibility, cell) cells, grouped per culture and visibility."""
+    groups = {}
+    for culture_id, visibility, key in cells:
+        groups.setdefault((culture_id, visibility), set()).add(key)
+    return reduce(or_, [
+        Q(**{culture: culture_id, "visibility": visibility})
+        & (Q(**{f"{cell}__in": keys}) if lookup == "in" else reduce(or_, [Q(**{f"{cell}__startswith": key}) for key in keys]))
+        for (culture_id, visibility), keys in groups.items()
+    ])
+
+
+def refresh_cells(cells):
+    """
+    Update only the clusters containing the given (culture_id, visibility,
+    geohash) points, e.g. a pin's position before and after an edit. The
+    finest cells are recounted from their pins and every coarser cell from
+    its (at most 32) child clusters, so the cost does not depend on how many
+    pins the culture has.
+    """
+    finest = CLUSTER_PRECISIONS[-1]
+    dirty = {(culture_id, visibility, geohash[:finest]) for culture_id, visibility, geohash in cells if geohash}
+    if not dirty:
+        return
+    rows = (
+        MapPin.objects.filter(_cells_filter(dirty, "cultures", "geohash", "startswith"), lat__isnull=False)
+        .values_list("cultures", "id", "visibility", "geohash", "lat", "lng")
+        .order_by()
+    )
+    with transaction.atomic():
+        level = [entry for entry in _aggregate(_pin_entries(rows), finest) if entry[:3] in dirty]
+        for precision in reversed(CLUSTER_PRECISIONS):
+            if precision < finest:
+                dirty = {(culture_id, visibility, cell[:precision]) for culture_id, visibility, cell in dirty}
+                children = (
+                    MapPinCluster.objects.filter(_cells_filter(dirty, lookup="startswith"), precision=precision + 1)
+                    .values_list("culture_id", "visibility", "cell", "count", "lat", "lng", "pin_id", "pin__lat", "pin__lng")
+                )
+                level = _aggregate(_cluster_entries(children), precision)
+            MapPinCluster.objects.filter(_cells_filter(dirty), precision=precision).delete()
+            MapPinCluster.objects.bulk_create([_cluster(MapPinCluster, precision, entry) for entry in level])
+
+
+def _flush():
+    culture_ids = getattr(_pending, "culture_ids", set())
+    cells = getattr(_pending, "cells", set())
+    _pending.culture_ids, _pending.cells = set(), set()
+    rebuild_clusters(culture_ids)
+    refresh_cells({cell for cell in cells if cell[0] not in culture_ids})
+
+
+def _schedule(name: str, values: set):
+    pending = getattr(_pending, name, None)
+    if pending is None:
+        pending = set()
+        setattr(_pending, name, pending)
+    pending |= values
+    # Every call registers a flush; the first one to run drains the sets
+    transaction.on_commit(_flush)
+
+
+def schedule_cluster_refresh(culture_ids):
+    """
+    Rebuild all clusters of these cultures once the current transaction
+    commits (used by bulk writes). Cultures scheduled several times in one
+    transaction are rebuilt once.
+    """
+    culture_ids = {pk for pk in culture_ids if pk is not None}
+    if culture_ids:
+        _schedule("culture_ids", culture_ids)
+
+
+def schedule_cell_refresh(cells):
+    """Refresh the clusters containing these (culture_id, visibility, geohash) points on commit."""
+    cells = {cell for cell in cells if cell[0] is not None and cell[2]}
+    if cells:
+        _schedule("cells", cells)
+
+
+def pin_cells(pin_ids) -> set[tuple]:
+    """(culture_id, visibility, geohash) of every culture of the given located pins."""
+    return set(
+        MapPin.cultures.through.objects
+        .filter(mappin_id__in=pin_ids, mappin__lat__isnull=False)
+        .exclude(mappin__geohash="")
+        .values_list("culture_id", "mappin__visibility", "mappin__geohash")
+    )
+
+
+def pin_cultures(pin_ids) -> set[int]:
+    return set(MapPin.cultures.through.objects.filter(mappin_id__in=pin_ids).values_list("culture_id", flat=True))
+
+
+def map_clusters(user, zoom: int, culture_id: int | None = None, group_key: str | None = None,
+                 shared: bool = False, bbox=None) -> dict:
+    """
+    Clusters visible at `zoom`: the user's own pins of one culture, or with
+    `shared` the public pins other users filed under cultures of the
+    `group_key` (or any group when None). Rows of the same cell (private and
+    public pins, several cultures) are merged into one cluster; a pin filed
+    under several shared cultures is counted once per culture.
+    """
+    precision = cluster_precision(zoom)
+    qs = MapPinCluster.objects.filter(precision=precision)
+    if shared:
+        qs = qs.filter(visibility=Visibility.PUBLIC).exclude(culture__user=user)
+        if group_key:
+            qs = qs.filter(culture__shared_group_key=group_key)
+    else:
+        qs = qs.filter(culture_id=culture_id)
+    if bbox:
+        west, south, east, north = bbox
+        qs = qs.filter(lat__gte=south, lat__lte=north)
+        qs = qs.filter(lng__gte=west, lng__lte=east) if west <= east else qs.exclude(lng__gt=east, lng__lt=west)
+
+    # Merged per cell in SQL, so the limit keeps whole cells: the largest ones
+    totals = (
+        qs.order_by().values("cell")
+        .annotate(
+            total=Sum("count"),
+            lat_sum=Sum(F("lat") * F("count"), output_field=FloatField()),
+            lng_sum=Sum(F("lng") * F("count"), output_field=FloatField()),
+        )
+        .order_by("-total", "cell")
+        .values_list("cell", "total", "lat_sum", "lng_sum")[:CLUSTER_LIMIT]
+    )
+    clusters = {
+        cell: {"cell": cell, "count": total, "lat": lat_sum / total, "lng": lng_sum / total, "pin": None}
+        for cell, total, lat_sum, lng_sum in totals
+    }
+
+    # Each cell is represented by the pin of its largest row
+    pins = qs.filter(cell__in=clusters).order_by("cell", "-count", "pin_id").values_list("cell", "pin_id", "pin__title")
+    for cell, pin_id, pin_title in pins:
+        if clusters[cell]["pin"] is None:
+            clusters[cell]["pin"] = {"id": pin_id, "title": pin_title}
+
+    clusters = sorted(clusters.values(), key=lambda cluster: cluster["cell"])
+    return {"precision": precision, "max_precision": CLUSTER_PRECISIONS[-1], "clusters": clusters}
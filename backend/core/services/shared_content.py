@@ -0,0 +1,113 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from .culture_cache import resolve_culture
+from ..models import (
+    Recipe, LangLesson, CalendarDate, MapPin, UserBook, UserFilm, UserMusicPiece,
+    UserMusicArtist, UserHistoryEvent, UserMusicComposer, UserMapPreferences, List,
+    SharedGroupEntry, Visibility
+)
+
+# Models with a `cultures` M2M that are mirrored into SharedGroupEntry
+SHARED_MODELS = (
+    Recipe, LangLesson, CalendarDate, MapPin, UserBook, UserFilm, UserMusicPiece,
+    UserMusicArtist, UserHistoryEvent, UserMusicComposer, List,
+)
+
+
+def get_group_key(user, code: str) -> str | None:
+    """
+    Return the shared_group_key of the user's culture `code`, or None if the
+    user has no such culture.
+    """
+    resolved = resolve_culture(user, code)
+    return resolved.shared_group_key if resolved else None
+
+
+def shared_queryset(qs, user, code: str | None = None):
+    """
+    Narrow `qs` to public content owned by other users. When `code` is given,
+    only content in the same shared group as the user's culture is kept.
+
+    Items are matched through SharedGroupEntry with a `pk IN (...)` semi-join,
+    so the result never contains duplicates and needs no DISTINCT.
+    """
+    model = qs.model
+
+    # Map preferences hang off a single culture, so the group lives on the FK
+    if model is UserMapPreferences:
+        qs = qs.filter(culture__visibility=Visibility.PUBLIC).exclude(culture__user=user)
+        if not code:
+            return qs
+        group_key = get_group_key(user, code)
+        if group_key is None:
+            return qs.none()
+        return qs.filter(culture__shared_group_key=group_key)
+
+    qs = qs.filter(visibility=Visibility.PUBLIC).exclude(user=user)
+    if not code:
+        return qs
+
+    group_key = get_group_key(user, code)
+    if group_key is None:
+        return qs.none()
+
+    entries = SharedGroupEntry.objects.filter(
+        content_type=ContentType.objects.get_for_model(model),
+        shared_group_key=group_key,
+    ).values("object_id")
+    return qs.filter(pk__in=entries)
+
+
+def _cultures_field(model):
+    return model._meta.get_field("cultures")
+
+
+def sync_shared_entries(model, ids):
+    """
+    Rebuild the SharedGroupEntry rows of the given items from their
+    `cultures` through table.
+    """
+    ids = [pk for pk in ids if pk is not None]
+    if not ids:
+        return
+
+    content_type = ContentType.objects.get_for_model(model)
+    field = _cultures_field(model)
+    item_name = field.m2m_field_name()
+    culture_name = field.m2m_reverse_field_name()
+
+    rows = field.remote_field.through.objects.filter(
+        **{f"{item_name}_id__in": ids}
+    ).values_list(
+        f"{item_name}_id", f"{culture_name}_id",
+        f"{culture_name}__shared_group_key", f"{item_name}__user_id",
+    )
+
+    with transaction.atomic():
+        SharedGroupEntry.objects.filter(content_type=content_type, object_id__in=ids).delete()
+        SharedGroupEntry.objects.bulk_create([
+            SharedGroupEntry(
+                content_type=content_type,
+                object_id=object_id,
+                culture_id=culture_id,
+                shared_group_key=group_key,
+                user_id=user_id,
+            ) for object_id, culture_id, group_key, user_id in rows
+        ])
+
+
+def remove_shared_entries(model, ids, culture=None):
+    """Drop the SharedGroupEntry rows of deleted items (or of one culture)."""
+    qs = SharedGroupEntry.objects.filter(content_type=ContentType.objects.get_for_model(model))
+    if ids is not None:
+        qs = qs.filter(object_id__in=ids)
+    if culture is not None:
+        qs = qs.filter(culture=culture)
+    qs.delete()
+
+
+def update_group_key(culture):
+    """Propagate a culture's shared_group_key to its index rows."""
+    SharedGroupEntry.objects.filter(culture=culture).exclude(
+        shared_group_key=culture.shared_group_key
+    ).update(shared_group_key=culture.shared_group_key)
@@ -0,0 +1,90 @@
+from django.db.models import BooleanField, CharField, F, Func, Value
+from django.db.models.functions import Coalesce, ExtractYear
+from ..models import Period, UserBook, UserFilm, UserHistoryEvent, UserMusicComposer, MapPin
+
+# Upper bound on rows returned by one timeline query
+TIMELINE_LIMIT = 2000
+
+
+class SpanOverlaps(Func):
+    """
+    True when the closed year span [start, end] overlaps [lo, hi].
+
+    On PostgreSQL this compiles to an int4range && int4range test that matches
+    the GiST expression indexes created in migration 0062. Elsewhere it is a
+    plain `start <= hi AND end >= lo`, which a composite (start, end) B-tree
+    index answers with a range scan on start.
+    """
+    output_field = BooleanField()
+    conditional = True
+
+    def __init__(self, start, end, lo: int, hi: int):
+        start = F(start) if isinstance(start, str) else start
+        end = F(end) if isinstance(end, str) else end
+        super().__init__(start, end, Value(lo), Value(hi))
+
+    def _compile(self, compiler, connection):
+        compiled = [compiler.compile(expression) for expression in self.get_source_expressions()]
+        return [sql for sql, _ in compiled], [params for _, params in compiled]
+
+    def as_sql(self, compiler, connection, **extra_context):
+        (start, end, lo, hi), (p_start, p_end, p_lo, p_hi) = self._compile(compiler, connection)
+        return f"({start} <= {hi} AND {end} >= {lo})", (*p_start, *p_hi, *p_end, *p_lo)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        (start, end, lo, hi), (p_start, p_end, p_lo, p_hi) = self._compile(compiler, connection)
+        # Same expression as the partial GiST indexes (LEAST/GREATEST guard reversed spans)
+        sql = (
+            f"({start} IS NOT NULL AND "
+            f"int4range(LEAST({start}, {end}), GREATEST({start}, {end}), '[]') && int4range({lo}, {hi}, '[]'))"
+        )
+        return sql, (*p_start, *p_start, *p_end, *p_start, *p_end, *p_lo, *p_hi)
+
+
+_RELEASE_YEAR = ExtractYear("universal_item__film__release_date")
+
+# kind -> (model, title, span start, span end, culture filter)
+TIMELINE_KINDS = {
+    "period": (Period, F("title"), F("start_year"), F("end_year"), "culture"),
+    "film": (UserFilm, F("universal_item__title"),
+             Coalesce(F("universal_item__film__date__start_year"), _RELEASE_YEAR),
+             Coalesce(F("universal_item__film__date__end_year"), _RELEASE_YEAR), "cultures"),
+    "book": (UserBook, F("universal_item__title"),
+             F("universal_item__book__date__start_year"), F("universal_item__book__date__end_year"), "cultures"),
+    "event": (UserHistoryEvent, F("title"), F("date__start_year"), F("date__end_year"), "cultures"),
+    "composer": (UserMusicComposer, F("name"), F("birth_year"), Coalesce(F("death_year"), F("birth_year")), "cultures"),
+    "pin": (MapPin, F("title"), F("date__start_year"), F("date__end_year"), "cultures"),
+}
+
+
+def _kind_queryset(kind: str, user, culture_id: int, start: int, end: int):
+    model, title, span_start, span_end, culture_field = TIMELINE_KINDS[kind]
+    qs = model.objects.filter(**{culture_field: culture_id})
+    if model is not Period:
+        qs = qs.filter(user=user)
+    return (
+        qs.filter(SpanOverlaps(span_start.copy(), span_end.copy(), start, end))
+        .order_by()
+        .annotate(
+            kind=Value(kind, output_field=CharField()),
+            label=title.copy(),
+            span_start=span_start.copy(),
+            span_end=span_end.copy(),
+        )
+        .values_list("pk", "kind", "label", "span_start", "span_end")
+    )
+
+
+def timeline_entries(user, culture_id: int, start: int, end: int, kinds=None) -> list[dict]:
+    """
+    Everything of the user's culture whose year span overlaps [start, end]:
+    periods, tracked films and books, history events, composers and map pins.
+    The per-kind queries are combined with UNION ALL into one round trip.
+    """
+    querysets = [_kind_queryset(kind, user, culture_id, start, end) for kind in (kinds or TIMELINE_KINDS)]
+    combined = querysets[0].union(*querysets[1:], all=True) if len(querysets) > 1 else querysets[0]
+    rows = combined.order_by("span_start", "span_end")[:TIMELINE_LIMIT]
+    return [
+        {"kind": kind, "id": pk, "title": label, "start_year": span_start, "end_year": span_end}
+        for pk, kind, label, span_start, span_end in rows
+    ]
@@ -2,6 +2,7 @@ import time
 import requests
 from django.conf import settings
 from ..models import Film
+from .entity_resolution import link_records
 from rest_framework.exceptions import ValidationError
 
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
@@ -75,7 +76,7 @@ def import_films_from_list(lines: list[str]) -> list[dict]:
     Import films from a list of TMDb IDs or titles, respecting API rate limits.
     Returns a list of import results with status.
     """
-    imported = []
+    imported, films = [], []
     for line in lines:
         query = line.strip()
         if not query:
@@ -85,6 +86,7 @@ def import_films_from_list(lines: list[str]) -> list[dict]:
             data = fetch_tmdb_data(query)
             if data:
                 film, created = Film.create_with_universal_item(data)
+                films.append(film)
                 imported.append({
                     "title": film.title,
                     "tmdb_id": film.tmdb_id,
@@ -108,4 +110,6 @@ def import_films_from_list(lines: list[str]) -> list[dict]:
             })
         time.sleep(0.25)
 
+    # Directors of the whole list are resolved in one batch
+    link_records(films)
     return imported
\ No newline at end of file
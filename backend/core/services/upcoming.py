@@ -0,0 +1,74 @@
+import calendar
+import datetime
+from django.db.models import Q
+from ..calendars import annual_dates, month_day_key
+from ..models import CalendarDate, UserHistoryEvent
+from .calendar_occurrences import calendar_occurrences
+
+# Longest window one upcoming request may cover
+UPCOMING_MAX_DAYS = 90
+
+
+def month_day_filter(field: str, start: datetime.date, end: datetime.date) -> Q:
+    """
+    Q matching MMDD keys in `field` between `start` and `end` (at most a year
+    apart). A window that crosses New Year becomes two range scans of the
+    same index. Annual 29 February dates fall on 28 February in common years,
+    so such a window also takes 0229.
+    """
+    lo, hi = month_day_key(start), month_day_key(end)
+    if hi == 228 and not calendar.isleap(end.year):
+        hi = 229
+    if lo <= hi:
+        return Q(**{f"{field}__gte": lo, f"{field}__lte": hi})
+    return Q(**{f"{field}__gte": lo}) | Q(**{f"{field}__lte": hi})
+
+
+def _anniversary(value: datetime.date, start: datetime.date, end: datetime.date) -> datetime.date | None:
+    for year in range(start.year, end.year + 1):
+        for date in annual_dates(value, "gregorian", year):
+            if start <= date <= end:
+                return date
+    return None
+
+
+def upcoming_entries(user, culture_id: int, start: datetime.date, days: int) -> list[dict]:
+    """
+    Holidays and history events of the user's culture falling in the `days`
+    days from `start`: annual Gregorian holidays and day-precise events by
+    their month/day key whatever their year, dated holidays in the window,
+    and annual Islamic/Egyptian holidays through the occurrence table.
+    """
+    end = start + datetime.timedelta(days=days)
+    entries = []
+
+    holidays = CalendarDate.objects.filter(user=user, cultures=culture_id)
+    gregorian = (
+        holidays
+        .filter(month_day_filter("month_day", start, end))
+        .filter(Q(isAnnual=True, reference_system="gregorian") | Q(isAnnual=False, calendar_date__gte=start, calendar_date__lte=end))
+        .values_list("pk", "holiday_name", "calendar_date", "isAnnual")
+    )
+    for pk, name, value, is_annual in gregorian:
+        date = _anniversary(value, start, end) if is_annual else value
+        entries.append({"kind": "holiday", "id": pk, "title": name, "date": date, "year": value.year})
+
+    converted = calendar_occurrences(
+        holidays.filter(isAnnual=True).exclude(reference_system="gregorian"), start, end,
+    ).values_list("calendar_date_id", "calendar_date__holiday_name", "date", "calendar_date__calendar_date")
+    for pk, name, date, value in converted:
+        entries.append({"kind": "holiday", "id": pk, "title": name, "date": date, "year": value.year})
+
+    events = (
+        UserHistoryEvent.objects
+        .filter(user=user, cultures=culture_id)
+        .filter(month_day_filter("date__month_day", start, end))
+        .values_list("pk", "title", "date__date")
+    )
+    for pk, title, value in events:
+        entries.append({"kind": "event", "id": pk, "title": title, "date": _anniversary(value, start, end), "year": value.year})
+
+    for entry in entries:
+        entry["years_ago"] = entry["date"].year - entry["year"]
+    entries.sort(key=lambda entry: (entry["date"], entry["kind"], entry["title"]))
+    return entries
@@ -0,0 +1,182 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from .models import CalendarDate, Culture, DateEstimate, Film, Book, MapPin, Person, UniversalItem, UserHistoryEvent
+from .response_cache import invalidate_catalog_object, invalidate_nested
+from .services.calendar_occurrences import refresh_occurrences
+from .services.culture_cache import invalidate_user
+from .services.person_search import index_people
+from .services.map_tiles import invalidate_points, row_points
+from .services.pin_clusters import pin_cells, schedule_cell_refresh, schedule_cluster_refresh
+from .services.shared_content import (
+    SHARED_MODELS, sync_shared_entries, remove_shared_entries, update_group_key
+)
+
+
+# -------------------------------------------------
+# SHARED CONTENT INDEX
+# -------------------------------------------------
+def _cultures_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        sync_shared_entries(type(instance), [instance.pk])
+    elif action == "post_clear":
+        # culture.<items>.clear(): pk_set is not provided
+        remove_shared_entries(model, None, culture=instance)
+    else:
+        sync_shared_entries(model, pk_set)
+
+
+def _shared_item_deleted(sender, instance, **kwargs):
+    remove_shared_entries(sender, [instance.pk])
+
+
+for shared_model in SHARED_MODELS:
+    m2m_changed.connect(
+        _cultures_changed,
+        sender=shared_model.cultures.through,
+        dispatch_uid=f"shared_index_m2m_{shared_model.__name__}",
+    )
+    post_delete.connect(
+        _shared_item_deleted,
+        sender=shared_model,
+        dispatch_uid=f"shared_index_delete_{shared_model.__name__}",
+    )
+
+
+@receiver(post_save, sender=Culture, dispatch_uid="shared_index_culture_saved")
+def _culture_saved(sender, instance, created, **kwargs):
+    if not created:
+        update_group_key(instance)
+
+
+# -------------------------------------------------
+# CULTURE RESOLUTION CACHE
+# -------------------------------------------------
+@receiver(post_save, sender=Culture, dispatch_uid="culture_cache_saved")
+@receiver(post_delete, sender=Culture, dispatch_uid="culture_cache_deleted")
+def _invalidate_culture_cache(sender, instance, **kwargs):
+    invalidate_user(instance.user_id)
+
+
+# -------------------------------------------------
+# CATALOG RESPONSE CACHE
+# -------------------------------------------------
+def _catalog_row_changed(sender, instance, **kwargs):
+    invalidate_catalog_object(sender._meta.model_name, instance.pk)
+
+
+def _nested_row_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_nested(instance)
+
+
+for catalog_model in (Film, Book, Person, UniversalItem):
+    post_save.connect(_catalog_row_changed, sender=catalog_model, dispatch_uid=f"catalog_cache_saved_{catalog_model.__name__}")
+    post_delete.connect(_catalog_row_changed, sender=catalog_model, dispatch_uid=f"catalog_cache_deleted_{catalog_model.__name__}")
+
+# Deleting a date cascades to its owner, whose own post_delete invalidates it
+post_save.connect(_nested_row_changed, sender=DateEstimate, dispatch_uid="catalog_cache_saved_DateEstimate")
+
+
+@receiver(m2m_changed, sender=Film.tags.through, dispatch_uid="catalog_cache_film_tags")
+def _film_tags_changed(sender, instance, action, **kwargs):
+    # taggit writes tags after the film's own post_save has already fired
+    if action in ("post_add", "post_remove", "post_clear") and isinstance(instance, Film):
+        invalidate_catalog_object("film", instance.pk)
+
+
+# -------------------------------------------------
+# MAP PIN CLUSTERS
+# -------------------------------------------------
+@receiver(pre_save, sender=MapPin, dispatch_uid="pin_clusters_pre_save")
+def _pin_pre_save(sender, instance, raw=False, **kwargs):
+    # Cells the pin leaves (old position or visibility) are refreshed too
+    instance._cluster_cells = pin_cells([instance.pk]) if instance.pk and not raw else set()
+
+
+@receiver(post_save, sender=MapPin, dispatch_uid="pin_clusters_saved")
+def _pin_saved(sender, instance, created, raw=False, **kwargs):
+    # New pins have no cultures yet; adding them is caught below
+    if not created and not raw:
+        schedule_cell_refresh(getattr(instance, "_cluster_cells", set()) | pin_cells([instance.pk]))
+
+
+@receiver(pre_delete, sender=MapPin, dispatch_uid="pin_clusters_deleted")
+def _pin_deleted(sender, instance, **kwargs):
+    # Cells are read before the through rows go; the refresh runs on commit
+    schedule_cell_refresh(pin_cells([instance.pk]))
+
+
+@receiver(m2m_changed, sender=MapPin.cultures.through, dispatch_uid="pin_clusters_m2m")
+def _pin_cultures_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        # Pins added to or removed from one culture: rebuild that culture
+        if action in ("post_add", "post_remove", "post_clear"):
+            schedule_cluster_refresh([instance.pk])
+    elif action in ("post_add", "post_remove"):
+        schedule_cell_refresh({(culture_id, instance.visibility, instance.geohash) for culture_id in pk_set})
+    elif action == "pre_clear":
+        schedule_cell_refresh(pin_cells([instance.pk]))
+
+
+# -------------------------------------------------
+# MAP TILES
+# -------------------------------------------------
+def _located_pre_save(sender, instance, raw=False, **kwargs):
+    # Remember where the row was, so the tile it leaves is invalidated too
+    instance._tile_points = row_points(sender, [instance.pk]) if instance.pk and not raw else []
+
+
+def _located_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_points([*getattr(instance, "_tile_points", []), (instance.lat, instance.lng)])
+
+
+def _located_deleted(sender, instance, **kwargs):
+    invalidate_points([(instance.lat, instance.lng)])
+
+
+def _located_cultures_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        invalidate_points([(instance.lat, instance.lng)])
+    elif pk_set:
+        invalidate_points(row_points(model, pk_set))
+
+
+for located_model in (MapPin, UserHistoryEvent):
+    pre_save.connect(_located_pre_save, sender=located_model, dispatch_uid=f"map_tiles_pre_save_{located_model.__name__}")
+    post_save.connect(_located_saved, sender=located_model, dispatch_uid=f"map_tiles_saved_{located_model.__name__}")
+    post_delete.connect(_located_deleted, sender=located_model, dispatch_uid=f"map_tiles_deleted_{located_model.__name__}")
+    m2m_changed.connect(
+        _located_cultures_changed,
+        sender=located_model.cultures.through,
+        dispatch_uid=f"map_tiles_m2m_{located_model.__name__}",
+    )
+
+
+# -------------------------------------------------
+# CALENDAR OCCURRENCES
+# -------------------------------------------------
+# Deleted dates lose their occurrences through the cascade
+_OCCURRENCE_FIELDS = {"calendar_date", "isAnnual", "reference_system"}
+
+
+@receiver(post_save, sender=CalendarDate, dispatch_uid="calendar_occurrences_saved")
+def _calendar_date_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and not _OCCURRENCE_FIELDS & set(update_fields)):
+        return
+    refresh_occurrences([instance.pk])
+
+
+# -------------------------------------------------
+# PERSON SEARCH INDEX
+# -------------------------------------------------
+@receiver(post_save, sender=Person, dispatch_uid="person_search_saved")
+def _person_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and not set(Person.name_fields) & set(update_fields)):
+        return
+    index_people([instance.pk])
@@ -8,7 +8,9 @@ from .views import (
     BookViewSet, FilmViewSet, UserMusicComposerViewSet, UserComposerSearchViewSet,        
     UserBookViewSet, UserFilmViewSet, UserMusicPieceViewSet, UserMusicArtistViewSet,
     UserHistoryEventViewSet, RegisterView, CurrentUserView, FilmSimpleViewSet, ListViewSet, BookSimpleViewSet,
-    import_films_view, update_film_image, fetch_tmdb_images, import_books_view, update_userbook_isbn, search_books_view, ComposerSearchView
+    import_films_view, update_film_image, fetch_tmdb_images, import_books_view, update_userbook_isbn, search_books_view, ComposerSearchView,
+    CultureDashboardView, TimelineView, UpcomingView, catalog_cache_stats_view, profiling_summary_view, export_library_view,
+    map_tile_view
 )
 
 router = DefaultRouter()
@@ -50,5 +52,12 @@ urlpatterns = [
     path('api/import-books/', import_books_view, name="import-books"),
     path('api/update-userbook/', update_userbook_isbn, name="update-userbook"),
     path('api/search-books/', search_books_view, name="search-books"),
-    path('api/composer-search/', ComposerSearchView.as_view(), name="search-composers")
+    path('api/composer-search/', ComposerSearchView.as_view(), name="search-composers"),
+    path('api/culture-dashboard/', CultureDashboardView.as_view(), name="culture-dashboard"),
+    path('api/timeline/', TimelineView.as_view(), name="timeline"),
+    path('api/upcoming/', UpcomingView.as_view(), name="upcoming"),
+    path('api/map-tiles/<int:z>/<int:x>/<int:y>/', map_tile_view, name="map-tiles"),
+    path('api/cache-stats/', catalog_cache_stats_view, name="cache-stats"),
+    path('api/profiling/', profiling_summary_view, name="profiling"),
+    path('api/export/', export_library_view, name="export-library")
 ]
\ No newline at end of file
@@ -1,8 +1,7 @@
 import requests
-import random
 from datetime import datetime
 from rest_framework import viewsets, status, generics
-from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, SAFE_METHODS, BasePermission, AllowAny
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, SAFE_METHODS, BasePermission, AllowAny, IsAdminUser
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -11,10 +10,37 @@ from rest_framework.exceptions import ValidationError
 from core.services.tmdb_import import import_films_from_list
 from core.services.openlibrary_import import create_book_from_openlibrary, fetch_works_by_title, search_openlibrary, update_userbook_with_isbn
 from core.services.composer_search import search_many_composers
+from core.services.shared_content import shared_queryset
+from core.services.culture_cache import filter_by_culture, resolve_culture
+from core.services.frontpage import build_book_frontpage, build_film_frontpage
+from core.services.dashboard import build_culture_dashboard, dashboard_etag
+from core.services.library_export import EXPORT_TYPES, gzip_stream, iter_csv, iter_ndjson
+from core.services.timeline import TIMELINE_KINDS, timeline_entries
+from core.services.pin_clusters import map_clusters, pin_cultures, schedule_cluster_refresh
+from core.services.map_tiles import build_tile, cached_tile, invalidate_points, row_points, tile_version
+from core.services.calendar_occurrences import MAX_OCCURRENCE_YEARS, calendar_occurrences, refresh_occurrences
+from core.services.upcoming import UPCOMING_MAX_DAYS, upcoming_entries
+from core.services.person_search import search_people
+from core.services.list_items import (
+    LIST_MAX_PAGE_SIZE, LIST_PAGE_SIZE, MEMBERSHIP_MAX_ITEMS, list_entries_prefetch, list_item_page, list_memberships,
+    list_summaries,
+)
+from core.fast_serializers import (
+    BOOK_SIMPLE, FILM_SIMPLE, USERBOOK_OVERLAY, USERFILM_OVERLAY, FastListMixin,
+    attach_overlays, overlays, universal_item_id,
+)
+from core.conditional import ConditionalGetMixin, etag_matches, make_etag, not_modified, validator_headers
+from core.response_cache import CatalogCacheMixin, catalog_cache_stats
+from core.profiling import profiling_summary, reset_profiling
+from core.renderers import StreamingListMixin
+from core.bulk import BulkTrackingMixin
+from core.geo import MAX_TILE_ZOOM, bbox_filter, parse_bbox
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.db.models import Q, Avg, Count
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from .models import (
     Profile, Culture, Category, Period, PageContent, Recipe, LangLesson,
     CalendarDate, Person, UserMapPreferences, MapPin, LanguageTable, UniversalItem,
@@ -75,7 +101,7 @@ class IsOwnerOrPublic(BasePermission):
             return owner == request.user
         return owner == request.user
 
-class ProfileViewSet(viewsets.ModelViewSet):
+class ProfileViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = ProfileSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -95,7 +121,7 @@ class ProfileViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-class CultureViewSet(viewsets.ModelViewSet):
+class CultureViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = CultureSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -122,7 +148,7 @@ class CultureViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -136,7 +162,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
             return Category.objects.none()
         
         if code:
-            qs = qs.filter(culture__code=code, culture__user=user)
+            qs = filter_by_culture(qs, user, code, "culture")
         if key:
             qs = qs.filter(key=key)
         return qs
@@ -147,7 +173,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
             raise PermissionError("You can only add categories to your own cultures.")
         serializer.save()
 
-class PeriodViewSet(viewsets.ModelViewSet):
+class PeriodViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = PeriodSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -163,7 +189,7 @@ class PeriodViewSet(viewsets.ModelViewSet):
             .filter(culture__user=user)
             .order_by("start_year")
         )
-        if code: qs = qs.filter(culture__code=code)
+        if code: qs = filter_by_culture(qs, user, code, "culture")
         if key: qs = qs.filter(category__key=key)
         return qs
 
@@ -175,15 +201,17 @@ class PeriodViewSet(viewsets.ModelViewSet):
         if not code or not category_id:
             raise ValidationError("Culture code and category ID are required.")
 
+        culture = resolve_culture(user, code)
+        if culture is None:
+            raise ValidationError("Invalid culture or category.")
         try:
-            culture = Culture.objects.get(user=user, code=code)
-            category = Category.objects.get(id=category_id, culture=culture)
-        except (Culture.DoesNotExist, Category.DoesNotExist):
+            category = Category.objects.get(id=category_id, culture_id=culture.id)
+        except Category.DoesNotExist:
             raise ValidationError("Invalid culture or category.")
 
-        serializer.save(culture=culture, category=category)
+        serializer.save(culture_id=culture.id, category=category)
 
-class PageContentViewSet(viewsets.ModelViewSet):
+class PageContentViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = PageContentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -195,10 +223,11 @@ class PageContentViewSet(viewsets.ModelViewSet):
             return PageContent.objects.none()
             
         qs = (PageContent.objects
+            .for_serializer(PageContentSerializer)
             .select_related('culture', 'category')
             .filter(culture__user=user)
         )
-        if code: qs = qs.filter(culture__code=code)
+        if code: qs = filter_by_culture(qs, user, code, "culture")
         if key: qs = qs.filter(category__key=key)
         return qs
 
@@ -208,7 +237,7 @@ class PageContentViewSet(viewsets.ModelViewSet):
             raise PermissionError("You do not own this culture.")
         serializer.save()
 
-class RecipeViewSet(viewsets.ModelViewSet):
+class RecipeViewSet(BulkTrackingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = RecipeSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrPublic]
 
@@ -217,25 +246,24 @@ class RecipeViewSet(viewsets.ModelViewSet):
         code = self.request.query_params.get('code', None)
         shared = self.request.query_params.get('shared') == 'true'
         
-        qs = Recipe.objects.select_related('user').prefetch_related('cultures')
+        qs = Recipe.objects.for_serializer(RecipeSerializer).select_related('user').prefetch_related('cultures')
         
         if not user.is_authenticated:
             return qs.filter(visibility=Visibility.PUBLIC)
         
-        if not shared:
-            qs = qs.filter(user=user)
-        
+        if shared:
+            return shared_queryset(qs, user, code)
+
+        qs = qs.filter(user=user)
         if code:
-            qs = qs.filter(cultures__code__iexact=code)
-        
-                                                                                                   
-            
-        return qs.distinct()
+            qs = filter_by_culture(qs, user, code)
+
+        return qs
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-class LangLessonViewSet(viewsets.ModelViewSet):
+class LangLessonViewSet(BulkTrackingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = LangLessonSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrPublic]
 
@@ -252,24 +280,12 @@ class LangLessonViewSet(viewsets.ModelViewSet):
         if not shared:
             return qs.filter(user=user)
         
-        if code:
-            try:
-                user_culture = Culture.objects.get(user=user, code=code)
-            except Culture.DoesNotExist:
-                return qs.none()
-            
-            group_key = user_culture.shared_group_key
-            return qs.filter(
-                visibility=Visibility.PUBLIC,
-                cultures__shared_group_key=group_key
-            ).exclude(user=user).distinct()
-            
-        return qs.filter(visibility=Visibility.PUBLIC).exclude(user=user).distinct()
+        return shared_queryset(qs, user, code)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-class CalendarDateViewSet(viewsets.ModelViewSet):
+class CalendarDateViewSet(BulkTrackingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = CalendarDateSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrPublic]
 
@@ -292,22 +308,11 @@ class CalendarDateViewSet(viewsets.ModelViewSet):
         )
 
         if shared:
-            if code:
-                try:
-                    user_culture = Culture.objects.get(user=user, code=code)
-                    group_key = user_culture.shared_group_key
-                    qs = qs.filter(
-                        visibility=Visibility.PUBLIC,
-                        cultures__shared_group_key=group_key
-                    ).exclude(user=user)
-                except Culture.DoesNotExist:
-                    return qs.none()
-            else:
-                qs = qs.filter(visibility=Visibility.PUBLIC).exclude(user=user)
+            qs = shared_queryset(qs, user, code)
         else:
             qs = qs.filter(user=user)
             if code:
-                qs = qs.filter(cultures__code__iexact=code)
+                qs = filter_by_culture(qs, user, code)
                 
         if q:
             qs = qs.filter(
@@ -315,18 +320,57 @@ class CalendarDateViewSet(viewsets.ModelViewSet):
                 Q(type__icontains=q)
             )
             
-        if start:
+        # The occurrences action applies the window to expanded dates instead
+        if start and self.action != "occurrences":
             qs = qs.filter(calendar_date__gte=datetime.strptime(start, "%Y-%m-%d").date())
             
-        if end:
+        if end and self.action != "occurrences":
             qs = qs.filter(calendar_date__lte=end)
             
-        return qs.distinct()
+        return qs
+
+    def _bulk_touched(self, pks):
+        refresh_occurrences(pks)
+
+    @action(detail=False, methods=["get"], url_path="occurrences", permission_classes=[IsAuthenticated])
+    def occurrences(self, request):
+        """
+        Concrete Gregorian dates between start and end (inclusive) on which
+        the calendar dates fall, with annual dates repeated every year and
+        Islamic/Egyptian ones converted from their own calendar. Takes the
+        same code, shared and q parameters as the list; each date is listed
+        once under `dates`.
+
+        Example: GET /api/calendar-dates/occurrences/?code=eg&start=2025-03-01&end=2025-03-31
+        """
+        try:
+            start = datetime.strptime(request.query_params["start"], "%Y-%m-%d").date()
+            end = datetime.strptime(request.query_params["end"], "%Y-%m-%d").date()
+        except (KeyError, ValueError):
+            return Response(
+                {"error": "'start' and 'end' must be YYYY-MM-DD dates."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if start > end:
+            return Response({"error": "'start' must not be after 'end'."}, status=status.HTTP_400_BAD_REQUEST)
+        if end.year - start.year >= MAX_OCCURRENCE_YEARS:
+            return Response(
+                {"error": f"The window may span at most {MAX_OCCURRENCE_YEARS} years."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        calendar_dates = self.get_queryset()
+        occurrences = list(calendar_occurrences(calendar_dates, start, end).values_list("date", "calendar_date_id"))
+        dates = calendar_dates.filter(pk__in={pk for _, pk in occurrences}).select_related("person")
+        return Response({
+            "occurrences": [{"date": date, "id": pk} for date, pk in occurrences],
+            "dates": self.get_serializer(dates, many=True).data,
+        })
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-class PersonViewSet(viewsets.ModelViewSet):
+class PersonViewSet(StreamingListMixin, CatalogCacheMixin, viewsets.ModelViewSet):
     serializer_class = PersonSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -339,13 +383,6 @@ class PersonViewSet(viewsets.ModelViewSet):
         living = self.request.query_params.get('living', None)
         wikidata = self.request.query_params.get('wikidata_id', None)
 
-        if query:
-            # Flexible name search (handles partial matches, e.g. “Mozart”, “de Vinci”)
-            qs = qs.filter(
-                Q(given_name__icontains=query) |
-                Q(family_name__icontains=query) |
-                Q(middle_name__icontains=query)
-            )
         if nationality:
             qs = qs.filter(nationality__icontains=nationality)
         if profession:
@@ -355,12 +392,15 @@ class PersonViewSet(viewsets.ModelViewSet):
         if wikidata:
             qs = qs.filter(wikidata_id=wikidata)
 
+        if query:
+            # Accent-insensitive word-prefix search, best matches first (“Dvorak”, “de Vinci”)
+            return search_people(qs, query)
         return qs.order_by("family_name", "given_name")
     
     def perform_create(self, serializer):
         serializer.save()
 
-class UserMapPreferencesViewSet(viewsets.ModelViewSet):
+class UserMapPreferencesViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = UserMapPreferencesSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -375,34 +415,15 @@ class UserMapPreferencesViewSet(viewsets.ModelViewSet):
         qs = UserMapPreferences.objects.select_related("culture")
 
         if shared:
-            if code:
-                try:
-                    user_culture = Culture.objects.get(user=user, code=code)
-                except Culture.DoesNotExist:
-                    return qs.none()
+            return shared_queryset(qs, user, code)
 
-                group_key = user_culture.shared_group_key
-
-                qs = qs.filter(
-                    culture__shared_group_key=group_key,
-                    culture__visibility=Visibility.PUBLIC
-                ).exclude(culture__user=user)
-
-            else:
-                qs = qs.filter(
-                    culture__visibility=Visibility.PUBLIC
-                ).exclude(culture__user=user)
-
-        else:
-            qs = qs.filter(culture__user=user)
-            if code:
-                qs = qs.filter(culture__code=code)
-                
-        
+        qs = qs.filter(culture__user=user)
+        if code:
+            qs = filter_by_culture(qs, user, code, "culture")
 
-        return qs.distinct()
+        return qs
 
-class MapPinViewSet(viewsets.ModelViewSet):
+class MapPinViewSet(BulkTrackingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = MapPinSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -415,52 +436,91 @@ class MapPinViewSet(viewsets.ModelViewSet):
         if not user.is_authenticated:
             return MapPin.objects.none()
         
-        qs = MapPin.objects.select_related("period").prefetch_related("cultures")
+        qs = MapPin.objects.select_related("period", "date").prefetch_related("cultures")
         
         if shared:
-            if code:
-                try:
-                    user_culture = Culture.objects.get(user=user, code=code)
-                    group_key = user_culture.shared_group_key
-                    qs = qs.filter(
-                        visibility=Visibility.PUBLIC,
-                        cultures__shared_group_key=group_key
-                    ).exclude(user=user)
-                except Culture.DoesNotExist:
-                    return qs.none()
-            else:
-                qs = qs.filter(visibility=Visibility.PUBLIC).exclude(user=user)
+            qs = shared_queryset(qs, user, code)
         
         else:
             qs = qs.filter(user=user)
             if code:
-                qs = qs.filter(cultures__code__iexact=code)
+                qs = filter_by_culture(qs, user, code)
                 
         if period_title:
             qs = qs.filter(
                 period__title=period_title,
                 period__category__key="history"
             )
+
+        bbox = self.request.query_params.get('bbox')
+        if bbox:
+            qs = qs.filter(self._visible(bbox, self.request.query_params.get('zoom')))
             
-        return qs.distinct()
+        return qs
+
+    def _bulk_touched(self, pks):
+        schedule_cluster_refresh(pin_cultures(pks))
+        invalidate_points(row_points(MapPin, pks))
+
+    @action(detail=False, methods=["get"], url_path="clusters", permission_classes=[IsAuthenticated])
+    def clusters(self, request):
+        """
+        Precomputed pin clusters for one map zoom level: count, centroid and
+        the pin nearest the centroid per geohash cell. Takes the same code,
+        shared and bbox parameters as the pin list.
+
+        Example: GET /api/map-pins/clusters/?code=jp&zoom=6&bbox=129,30,146,46
+        """
+        zoom = request.query_params.get('zoom')
+        if zoom is None or not zoom.isdigit():
+            raise ValidationError({"zoom": ["Expected a non-negative integer."]})
+        code = request.query_params.get('code')
+        shared = request.query_params.get('shared') == "true"
+        bbox = request.query_params.get('bbox')
+
+        culture = resolve_culture(request.user, code)
+        if code and not culture:
+            return Response({"error": "Invalid culture code"}, status=status.HTTP_404_NOT_FOUND)
+        if not shared and not culture:
+            return Response({"error": "'code' is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(map_clusters(
+            request.user, int(zoom),
+            culture_id=culture.id if culture else None,
+            group_key=culture.shared_group_key if culture else None,
+            shared=shared, bbox=self._bbox(bbox) if bbox else None,
+        ))
+
+    def _bbox(self, value):
+        try:
+            return parse_bbox(value)
+        except ValueError as exc:
+            raise ValidationError({"bbox": [str(exc)]})
+
+    def _visible(self, bbox, zoom):
+        """?bbox=west,south,east,north[&zoom=z]: only pins inside the map viewport."""
+        bounds = self._bbox(bbox)
+        if zoom is not None and not zoom.isdigit():
+            raise ValidationError({"zoom": ["Expected a non-negative integer."]})
+        return bbox_filter(bounds, int(zoom) if zoom is not None else None)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-class LanguageTableViewSet(viewsets.ModelViewSet):
+class LanguageTableViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = LanguageTableSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     def get_queryset(self):
         user = self.request.user
         code = self.request.query_params.get('code', None)
-        qs = LanguageTable.objects.select_related('culture')
+        qs = LanguageTable.objects.for_serializer(LanguageTableSerializer).select_related('culture')
         
         if not user.is_authenticated:
             return LanguageTable.objects.none()
         
         if code:
-            qs = qs.filter(culture__code=code, culture__user=user)
+            qs = filter_by_culture(qs, user, code, "culture")
         else:
             qs = qs.filter(culture__user=user)
         return qs
@@ -468,7 +528,7 @@ class LanguageTableViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save()
 
-class UniversalItemViewSet(viewsets.ModelViewSet):
+class UniversalItemViewSet(CatalogCacheMixin, viewsets.ModelViewSet):
     serializer_class = UniversalItemSerializer
     queryset = (
         UniversalItem.objects
@@ -502,7 +562,17 @@ class UniversalItemViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save()
  
-class BookViewSet(viewsets.ModelViewSet):
+def filter_by_creator(qs, params):
+    """Narrow a Book/Film queryset to ?creator=<Person id>."""
+    creator = params.get("creator")
+    if not creator:
+        return qs
+    try:
+        return qs.filter(creator_id=int(creator))
+    except ValueError:
+        raise ValidationError({"creator": ["Expected a Person id."]})
+
+class BookViewSet(CatalogCacheMixin, viewsets.ModelViewSet):
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -513,10 +583,12 @@ class BookViewSet(viewsets.ModelViewSet):
         
         qs = (
             Book.objects
+            .for_serializer(BookSerializer)
             .select_related("creator", "date")
             .order_by("title")
         )
     
+        qs = filter_by_creator(qs, self.request.query_params)
         if language:
             qs = qs.filter(language__icontains=language)
         if genre:
@@ -529,6 +601,9 @@ class BookViewSet(viewsets.ModelViewSet):
                 | Q(creator_string__icontains=q)
                 | Q(alt_creator_name__icontains=q)
             )
+
+        if self.action in ("list", "retrieve"):
+            qs = BookSerializer.project(qs, self.request)
         
         return qs.distinct()
     
@@ -556,18 +631,17 @@ class BookViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], url_path="random", permission_classes=[IsAuthenticatedOrReadOnly])
     def random_book(self, request):
         """Return a random book + its userbook if it exists"""
-        book = Book.objects.order_by("?").first()
-        if not book:
+        book_data = next(iter(BOOK_SIMPLE.rows(Book.objects.order_by("?")[:1])), None)
+        if not book_data:
             return Response({"detail": "No books available."}, status=404)
 
         userbook = None
         if request.user.is_authenticated:
             userbook = UserBook.objects.filter(
-                universal_item=book.universal_item,
+                universal_item_id=universal_item_id(book_data),
                 user=request.user
             ).first()
 
-        book_data = BookSimpleSerializer(book).data
         userbook_data = UserBookSerializer(userbook).data if userbook else None
 
         return Response({
@@ -582,74 +656,11 @@ class BookViewSet(viewsets.ModelViewSet):
         if not code:
             return Response({"error": "culture code is required"}, status=400)
 
-        culture = Culture.objects.filter(user=user, code=code).first()
+        culture = resolve_culture(user, code)
         if not culture:
             return Response({"error": "Invalid culture code"}, status=404)
 
-        # All userbooks for that user/culture
-        userbooks = UserBook.objects.filter(user=user, cultures__code__iexact=code)
-        
-        # Build the sets
-        readlist_ids = list(userbooks.filter(readlist=True)
-                             .values_list("universal_item__id", flat=True))
-        favourite_ids = list(userbooks.filter(favourite=True)
-                             .values_list("universal_item__id", flat=True))
-        recent_ids = list(userbooks.filter(read=True, date_finished__isnull=False)
-                          .order_by("-date_finished")
-                          .values_list("universal_item__id", flat=True)[:10])
-
-        # Map universal_item IDs to book IDs
-        book_ids_map = {
-            ui["universal_item__id"]: ui["id"] 
-            for ui in Book.objects.filter(universal_item__id__in=(readlist_ids + favourite_ids + recent_ids))
-            .values("id", "universal_item__id")
-        }
-
-        # Convert universal_item IDs to book IDs
-        readlist_book_ids = [book_ids_map.get(uid) for uid in readlist_ids if book_ids_map.get(uid)]
-        favourite_book_ids = [book_ids_map.get(uid) for uid in favourite_ids if book_ids_map.get(uid)]
-        recent_book_ids = [book_ids_map.get(uid) for uid in recent_ids if book_ids_map.get(uid)]
-
-        # Random samples
-        data_sets = {
-            "readlist": Book.objects.filter(id__in=random.sample(readlist_book_ids, min(5, len(readlist_book_ids)))) if readlist_book_ids else [],
-            "favourites": Book.objects.filter(id__in=favourite_book_ids[:5]) if favourite_book_ids else [],
-            "recent": Book.objects.filter(id__in=recent_book_ids) if recent_book_ids else [],
-        }
-
-        # If empty, provide fallback
-        if not any(data_sets.values()):
-            fallback = Book.objects.order_by("?")[:5]
-            data_sets["fallback"] = fallback
-
-        # Gather all book IDs we're returning
-        all_book_ids = [book.id for books in data_sets.values() for book in books]
-        userbook_map = {
-            ub.universal_item.id: ub
-            for ub in userbooks.filter(universal_item__id__in=[uid for uid, bid in book_ids_map.items() if bid in all_book_ids])
-        }
-
-        # Build response payload
-        result = {}
-        for key, books in data_sets.items():
-            result[key] = []
-            for book in books:
-                book_data = BookSimpleSerializer(book).data
-                ub = userbook_map.get(book.universal_item.id)
-                if ub:
-                    book_data["userbook"] = {
-                        "cover": ub.cover,
-                        "read": ub.read,
-                        "favourite": ub.favourite,
-                        "readlist": ub.readlist,
-                        "id": ub.id,
-                        "date_finished": ub.date_finished,
-                    }
-                else:
-                    book_data["userbook"] = None
-                result[key].append(book_data)
-
-        return Response(result)
+        return Response(build_book_frontpage(user, culture.id))
     
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     def list_books(self, request):
@@ -667,7 +678,7 @@ class BookViewSet(viewsets.ModelViewSet):
                 | Q(alt_creator_name__icontains=q)
             )
         
-        books = qs.distinct()
+        books = BOOK_SIMPLE.rows(qs.distinct())
         
         if not books:
             return Response({"results": []}, status=200)
@@ -677,26 +688,9 @@ class BookViewSet(viewsets.ModelViewSet):
             universal_item__id__in=universal_item_ids
         )
         
-        userbook_map = {ub.universal_item.id: ub for ub in userbooks}
-
-        results = []
-        for book in books:
-            book_data = BookSimpleSerializer(book).data
-            ub = userbook_map.get(book.universal_item.id)
-            if ub:
-                book_data["userbook"] = {
-                    "cover": ub.cover,
-                    "read": ub.read,
-                    "favourite": ub.favourite,
-                    "readlist": ub.readlist,
-                    "id": ub.id,
-                    "date_finished": ub.date_finished,
-                }
-            else:
-                book_data["userbook"] = None
-            results.append(book_data)
+        userbook_map = dict(overlays(userbooks, USERBOOK_OVERLAY))
 
-        return Response({"results": results})
+        return Response({"results": attach_overlays(books, "userbook", userbook_map)})
     
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     def period_books(self, request):
@@ -709,13 +703,13 @@ class BookViewSet(viewsets.ModelViewSet):
         if period:
             qs = qs.filter(period__id__iexact=period)
         
-        userbooks = qs.distinct()
+        userbooks = overlays(qs.distinct(), USERBOOK_OVERLAY)
         
         if not userbooks:
             return Response({"results": []}, status=200)
         
         books = Book.objects.filter(
-            universal_item__id__in=userbooks.values_list("universal_item__id", flat=True)
+            universal_item__id__in=[uid for uid, _ in userbooks]
         )
         
         if q:
@@ -727,23 +721,14 @@ class BookViewSet(viewsets.ModelViewSet):
             )
         
         book_map = {
-            b.universal_item.id: b for b in books
+            universal_item_id(row): row for row in BOOK_SIMPLE.rows(books)
         }
         
         results = []
-        for ub in userbooks:
-            book = book_map.get(ub.universal_item.id)
+        for uid, userbook in userbooks:
+            book = book_map.get(uid)
             if book:
-                book_data = BookSimpleSerializer(book).data
-                book_data["userbook"] = {
-                    "cover": ub.cover,
-                    "read": ub.read,
-                    "favourite": ub.favourite,
-                    "readlist": ub.readlist,
-                    "id": ub.id,
-                    "date_finished": ub.date_finished,
-                }
-                results.append(book_data)
+                results.append({**book, "userbook": userbook})
         
         return Response({"results": results}, status=200)
     
@@ -757,12 +742,9 @@ class BookViewSet(viewsets.ModelViewSet):
         offset = int(request.query_params.get("offset", 0))
         
         # Build the book queryset with filters
-        qs = (
-            Book.objects
-            .select_related("creator", "date")
-            .order_by("title")
-        )
+        qs = Book.objects.order_by("title")
         
+        qs = filter_by_creator(qs, request.query_params)
         if genre:
             qs = qs.filter(Q(genre__icontains=genre))
         if author:
@@ -778,42 +760,24 @@ class BookViewSet(viewsets.ModelViewSet):
                 | Q(alt_creator_name__icontains=q)
             )
             
-        books = qs.distinct()[offset:offset + limit]
+        books = BOOK_SIMPLE.rows(qs.distinct()[offset:offset + limit])
         
         if not books:
             return Response({"results": []}, status=200)
         
         userbooks = UserBook.objects.filter(
             user=user,
-            universal_item__id__in=books.values_list("universal_item__id", flat=True)
+            universal_item__id__in=[universal_item_id(row) for row in books]
         )
         
-        userbook_map = {
-            uf.universal_item.id: uf for uf in userbooks
-        }
+        userbook_map = dict(overlays(userbooks, USERBOOK_OVERLAY))
         
-        results = []
-        for book in books:
-            book_data = BookSimpleSerializer(book).data
-            ub = userbook_map.get(book.universal_item.id)
-            if ub:
-                book_data["userbook"] = {
-                    "cover": ub.cover,
-                    "read": ub.read,
-                    "favourite": ub.favourite,
-                    "readlist": ub.readlist,
-                    "id": ub.id,
-                    "date_finished": ub.date_finished,
-                }
-            else:
-                book_data["userbook"] = None
-            results.append(book_data)
-        
-        return Response({"results": results, "total": qs.count()})
-    
+        return Response({"results": attach_overlays(books, "userbook", userbook_map), "total": qs.count()})
     
-class BookSimpleViewSet(viewsets.ModelViewSet):
+
+class BookSimpleViewSet(CatalogCacheMixin, FastListMixin, viewsets.ModelViewSet):
     serializer_class = BookSimpleSerializer
+    fast_serializer = BOOK_SIMPLE
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     def get_queryset(self):
@@ -838,7 +802,7 @@ class BookSimpleViewSet(viewsets.ModelViewSet):
 
         return qs
 
-class FilmViewSet(viewsets.ModelViewSet):
+class FilmViewSet(StreamingListMixin, CatalogCacheMixin, viewsets.ModelViewSet):
     serializer_class = FilmSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -853,10 +817,12 @@ class FilmViewSet(viewsets.ModelViewSet):
         
         qs = (
             Film.objects
+            .for_serializer(FilmSerializer)
             .select_related("creator", "date")
             .order_by("title")
         )
         
+        qs = filter_by_creator(qs, self.request.query_params)
         if tmdb_id:
             qs = qs.filter(tmdb_id__iexact=tmdb_id)
         if genre:
@@ -883,6 +849,9 @@ class FilmViewSet(viewsets.ModelViewSet):
                 Q(crew__role__iexact="Director")
             )
             
+        if self.action in ("list", "retrieve"):
+            qs = FilmSerializer.project(qs, self.request)
+
         if limit:
             qs = qs[:int(limit)]
             return qs
@@ -913,18 +882,17 @@ class FilmViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], url_path="random", permission_classes=[IsAuthenticatedOrReadOnly])
     def random_film(self, request):
         """Return a random film + its userfilm if it exists"""
-        film = Film.objects.order_by("?").first()
-        if not film:
+        film_data = next(iter(FILM_SIMPLE.rows(Film.objects.order_by("?")[:1])), None)
+        if not film_data:
             return Response({"detail": "No films available."}, status=404)
 
         userfilm = None
         if request.user.is_authenticated:
             userfilm = UserFilm.objects.filter(
-                universal_item=film.universal_item,
+                universal_item_id=universal_item_id(film_data),
                 user=request.user
             ).first()
 
-        film_data = FilmSimpleSerializer(film).data
         userfilm_data = UserFilmSerializer(userfilm).data if userfilm else None
 
         return Response({
@@ -939,75 +907,11 @@ class FilmViewSet(viewsets.ModelViewSet):
         if not code:
             return Response({"error": "culture code is required"}, status=400)
 
-        culture = Culture.objects.filter(user=user, code=code).first()
+        culture = resolve_culture(user, code)
         if not culture:
             return Response({"error": "Invalid culture code"}, status=404)
 
-        # All userfilms for that user/culture
-        userfilms = UserFilm.objects.filter(user=user, cultures__code__iexact=code)
-        
-        # Build the sets
-        watchlist_ids = list(userfilms.filter(watchlist=True)
-                             .values_list("universal_item__id", flat=True))
-        favourite_ids = list(userfilms.filter(favourite=True)
-                             .values_list("universal_item__id", flat=True))
-        recent_ids = list(userfilms.filter(seen=True, date_watched__isnull=False)
-                          .order_by("-date_watched")
-                          .values_list("universal_item__id", flat=True)[:10])
-
-        # Map universal_item IDs to film IDs
-        film_ids_map = {
-            ui["universal_item__id"]: ui["id"] 
-            for ui in Film.objects.filter(universal_item__id__in=(watchlist_ids + favourite_ids + recent_ids))
-            .values("id", "universal_item__id")
-        }
-
-        # Convert universal_item IDs to film IDs
-        watchlist_film_ids = [film_ids_map.get(uid) for uid in watchlist_ids if film_ids_map.get(uid)]
-        favourite_film_ids = [film_ids_map.get(uid) for uid in favourite_ids if film_ids_map.get(uid)]
-        recent_film_ids = [film_ids_map.get(uid) for uid in recent_ids if film_ids_map.get(uid)]
-
-        # Random samples
-        data_sets = {
-            "watchlist": Film.objects.filter(id__in=random.sample(watchlist_film_ids, min(5, len(watchlist_film_ids)))) if watchlist_film_ids else [],
-            "favourites": Film.objects.filter(id__in=favourite_film_ids[:5]) if favourite_film_ids else [],
-            "recent": Film.objects.filter(id__in=recent_film_ids) if recent_film_ids else [],
-        }
-
-        # If empty, provide fallback
-        if not any(data_sets.values()):
-            fallback = Film.objects.order_by("?")[:5]
-            data_sets["fallback"] = fallback
-
-        # Gather all film IDs we're returning
-        all_film_ids = [film.id for films in data_sets.values() for film in films]
-        userfilm_map = {
-            uf.universal_item.id: uf
-            for uf in userfilms.filter(universal_item__id__in=[uid for uid, fid in film_ids_map.items() if fid in all_film_ids])
-        }
-
-        # Build response payload
-        result = {}
-        for key, films in data_sets.items():
-            result[key] = []
-            for film in films:
-                film_data = FilmSimpleSerializer(film).data
-                uf = userfilm_map.get(film.universal_item.id)
-                if uf:
-                    film_data["userfilm"] = {
-                        "poster": uf.poster,
-                        "background_pic": uf.background_pic,
-                        "seen": uf.seen,
-                        "favourite": uf.favourite,
-                        "watchlist": uf.watchlist,
-                        "id": uf.id,
-                        "date_watched": uf.date_watched,
-                    }
-                else:
-                    film_data["userfilm"] = None
-                result[key].append(film_data)
-
-        return Response(result)
+        return Response(build_film_frontpage(user, culture.id))
     
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     def search(self, request):
@@ -1021,12 +925,9 @@ class FilmViewSet(viewsets.ModelViewSet):
         offset = int(request.query_params.get("offset", 0))
         
         # Build the film queryset with filters
-        qs = (
-            Film.objects
-            .select_related("creator", "date")
-            .order_by("title")
-        )
+        qs = Film.objects.order_by("title")
         
+        qs = filter_by_creator(qs, request.query_params)
         if actor:
             qs = qs.filter(Q(cast__icontains=actor))
         if director:
@@ -1045,39 +946,19 @@ class FilmViewSet(viewsets.ModelViewSet):
                 | Q(alt_creator_name__icontains=q)
             )
             
-        films = qs.distinct()[offset:offset + limit]
+        films = FILM_SIMPLE.rows(qs.distinct()[offset:offset + limit])
         
         if not films:
             return Response({"results": []}, status=200)
         
         userfilms = UserFilm.objects.filter(
             user=user,
-            universal_item__id__in=films.values_list("universal_item__id", flat=True)
+            universal_item__id__in=[universal_item_id(row) for row in films]
         )
         
-        userfilm_map = {
-            uf.universal_item.id: uf for uf in userfilms
-        }
-        
-        results = []
-        for film in films:
-            film_data = FilmSimpleSerializer(film).data
-            uf = userfilm_map.get(film.universal_item.id)
-            if uf:
-                film_data["userfilm"] = {
-                    "poster": uf.poster,
-                    "background_pic": uf.background_pic,
-                    "seen": uf.seen,
-                    "favourite": uf.favourite,
-                    "watchlist": uf.watchlist,
-                    "id": uf.id,
-                    "date_watched": uf.date_watched,
-                }
-            else:
-                film_data["userfilm"] = None
-            results.append(film_data)
+        userfilm_map = dict(overlays(userfilms, USERFILM_OVERLAY))
         
-        return Response({"results": results, "total": qs.count()})
+        return Response({"results": attach_overlays(films, "userfilm", userfilm_map), "total": qs.count()})
     
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     def list_films(self, request):
@@ -1095,7 +976,7 @@ class FilmViewSet(viewsets.ModelViewSet):
                 | Q(alt_creator_name__icontains=q)
             )
         
-        films = qs.distinct()
+        films = FILM_SIMPLE.rows(qs.distinct())
         
         if not films:
             return Response({"results": []}, status=200)
@@ -1105,28 +986,9 @@ class FilmViewSet(viewsets.ModelViewSet):
             universal_item__id__in=universal_item_ids
         )
         
-        userfilm_map = {uf.universal_item.id: uf for uf in userfilms}
+        userfilm_map = dict(overlays(userfilms, USERFILM_OVERLAY + ("rating",)))
 
-        results = []
-        for film in films:
-            film_data = FilmSimpleSerializer(film).data
-            uf = userfilm_map.get(film.universal_item.id)
-            if uf:
-                film_data["userfilm"] = {
-                    "poster": uf.poster,
-                    "background_pic": uf.background_pic,
-                    "seen": uf.seen,
-                    "favourite": uf.favourite,
-                    "watchlist": uf.watchlist,
-                    "id": uf.id,
-                    "date_watched": uf.date_watched,
-                    "rating": uf.rating,
-                }
-            else:
-                film_data["userfilm"] = None
-            results.append(film_data)
-
-        return Response({"results": results})
+        return Response({"results": attach_overlays(films, "userfilm", userfilm_map)})
     
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     def period_films(self, request):
@@ -1139,13 +1001,13 @@ class FilmViewSet(viewsets.ModelViewSet):
         if period:
             qs = qs.filter(period__id__iexact=period)
         
-        userfilms = qs.distinct()
+        userfilms = overlays(qs.distinct(), USERFILM_OVERLAY + ("rating", "period_id"))
         
         if not userfilms:
             return Response({"results": []}, status=200)
         
         films = Film.objects.filter(
-            universal_item__id__in=userfilms.values_list("universal_item__id", flat=True)
+            universal_item__id__in=[uid for uid, _ in userfilms]
         )
         
         if q:
@@ -1157,32 +1019,20 @@ class FilmViewSet(viewsets.ModelViewSet):
             )
         
         film_map = {
-            f.universal_item.id: f for f in films
+            universal_item_id(row): row for row in FILM_SIMPLE.rows(films)
         }
         
         results = []
-        for uf in userfilms:
-            film = film_map.get(uf.universal_item.id)
+        for uid, userfilm in userfilms:
+            film = film_map.get(uid)
             if film:
-                film_data = FilmSimpleSerializer(film).data
-                film_data["userfilm"] = {
-                    "id": uf.id,
-                    "poster": uf.poster,
-                    "background_pic": uf.background_pic,
-                    "seen": uf.seen,
-                    "favourite": uf.favourite,
-                    "watchlist": uf.watchlist,
-                    "date_watched": uf.date_watched,
-                    "rating": uf.rating,
-                    "period_id": uf.period.id if uf.period else None,
-                }
-                results.append(film_data)
+                results.append({**film, "userfilm": userfilm})
         
         return Response({"results": results}, status=200)
-        
-        
-class FilmSimpleViewSet(viewsets.ModelViewSet):
+
+class FilmSimpleViewSet(CatalogCacheMixin, FastListMixin, viewsets.ModelViewSet):
     serializer_class = FilmSimpleSerializer
+    fast_serializer = FILM_SIMPLE
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     def get_queryset(self):
@@ -1207,7 +1057,7 @@ class FilmSimpleViewSet(viewsets.ModelViewSet):
 
         return qs
    
-class UserBookViewSet(viewsets.ModelViewSet):
+class UserBookViewSet(BulkTrackingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = UserBookSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrPublic]
 
@@ -1252,7 +1102,7 @@ class UserBookViewSet(viewsets.ModelViewSet):
         else:
             return Response({"detail": "No entry yet."}, status=404)
 
-class UserFilmViewSet(viewsets.ModelViewSet):
+class UserFilmViewSet(StreamingListMixin, BulkTrackingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = UserFilmSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrPublic]
 
@@ -1261,12 +1111,12 @@ class UserFilmViewSet(viewsets.ModelViewSet):
         period = self.request.query_params.get("period", None)
         code = self.request.query_params.get("code", None)
         
-        qs = UserFilm.objects.all()
+        qs = UserFilm.objects.prefetch_related("cultures")
         
         if not user.is_authenticated:
             return UserBook.objects.filter(visibility=Visibility.PUBLIC)
         if code:
-            qs = qs.filter(cultures__code__iexact=code)
+            qs = filter_by_culture(qs, user, code)
         if period:
             qs.filter(period__id=period)
         return qs.filter(user=user)
@@ -1292,7 +1142,7 @@ class UserFilmViewSet(viewsets.ModelViewSet):
         else:
             return Response({"detail": "No entry yet."}, status=404)
 
-class UserMusicPieceViewSet(viewsets.ModelViewSet):
+class UserMusicPieceViewSet(BulkTrackingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = UserMusicPieceSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrPublic]
 
@@ -1319,29 +1169,18 @@ class UserMusicPieceViewSet(viewsets.ModelViewSet):
             )
 
         if shared:
-            if code:
-                try:
-                    user_culture = Culture.objects.get(user=user, code=code)
-                    group_key = user_culture.shared_group_key
-                    qs = qs.filter(
-                        visibility=Visibility.PUBLIC,
-                        cultures__shared_group_key=group_key
-                    ).exclude(user=user)
-                except Culture.DoesNotExist:
-                    return qs.none()
-            else:
-                qs = qs.filter(visibility=Visibility.PUBLIC).exclude(user=user)
+            qs = shared_queryset(qs, user, code)
         else:
             qs = qs.filter(user=user)
             if code:
-                qs = qs.filter(cultures__code__iexact=code)
+                qs = filter_by_culture(qs, user, code)
 
-        return qs.distinct()
+        return qs
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
         
-class UserMusicArtistViewSet(viewsets.ModelViewSet):
+class UserMusicArtistViewSet(BulkTrackingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = UserMusicArtistSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrPublic]
 
@@ -1361,29 +1200,18 @@ class UserMusicArtistViewSet(viewsets.ModelViewSet):
         )
 
         if shared:
-            if code:
-                try:
-                    user_culture = Culture.objects.get(user=user, code=code)
-                    group_key = user_culture.shared_group_key
-                    qs = qs.filter(
-                        visibility=Visibility.PUBLIC,
-                        cultures__shared_group_key=group_key
-                    ).exclude(user=user)
-                except Culture.DoesNotExist:
-                    return qs.none()
-            else:
-                qs = qs.filter(visibility=Visibility.PUBLIC).exclude(user=user)
+            qs = shared_queryset(qs, user, code)
         else:
             qs = qs.filter(user=user)
             if code:
-                qs = qs.filter(cultures__code__iexact=code)
+                qs = filter_by_culture(qs, user, code)
 
-        return qs.distinct()
+        return qs
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-class UserHistoryEventViewSet(viewsets.ModelViewSet):
+class UserHistoryEventViewSet(BulkTrackingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = UserHistoryEventSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrPublic]
 
@@ -1399,28 +1227,17 @@ class UserHistoryEventViewSet(viewsets.ModelViewSet):
 
         qs = (
             UserHistoryEvent.objects
-            .select_related("user")
+            .select_related("user", "period", "date")
             .prefetch_related("cultures")
             .order_by("-updated_at")
         )
 
         if shared:
-            if code:
-                try:
-                    user_culture = Culture.objects.get(user=user, code=code)
-                    group_key = user_culture.shared_group_key
-                    qs = qs.filter(
-                        visibility=Visibility.PUBLIC,
-                        cultures__shared_group_key=group_key
-                    ).exclude(user=user)
-                except Culture.DoesNotExist:
-                    return qs.none()
-            else:
-                qs = qs.filter(visibility=Visibility.PUBLIC).exclude(user=user)
+            qs = shared_queryset(qs, user, code)
         else:
             qs = qs.filter(user=user)
             if code:
-                qs = qs.filter(cultures__code__iexact=code)
+                qs = filter_by_culture(qs, user, code)
                 
         if q:
             qs = qs.filter(
@@ -1438,12 +1255,15 @@ class UserHistoryEventViewSet(viewsets.ModelViewSet):
                 universal_item__event__period__category__key="history"
             )
 
-        return qs.distinct()
+        return qs
+
+    def _bulk_touched(self, pks):
+        invalidate_points(row_points(UserHistoryEvent, pks))
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
         
-class UserMusicComposerViewSet(viewsets.ModelViewSet):
+class UserMusicComposerViewSet(BulkTrackingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = UserMusicComposerSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrPublic]
 
@@ -1465,22 +1285,11 @@ class UserMusicComposerViewSet(viewsets.ModelViewSet):
         )
 
         if shared:
-            if code:
-                try:
-                    user_culture = Culture.objects.get(user=user, code=code)
-                    group_key = user_culture.shared_group_key
-                    qs = qs.filter(
-                        visibility=Visibility.PUBLIC,
-                        cultures__shared_group_key=group_key
-                    ).exclude(user=user)
-                except Culture.DoesNotExist:
-                    return qs.none()
-            else:
-                qs = qs.filter(visibility=Visibility.PUBLIC).exclude(user=user)
+            qs = shared_queryset(qs, user, code)
         else:
             qs = qs.filter(user=user)
             if code:
-                qs = qs.filter(cultures__code__iexact=code)
+                qs = filter_by_culture(qs, user, code)
                 
         if q:
             qs = qs.filter(
@@ -1496,12 +1305,12 @@ class UserMusicComposerViewSet(viewsets.ModelViewSet):
                 category__key="music"
             )
 
-        return qs.distinct()
+        return qs
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
         
-class UserComposerSearchViewSet(viewsets.ModelViewSet):
+class UserComposerSearchViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = UserComposerSearchSerializer
     permission_classes = [IsAuthenticated]
     
@@ -1512,7 +1321,7 @@ class UserComposerSearchViewSet(viewsets.ModelViewSet):
         qs = UserComposerSearch.objects.filter(user=user)
         
         if code:
-            qs = qs.filter(culture__code=code)
+            qs = filter_by_culture(qs, user, code, "culture")
             
         return qs
             
@@ -1561,7 +1370,7 @@ class ComposerSearchView(APIView):
             "saved_location": user_search.saved_location,   # kept for future use
         })
         
-class ListViewSet(viewsets.ModelViewSet):
+class ListViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = ListSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrPublic]
 
@@ -1574,39 +1383,268 @@ class ListViewSet(viewsets.ModelViewSet):
         qs = (
             List.objects
             .select_related("user")
-            .prefetch_related("cultures", "items")
             .order_by("-updated_at")
         )
+        # The items page, membership lookups and summaries read list entries themselves
+        if self.action not in ("items", "membership") and not self.is_summary():
+            qs = qs.prefetch_related("cultures", list_entries_prefetch())
 
         if not user.is_authenticated:
             return qs.filter(visibility=Visibility.PUBLIC)
 
         if shared:
-            if code:
-                try:
-                    user_culture = Culture.objects.get(user=user, code=code)
-                    group_key = user_culture.shared_group_key
-                    qs = qs.filter(
-                        visibility=Visibility.PUBLIC,
-                        cultures__shared_group_key=group_key
-                    ).exclude(user=user)
-                except Culture.DoesNotExist:
-                    return qs.none()
-            else:
-                qs = qs.filter(visibility=Visibility.PUBLIC).exclude(user=user)
+            qs = shared_queryset(qs, user, code)
         else:
             qs = qs.filter(user=user)
             if code:
-                qs = qs.filter(cultures__code__iexact=code)
+                qs = filter_by_culture(qs, user, code)
 
         if type_filter:
             qs = qs.filter(type__iexact=type_filter)
 
-        return qs.distinct()
+        return qs
+
+    def is_summary(self):
+        return self.action == "list" and self.request.query_params.get("summary") == "true"
+
+    def list(self, request, *args, **kwargs):
+        """
+        With ?summary=true, lists come without their items: each row has
+        item_count, type_counts and the first few cover URLs, all read in
+        a single query whatever the list sizes.
+
+        Example: GET /api/lists/?summary=true&type=films
+        """
+        if not self.is_summary():
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        etag = self.get_list_etag(request, queryset)
+        if etag and etag_matches(request, etag):
+            return not_modified(etag)
+        return Response(list_summaries(queryset), headers=validator_headers(etag) if etag else None)
+
+    @action(detail=True, methods=["get"], url_path="items")
+    def items(self, request, pk=None):
+        """
+        One page of the list in list order, each entry with its film or book
+        row and the user's tracking overlay.
+
+        Example: GET /api/lists/12/items/?offset=0&limit=50&q=kurosawa
+        """
+        try:
+            offset = int(request.query_params.get("offset", 0))
+            limit = int(request.query_params.get("limit", LIST_PAGE_SIZE))
+        except ValueError:
+            return Response({"error": "'offset' and 'limit' must be integers."}, status=status.HTTP_400_BAD_REQUEST)
+        if offset < 0 or not 1 <= limit <= LIST_MAX_PAGE_SIZE:
+            return Response(
+                {"error": f"'offset' must be non-negative and 'limit' between 1 and {LIST_MAX_PAGE_SIZE}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        q = request.query_params.get("q", "").strip()
+        return Response(list_item_page(self.get_object(), request.user, offset, limit, q=q or None))
+
+    @action(detail=False, methods=["get"], url_path="membership", permission_classes=[IsAuthenticated])
+    def membership(self, request):
+        """
+        Which of the user's lists contain each of the given universal items,
+        as {item id: [list ids]}; items in no list are left out.
+
+        Example: GET /api/lists/membership/?items=3,17,42
+        """
+        try:
+            item_ids = {int(item_id) for item_id in request.query_params.get("items", "").split(",") if item_id}
+        except ValueError:
+            return Response({"error": "'items' must be comma-separated ids."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(item_ids) > MEMBERSHIP_MAX_ITEMS:
+            return Response({"error": f"At most {MEMBERSHIP_MAX_ITEMS} items per request."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(list_memberships(request.user, item_ids))
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
         
+class CultureDashboardView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Return a culture's categories, periods, page content, lists and
+        frontpage shelves for one category key in a single response.
+
+        Example: GET /api/culture-dashboard/?code=jp&key=film
+        """
+        code = request.query_params.get("code")
+        key = request.query_params.get("key")
+        if not code or not key:
+            return Response(
+                {"error": "Both 'code' and 'key' are required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        culture = resolve_culture(request.user, code)
+        if not culture:
+            return Response({"error": "Invalid culture code"}, status=status.HTTP_404_NOT_FOUND)
+
+        etag = dashboard_etag(request.user, culture.id, key)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        return Response(build_culture_dashboard(request, culture.id, key), headers=validator_headers(etag))
+        
+class TimelineView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Everything of one culture whose year span overlaps [start, end]:
+        periods, films, books, history events, composers and map pins,
+        ordered by start year. `kinds` narrows the result.
+
+        Example: GET /api/timeline/?code=jp&start=1600&end=1700&kinds=film,event
+        """
+        code = request.query_params.get("code")
+        try:
+            start = int(request.query_params["start"])
+            end = int(request.query_params["end"])
+        except (KeyError, ValueError):
+            return Response(
+                {"error": "'start' and 'end' must be integer years."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if start > end:
+            return Response({"error": "'start' must not be after 'end'."}, status=status.HTTP_400_BAD_REQUEST)
+
+        kinds = [k for k in request.query_params.get("kinds", "").split(",") if k] or list(TIMELINE_KINDS)
+        unknown = [k for k in kinds if k not in TIMELINE_KINDS]
+        if unknown:
+            return Response({"error": f"Unknown kinds: {', '.join(unknown)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        culture = resolve_culture(request.user, code)
+        if not culture:
+            return Response({"error": "Invalid culture code"}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(timeline_entries(request.user, culture.id, start, end, kinds), status=status.HTTP_200_OK)
+
+class UpcomingView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Holidays and history events of one culture falling in the `days` days
+        from `date` (default today), whatever year they were recorded in;
+        days=0 gives "on this day". Ordered by date, with `years_ago` for
+        anniversaries.
+
+        Example: GET /api/upcoming/?code=jp&days=14
+        """
+        code = request.query_params.get("code")
+        try:
+            days = int(request.query_params.get("days", 14))
+            start = request.query_params.get("date")
+            start = datetime.strptime(start, "%Y-%m-%d").date() if start else timezone.localdate()
+        except ValueError:
+            return Response(
+                {"error": "'days' must be an integer and 'date' a YYYY-MM-DD date."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not 0 <= days <= UPCOMING_MAX_DAYS:
+            return Response({"error": f"'days' must be between 0 and {UPCOMING_MAX_DAYS}."}, status=status.HTTP_400_BAD_REQUEST)
+
+        culture = resolve_culture(request.user, code)
+        if not culture:
+            return Response({"error": "Invalid culture code"}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(upcoming_entries(request.user, culture.id, start, days), status=status.HTTP_200_OK)
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def map_tile_view(request, z, x, y):
+    """
+    GeoJSON tile of map pins and located history events (own, or with
+    shared=true other users' public ones). Tiles carry an ETag built from a
+    per-tile version that only changes when a point inside the tile is
+    edited, so panning back over a tile is a 304 or a server cache hit.
+
+    Example: GET /api/map-tiles/6/56/25/?code=jp
+    """
+    if z > MAX_TILE_ZOOM or x >= 2 ** z or y >= 2 ** z:
+        return Response({"error": "No such tile."}, status=status.HTTP_404_NOT_FOUND)
+
+    code = request.query_params.get("code")
+    shared = request.query_params.get("shared") == "true"
+    etag = make_etag(request.user.pk, request.get_full_path(), tile_version(z, x, y))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    data = cached_tile(
+        "tiles:body:" + etag.strip('W/"'),
+        lambda: build_tile(request.user, z, x, y, code=code, shared=shared),
+    )
+    return Response(data, headers=validator_headers(etag))
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def catalog_cache_stats_view(request):
+    """
+    Hit/miss counters of the Film/Book/Person/UniversalItem response cache,
+    as seen by the worker answering the request.
+
+    Example: GET /api/cache-stats/
+    """
+    return Response(catalog_cache_stats(), status=status.HTTP_200_OK)
+
+@api_view(["GET", "DELETE"])
+@permission_classes([IsAdminUser])
+def profiling_summary_view(request):
+    """
+    Rolling per-route request profiles of this worker (query counts, SQL and
+    serializer time, response sizes, repeated queries) when REQUEST_PROFILING
+    is on. DELETE starts the windows over.
+
+    Example: GET /api/profiling/?route=GET%20list-list
+    """
+    if request.method == "DELETE":
+        reset_profiling()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    return Response(profiling_summary(request.query_params.get("route")), status=status.HTTP_200_OK)
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def export_library_view(request):
+    """
+    Stream the user's films, books, music pieces, recipes, calendar dates and
+    map pins as NDJSON ({"type": ..., "data": row} per line), or one of those
+    types as CSV. Output is gzipped when the client accepts it.
+
+    Example: GET /api/export/?output=csv&types=user_films
+    """
+    output = request.query_params.get("output", "ndjson")
+    types = [t for t in request.query_params.get("types", "").split(",") if t] or list(EXPORT_TYPES)
+
+    unknown = [t for t in types if t not in EXPORT_TYPES]
+    if unknown:
+        return Response({"error": f"Unknown export types: {', '.join(unknown)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+    if output == "ndjson":
+        chunks = iter_ndjson(request.user, types)
+        content_type = "application/x-ndjson"
+    elif output == "csv":
+        if len(types) != 1:
+            return Response({"error": "CSV exports take exactly one type."}, status=status.HTTP_400_BAD_REQUEST)
+        chunks = iter_csv(request.user, types[0])
+        content_type = "text/csv"
+    else:
+        return Response({"error": "output must be 'ndjson' or 'csv'."}, status=status.HTTP_400_BAD_REQUEST)
+
+    gzipped = "gzip" in request.headers.get("Accept-Encoding", "")
+    response = StreamingHttpResponse(gzip_stream(chunks) if gzipped else chunks, content_type=content_type)
+    if gzipped:
+        response["Content-Encoding"] = "gzip"
+    response["Vary"] = "Accept-Encoding"
+    response["Content-Disposition"] = f'attachment; filename="library.{output}"'
+    return response
+
 # FILM IMPORT VIEW
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
@@ -57,6 +57,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 SIMPLE_JWT = {
@@ -68,6 +72,7 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.profiling.QueryProfilingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -114,6 +119,64 @@ DATABASES = {
     )
 }
 
+# DATABASE_URL points at the Neon pooler (PgBouncer in transaction mode), which
+# can't keep a server-side cursor open across statements. queryset.iterator()
+# then fetches from a client-side cursor, still building rows chunk by chunk.
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 'default' is shared by every worker: catalog version tokens must be, or
+# workers that did not handle a write keep serving invalidated responses.
+# It uses the database (table created by migration 0071) unless CACHE_URL
+# names a Redis server (needs the redis package), which keeps catalog cache
+# hits off the database entirely. CACHE_DIR shares files instead.
+# Catalog response bodies are kept per worker in 'local'.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'voxmundi_cache',
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    },
+    # Per-process; for catalog response bodies and counters written on every request
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'voxmundi',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
+if os.getenv("CACHE_URL"):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv("CACHE_URL"),
+    }
+elif os.getenv("CACHE_DIR"):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv("CACHE_DIR"),
+    }
+
+# Seconds a cached Film/Book/Person/UniversalItem response is kept
+CATALOG_CACHE_TIMEOUT = 600
+
+# Seconds a rendered map tile is kept (tiles are also invalidated on edit)
+MAP_TILE_CACHE_TIMEOUT = 3600
+
+# Request profiling (core.profiling): off unless REQUEST_PROFILING=true
+REQUEST_PROFILING = os.getenv("REQUEST_PROFILING") == "true"
+# Requests kept per route for the rolling /api/profiling/ summaries
+REQUEST_PROFILING_WINDOW = 500
+# Per-request limits checked by the profiler. "*" applies to every route;
+# entries keyed by view name ("list-list") or "METHOD view name" override it.
+# Metrics: queries, duplicate_queries, sql_ms, serializer_ms, duration_ms, response_bytes
+REQUEST_PROFILING_BUDGETS = {
+    "*": {"queries": 50, "duplicate_queries": 20},
+}
+# "log" a warning when a budget is exceeded, or "raise" (meant for test settings)
+REQUEST_PROFILING_BUDGET_ACTION = os.getenv("REQUEST_PROFILING_BUDGET_ACTION", "log")
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
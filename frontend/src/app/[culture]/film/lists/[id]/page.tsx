@@ -7,7 +7,7 @@ import Link from "next/link";
 import api from "@/lib/api";
 import { SVGPath } from "@/utils/path";
 import { Film } from "@/types/media/film";
-import { List } from "@/types/list";
+import { List, ListItemPage } from "@/types/list";
 
 import FilmCard from "@/components/film/FilmCard";
 import SearchBar from "@/components/SearchBar";
@@ -28,6 +28,9 @@ export default function FilmListPage() {
   const [initialListData, setInitialListData] = useState<List | undefined>(
     undefined
   );
+  const [offset, setOffset] = useState(0);
+  const [hasMore, setHasMore] = useState(false);
+  const limit = 50;
 
   const fetchList = useCallback(async () => {
     if (!id) {
@@ -51,30 +54,45 @@ export default function FilmListPage() {
     }
   }, [id]);
 
-  const fetchFilms = useCallback(async () => {
-    if (!list || !list.items || list.items.length === 0) {
-      setFilms([]);
-      setLoading(false);
-      return;
-    }
-    const universalItemIds = list.items.map((item) => item.id).join(",");
-    try {
-      setLoading(true);
-      setError(null);
-      const res = await api.get(
-        `/films/list_films/?ids=${encodeURIComponent(universalItemIds)}${
-          searchQuery ? `&q=${encodeURIComponent(searchQuery)}` : ""
-        }`
-      );
-      const { results } = res.data;
-      setFilms(results);
-    } catch {
-      setError("Failed to load films. Please try again.");
-      setFilms([]);
-    } finally {
-      setLoading(false);
-    }
-  }, [list, searchQuery]);
+  const fetchFilms = useCallback(
+    async (reset = false) => {
+      if (!list || !list.items || list.items.length === 0) {
+        setFilms([]);
+        setHasMore(false);
+        setLoading(false);
+        return;
+      }
+
+      const currentOffset = reset ? 0 : offset;
+
+      try {
+        setLoading(true);
+        setError(null);
+        const res = await api.get<ListItemPage>(
+          `/lists/${list.id}/items/?offset=${currentOffset}&limit=${limit}${
+            searchQuery ? `&q=${encodeURIComponent(searchQuery)}` : ""
+          }`
+        );
+        const { results, total } = res.data;
+        const pageFilms = results
+          .filter((entry) => entry.film)
+          .map(
+            (entry) =>
+              ({ ...entry.film, userfilm: entry.userfilm ?? undefined } as Film)
+          );
+
+        setFilms((prev) => (reset ? pageFilms : [...prev, ...pageFilms]));
+        setOffset(currentOffset + results.length);
+        setHasMore(currentOffset + results.length < total);
+      } catch {
+        setError("Failed to load films. Please try again.");
+        setFilms([]);
+      } finally {
+        setLoading(false);
+      }
+    },
+    [list, searchQuery, offset]
+  );
 
   useEffect(() => {
     fetchList();
@@ -83,22 +101,17 @@ export default function FilmListPage() {
   useEffect(() => {
     if (list) {
       setFilms([]);
+      setOffset(0);
       setError(null);
       setLoading(true);
-      fetchFilms();
+      fetchFilms(true);
     }
-  }, [list, fetchFilms]);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [list, searchQuery]);
 
-  const handleSearch = useCallback(
-    async (searchQuery: string) => {
-      setSearchQuery(searchQuery);
-      setFilms([]);
-      setError(null);
-      setLoading(true);
-      fetchFilms();
-    },
-    [fetchFilms]
-  );
+  const handleSearch = useCallback(async (searchQuery: string) => {
+    setSearchQuery(searchQuery);
+  }, []);
 
   const sortedFilms = useMemo(() => {
     return [...films].sort((a, b) => {
@@ -232,18 +245,36 @@ export default function FilmListPage() {
         </p>
       )}
       {sortedFilms.length > 0 && (
-        <ul className="grid gap-2 sm:gap-6 grid-cols-2 md:grid-cols-4 lg:grid-cols-5">
-          {sortedFilms.map((film) => (
-            <div
-              key={film.id}
-              className={`${
-                film.userfilm?.seen ? "opacity-50 hover:opacity-100" : ""
-              }`}
-            >
-              <FilmCard film={film} />
+        <>
+          <ul className="grid gap-2 sm:gap-6 grid-cols-2 md:grid-cols-4 lg:grid-cols-5">
+            {sortedFilms.map((film) => (
+              <div
+                key={film.id}
+                className={`${
+                  film.userfilm?.seen ? "opacity-50 hover:opacity-100" : ""
+                }`}
+              >
+                <FilmCard film={film} />
+              </div>
+            ))}
+          </ul>
+          {hasMore && !loading && (
+            <div className="mt-4 sm:mt-6 text-sm sm:text-base text-center">
+              <button
+                onClick={() => fetchFilms(false)}
+                disabled={loading || !hasMore}
+                className="font-sans bg-primary text-white px-4 py-2 rounded hover:bg-neutral-mid hover:text-background cursor-pointer"
+              >
+                {loading ? "Loading..." : "Show More"}
+              </button>
+            </div>
+          )}
+          {loading && films.length > 0 && (
+            <div className="text-center mt-4 text-gray-400 font-sans">
+              Loading more...
             </div>
-          ))}
-        </ul>
+          )}
+        </>
       )}
 
       {showListModal && (
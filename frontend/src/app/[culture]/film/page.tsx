@@ -40,15 +40,13 @@ export default function FilmPage() {
       setLoading(true);
       setError(null);
 
-      const [filmRes, periodRes, pageContentRes] = await Promise.all([
-        api.get(`/films/frontpage?code=${culture}`),
-        api.get(`/periods/?code=${culture}&key=film`),
-        api.get(`/page-contents/?code=${culture}&key=film`),
-      ]);
+      const res = await api.get(
+        `/culture-dashboard/?code=${culture}&key=film`
+      );
 
-      setFilms(filmRes.data);
-      setPeriods(periodRes.data);
-      setPageContent(pageContentRes.data[0] || null);
+      setFilms(res.data.frontpage);
+      setPeriods(res.data.periods);
+      setPageContent(res.data.page_content);
     } catch (error) {
       console.error("Error fetching data", error);
       setError("Failed to load film data. Please try again later.");
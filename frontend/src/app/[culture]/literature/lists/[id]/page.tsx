@@ -7,7 +7,7 @@ import Link from "next/link";
 import api from "@/lib/api";
 import { SVGPath } from "@/utils/path";
 import { Book } from "@/types/media/book";
-import { List } from "@/types/list";
+import { List, ListItemPage } from "@/types/list";
 
 import BookCard from "@/components/literature/BookCard";
 import SearchBar from "@/components/SearchBar";
@@ -28,6 +28,9 @@ export default function BookListPage() {
   const [initialListData, setInitialListData] = useState<List | undefined>(
     undefined
   );
+  const [offset, setOffset] = useState(0);
+  const [hasMore, setHasMore] = useState(false);
+  const limit = 50;
 
   const fetchList = useCallback(async () => {
     if (!id) {
@@ -52,30 +55,45 @@ export default function BookListPage() {
     }
   }, [id]);
 
-  const fetchBooks = useCallback(async () => {
-    if (!list || !list.items || list.items.length === 0) {
-      setBooks([]);
-      setLoading(false);
-      return;
-    }
-    const universalItemIds = list.items.map((item) => item.id).join(",");
-    try {
-      setLoading(true);
-      setError(null);
-      const res = await api.get(
-        `/books/list_books/?ids=${encodeURIComponent(universalItemIds)}${
-          searchQuery ? `&q=${encodeURIComponent(searchQuery)}` : ""
-        }`
-      );
-      const { results } = res.data;
-      setBooks(results);
-    } catch {
-      setError("Failed to load books. Please try again.");
-      setBooks([]);
-    } finally {
-      setLoading(false);
-    }
-  }, [list, searchQuery]);
+  const fetchBooks = useCallback(
+    async (reset = false) => {
+      if (!list || !list.items || list.items.length === 0) {
+        setBooks([]);
+        setHasMore(false);
+        setLoading(false);
+        return;
+      }
+
+      const currentOffset = reset ? 0 : offset;
+
+      try {
+        setLoading(true);
+        setError(null);
+        const res = await api.get<ListItemPage>(
+          `/lists/${list.id}/items/?offset=${currentOffset}&limit=${limit}${
+            searchQuery ? `&q=${encodeURIComponent(searchQuery)}` : ""
+          }`
+        );
+        const { results, total } = res.data;
+        const pageBooks = results
+          .filter((entry) => entry.book)
+          .map(
+            (entry) =>
+              ({ ...entry.book, userbook: entry.userbook ?? undefined } as Book)
+          );
+
+        setBooks((prev) => (reset ? pageBooks : [...prev, ...pageBooks]));
+        setOffset(currentOffset + results.length);
+        setHasMore(currentOffset + results.length < total);
+      } catch {
+        setError("Failed to load books. Please try again.");
+        setBooks([]);
+      } finally {
+        setLoading(false);
+      }
+    },
+    [list, searchQuery, offset]
+  );
 
   useEffect(() => {
     fetchList();
@@ -84,22 +102,17 @@ export default function BookListPage() {
   useEffect(() => {
     if (list) {
       setBooks([]);
+      setOffset(0);
       setError(null);
       setLoading(true);
-      fetchBooks();
+      fetchBooks(true);
     }
-  }, [list, fetchBooks]);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [list, searchQuery]);
 
-  const handleSearch = useCallback(
-    async (searchQuery: string) => {
-      setSearchQuery(searchQuery);
-      setBooks([]);
-      setError(null);
-      setLoading(true);
-      fetchBooks();
-    },
-    [fetchBooks]
-  );
+  const handleSearch = useCallback(async (searchQuery: string) => {
+    setSearchQuery(searchQuery);
+  }, []);
 
   const sortedBooks = useMemo(() => {
     return [...books].sort((a, b) => {
@@ -228,18 +241,36 @@ export default function BookListPage() {
         </p>
       )}
       {sortedBooks.length > 0 && (
-        <ul className="grid gap-2 sm:gap-6 grid-cols-2 md:grid-cols-4 lg:grid-cols-5">
-          {sortedBooks.map((book) => (
-            <div
-              key={book.id}
-              className={`${
-                book.userbook?.read ? "opacity-50 hover:opacity-100" : ""
-              }`}
-            >
-              <BookCard book={book} />
+        <>
+          <ul className="grid gap-2 sm:gap-6 grid-cols-2 md:grid-cols-4 lg:grid-cols-5">
+            {sortedBooks.map((book) => (
+              <div
+                key={book.id}
+                className={`${
+                  book.userbook?.read ? "opacity-50 hover:opacity-100" : ""
+                }`}
+              >
+                <BookCard book={book} />
+              </div>
+            ))}
+          </ul>
+          {hasMore && !loading && (
+            <div className="mt-4 sm:mt-6 text-sm sm:text-base text-center">
+              <button
+                onClick={() => fetchBooks(false)}
+                disabled={loading || !hasMore}
+                className="font-sans bg-primary text-white px-4 py-2 rounded hover:bg-neutral-mid hover:text-background cursor-pointer"
+              >
+                {loading ? "Loading..." : "Show More"}
+              </button>
+            </div>
+          )}
+          {loading && books.length > 0 && (
+            <div className="text-center mt-4 text-gray-400 font-sans">
+              Loading more...
             </div>
-          ))}
-        </ul>
+          )}
+        </>
       )}
 
       {showListModal && (
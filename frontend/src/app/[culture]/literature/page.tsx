@@ -40,15 +40,13 @@ export default function BookPage() {
       setLoading(true);
       setError(null);
 
-      const [bookRes, periodRes, pageContentRes] = await Promise.all([
-        api.get(`/books/frontpage?code=${culture}`),
-        api.get(`/periods/?code=${culture}&key=literature`),
-        api.get(`/page-contents/?code=${culture}&key=literature`),
-      ]);
+      const res = await api.get(
+        `/culture-dashboard/?code=${culture}&key=literature`
+      );
 
-      setBooks(bookRes.data);
-      setPeriods(periodRes.data);
-      setPageContent(pageContentRes.data[0] || null);
+      setBooks(res.data.frontpage);
+      setPeriods(res.data.periods);
+      setPageContent(res.data.page_content);
     } catch (error) {
       console.error("Error fetching data", error);
       setError("Failed to load book data. Please try again later.");
@@ -6,7 +6,7 @@ import { ParamValue } from "next/dist/server/request/params";
 
 import api from "@/lib/api";
 import { SVGPath } from "@/utils/path";
-import { List } from "@/types/list";
+import { List, ListSummary } from "@/types/list";
 
 /**
  * Modal displaying a user's existing film lists for a given culture.
@@ -41,7 +41,7 @@ export default function FilmListDisplayModal({
   onEditList,
   currentCultureCode,
 }: Props) {
-  const [lists, setLists] = useState<List[]>([]);
+  const [lists, setLists] = useState<ListSummary[]>([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
@@ -53,7 +53,7 @@ export default function FilmListDisplayModal({
         setLoading(true);
         setError(null);
         const res = await api.get(
-          `/lists/?type=films&code=${encodeURIComponent(
+          `/lists/?summary=true&type=films&code=${encodeURIComponent(
             String(currentCultureCode)
           )}`
         );
@@ -69,6 +69,16 @@ export default function FilmListDisplayModal({
     fetchLists();
   }, [isOpen, currentCultureCode]);
 
+  const editList = async (summary: ListSummary) => {
+    try {
+      const res = await api.get(`/lists/${summary.id}/`);
+      onEditList(res.data);
+    } catch (err) {
+      console.error("Error fetching list:", err);
+      setError("Failed to load list. Please try again.");
+    }
+  };
+
   if (!isOpen) return null;
 
   return (
@@ -128,13 +138,13 @@ export default function FilmListDisplayModal({
                         {list.name}
                       </h3>
                       <p className="text-xs text-foreground/50 mt-1">
-                        {list.items.length} film
-                        {list.items.length !== 1 ? "s" : ""}
+                        {list.item_count} film
+                        {list.item_count !== 1 ? "s" : ""}
                       </p>
                     </div>
                     <div className="flex space-x-2 ml-2">
                       <button
-                        onClick={() => onEditList(list)}
+                        onClick={() => editList(list)}
                         className="p-1 rounded transition"
                         title="Edit list"
                       >
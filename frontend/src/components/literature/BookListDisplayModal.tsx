@@ -6,7 +6,7 @@ import { ParamValue } from "next/dist/server/request/params";
 
 import api from "@/lib/api";
 import { SVGPath } from "@/utils/path";
-import { List } from "@/types/list";
+import { List, ListSummary } from "@/types/list";
 
 type Props = {
   isOpen: boolean;
@@ -21,7 +21,7 @@ export default function BookListDisplayModal({
   onEditList,
   currentCultureCode,
 }: Props) {
-  const [lists, setLists] = useState<List[]>([]);
+  const [lists, setLists] = useState<ListSummary[]>([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
@@ -33,7 +33,7 @@ export default function BookListDisplayModal({
         setLoading(true);
         setError(null);
         const res = await api.get(
-          `/lists/?type=books&code=${encodeURIComponent(
+          `/lists/?summary=true&type=books&code=${encodeURIComponent(
             String(currentCultureCode)
           )}`
         );
@@ -49,6 +49,16 @@ export default function BookListDisplayModal({
     fetchLists();
   }, [isOpen, currentCultureCode]);
 
+  const editList = async (summary: ListSummary) => {
+    try {
+      const res = await api.get(`/lists/${summary.id}/`);
+      onEditList(res.data);
+    } catch (err) {
+      console.error("Error fetching list:", err);
+      setError("Failed to load list. Please try again.");
+    }
+  };
+
   if (!isOpen) return null;
 
   return (
@@ -110,13 +120,13 @@ export default function BookListDisplayModal({
                         {list.name}
                       </h3>
                       <p className="text-xs text-foreground/50 mt-1">
-                        {list.items.length} book
-                        {list.items.length !== 1 ? "s" : ""}
+                        {list.item_count} book
+                        {list.item_count !== 1 ? "s" : ""}
                       </p>
                     </div>
                     <div className="flex space-x-2 ml-2">
                       <button
-                        onClick={() => onEditList(list)}
+                        onClick={() => editList(list)}
                         className="p-1 rounded transition"
                         title="Edit list"
                       >
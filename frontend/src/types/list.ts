@@ -1,6 +1,8 @@
 import { User } from "./user";
 import { Culture } from "./culture";
 import { UniversalItem } from "./universal";
+import { Film, UserFilm } from "./media/film";
+import { Book, UserBook } from "./media/book";
 
 export interface List {
     id?: number;
@@ -11,4 +13,36 @@ export interface List {
     items: UniversalItem[];
     visibility: 'public' | 'private';
     type: 'books' | 'films' | 'music' | 'artworks' | 'events' | 'mixed';
-}
\ No newline at end of file
+}
+
+export interface ListSummary {
+    id: number;
+    name: string;
+    description?: string;
+    visibility: 'public' | 'private';
+    type: List['type'];
+    created_at: string;
+    updated_at: string;
+    item_count: number;
+    type_counts: Record<string, number>;
+    covers: string[];
+}
+
+export interface ListEntry {
+    id: number;
+    title: string;
+    type: string;
+    position: number;
+    added_at: string;
+    film?: Film;
+    userfilm?: UserFilm | null;
+    book?: Book;
+    userbook?: UserBook | null;
+}
+
+export interface ListItemPage {
+    results: ListEntry[];
+    total: number;
+    offset: number;
+    limit: number;
+}